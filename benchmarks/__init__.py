@@ -0,0 +1,5 @@
+"""Local micro-benchmarks for the response_codes package.
+
+Run the whole suite with ``python -m benchmarks.run``; see that module for
+the available options.
+"""
@@ -0,0 +1,136 @@
+"""Shared timing helpers for the benchmark suite.
+
+Each benchmark is a ``timeit``-style statement with its setup code, plus an
+optional equivalent statement using the standard library's ``http.HTTPStatus``
+as a baseline.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import timeit
+from dataclasses import dataclass
+from typing import Optional
+
+# Timings are repeated this many times and the fastest run is kept, which is
+# the least noisy estimate of the true per-operation cost.
+DEFAULT_REPEAT = 5
+
+# Each timed run lasts at least this long (in seconds).
+MIN_RUN_TIME = 0.2
+
+# Isolated benchmarks start a fresh interpreter per run, so they use more runs
+# to get a stable minimum.
+ISOLATED_RUNS_PER_REPEAT = 4
+
+# Script template for isolated benchmarks; it prints the elapsed ns.
+_ISOLATED_TEMPLATE = """
+import time
+{setup}
+_start = time.perf_counter_ns()
+{stmt}
+print(time.perf_counter_ns() - _start)
+"""
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A single statement to time, with an optional stdlib baseline.
+
+    Attributes:
+        name: Unique dotted name, e.g. ``"core.eq_int"``.
+        stmt: The statement to time.
+        setup: Code run once before timing `stmt` and `baseline`.
+        baseline: Equivalent statement using ``http.HTTPStatus``, if any.
+        isolated: Time a single execution in a fresh interpreter instead of
+            looping in-process. Used for import-time benchmarks.
+    """
+
+    name: str
+    stmt: str
+    setup: str = ""
+    baseline: Optional[str] = None
+    isolated: bool = False
+
+
+def time_statement(
+    stmt: str,
+    setup: str = "",
+    repeat: int = DEFAULT_REPEAT,
+    min_run_time: float = MIN_RUN_TIME,
+) -> float:
+    """Return the fastest observed time per execution of `stmt`, in ns.
+
+    Args:
+        stmt: The statement to time.
+        setup: Code run once before each timed run.
+        repeat: Number of timed runs.
+        min_run_time: Minimum duration of each timed run, in seconds.
+
+    Returns:
+        Nanoseconds per execution of `stmt`.
+    """
+    timer = timeit.Timer(stmt, setup)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_run_time:
+            break
+        number *= 10 if elapsed < min_run_time / 10 else 2
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+def time_isolated(
+    stmt: str, setup: str = "", repeat: int = DEFAULT_REPEAT
+) -> float:
+    """Return the fastest time for one run of `stmt` in a new process, in ns.
+
+    Args:
+        stmt: The statement to time.
+        setup: Code run in the new interpreter before timing starts.
+        repeat: Scales the number of interpreters started.
+
+    Returns:
+        Nanoseconds for a single execution of `stmt`.
+    """
+    script = _ISOLATED_TEMPLATE.format(
+        setup=textwrap.dedent(setup), stmt=textwrap.dedent(stmt)
+    )
+    timings = []
+    for _ in range(repeat * ISOLATED_RUNS_PER_REPEAT):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        timings.append(int(result.stdout.strip().splitlines()[-1]))
+    return float(min(timings))
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    repeat: int = DEFAULT_REPEAT,
+    min_run_time: float = MIN_RUN_TIME,
+) -> dict[str, Optional[float]]:
+    """Time a benchmark and its baseline.
+
+    Returns:
+        A mapping with ``ns_per_op`` and ``baseline_ns_per_op`` (None when
+        the benchmark has no baseline).
+    """
+
+    def measure(stmt: str) -> float:
+        if benchmark.isolated:
+            return time_isolated(stmt, benchmark.setup, repeat)
+        return time_statement(stmt, benchmark.setup, repeat, min_run_time)
+
+    return {
+        "ns_per_op": measure(benchmark.stmt),
+        "baseline_ns_per_op": (
+            None if benchmark.baseline is None else measure(benchmark.baseline)
+        ),
+    }
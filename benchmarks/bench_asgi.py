@@ -0,0 +1,78 @@
+"""Benchmarks for the ASGI status middleware.
+
+Each request is driven through the middleware in-process, without an event
+loop, by sending into the coroutine until it finishes. The baseline is a
+naive middleware that builds the headers and JSON body on every error.
+"""
+
+from __future__ import annotations
+
+from ._harness import Benchmark
+
+SETUP = """
+import json
+from response_codes import ASGIStatusMiddleware, HTTPStatus, HTTP_404_NOT_FOUND
+
+START = {"type": "http.response.start", "status": 200, "headers": []}
+BODY = {"type": "http.response.body", "body": b"ok"}
+
+async def raising_app(scope, receive, send):
+    raise HTTP_404_NOT_FOUND
+
+async def ok_app(scope, receive, send):
+    await send(START)
+    await send(BODY)
+
+async def receive():
+    return {"type": "http.request"}
+
+async def send(message):
+    pass
+
+def naive(app):
+    async def middleware(scope, receive, send):
+        try:
+            await app(scope, receive, send)
+        except HTTPStatus as exc:
+            body = json.dumps(
+                {"error_code": exc.status_code, "message": exc.message}
+            ).encode()
+            await send({
+                "type": "http.response.start",
+                "status": exc.status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+    return middleware
+
+def run(app):
+    try:
+        app(SCOPE, receive, send).send(None)
+    except StopIteration:
+        pass
+
+SCOPE = {"type": "http"}
+error_app = ASGIStatusMiddleware(raising_app)
+naive_error_app = naive(raising_app)
+success_app = ASGIStatusMiddleware(ok_app)
+naive_success_app = naive(ok_app)
+run(error_app)
+"""
+
+BENCHMARKS = [
+    Benchmark(
+        "asgi.error_response",
+        "run(error_app)",
+        SETUP,
+        baseline="run(naive_error_app)",
+    ),
+    Benchmark(
+        "asgi.success_passthrough",
+        "run(success_app)",
+        SETUP,
+        baseline="run(naive_success_app)",
+    ),
+]
@@ -0,0 +1,57 @@
+"""Benchmarks for the is_* category predicates on each input kind."""
+
+from __future__ import annotations
+
+from ._harness import Benchmark
+
+SETUP = """
+from http import HTTPStatus
+from response_codes import (
+    HTTP_404_NOT_FOUND,
+    category_of,
+    is_client_error,
+    is_success,
+)
+instance = HTTP_404_NOT_FOUND()
+"""
+
+# `HTTPStatus.is_client_error` and friends were added in Python 3.12; on older
+# versions the baseline is the equivalent range check.
+BASELINE_SETUP = """
+import sys
+if sys.version_info >= (3, 12):
+    def std_is_client_error(code):
+        return HTTPStatus(code).is_client_error
+else:
+    def std_is_client_error(code):
+        return 400 <= HTTPStatus(code) <= 499
+"""
+
+BENCHMARKS = [
+    Benchmark(
+        "categories.is_client_error_int",
+        "is_client_error(404)",
+        SETUP + BASELINE_SETUP,
+        baseline="std_is_client_error(404)",
+    ),
+    Benchmark(
+        "categories.is_client_error_class",
+        "is_client_error(HTTP_404_NOT_FOUND)",
+        SETUP,
+    ),
+    Benchmark(
+        "categories.is_client_error_instance",
+        "is_client_error(instance)",
+        SETUP,
+    ),
+    Benchmark(
+        "categories.is_success_miss",
+        "is_success(404)",
+        SETUP,
+    ),
+    Benchmark(
+        "categories.category_of_int",
+        "category_of(404)",
+        SETUP,
+    ),
+]
@@ -0,0 +1,67 @@
+"""Benchmarks for class-level comparisons, hashing and registry lookups."""
+
+from __future__ import annotations
+
+from ._harness import Benchmark
+
+SETUP = """
+from http import HTTPStatus
+from response_codes import HTTP_404_NOT_FOUND, from_message, lookup
+handlers = {HTTP_404_NOT_FOUND: None}
+std_handlers = {HTTPStatus.NOT_FOUND: None}
+"""
+
+BENCHMARKS = [
+    Benchmark(
+        "core.eq_int",
+        "HTTP_404_NOT_FOUND == 404",
+        SETUP,
+        baseline="HTTPStatus.NOT_FOUND == 404",
+    ),
+    Benchmark(
+        "core.eq_str",
+        'HTTP_404_NOT_FOUND == "Not Found"',
+        SETUP,
+        baseline='HTTPStatus.NOT_FOUND.phrase == "Not Found"',
+    ),
+    Benchmark(
+        "core.lt_int",
+        "HTTP_404_NOT_FOUND < 500",
+        SETUP,
+        baseline="HTTPStatus.NOT_FOUND < 500",
+    ),
+    Benchmark(
+        "core.int",
+        "int(HTTP_404_NOT_FOUND)",
+        SETUP,
+        baseline="int(HTTPStatus.NOT_FOUND)",
+    ),
+    Benchmark(
+        "core.hash",
+        "hash(HTTP_404_NOT_FOUND)",
+        SETUP,
+        baseline="hash(HTTPStatus.NOT_FOUND)",
+    ),
+    Benchmark(
+        "core.dict_key",
+        "handlers[HTTP_404_NOT_FOUND]",
+        SETUP,
+        baseline="std_handlers[HTTPStatus.NOT_FOUND]",
+    ),
+    Benchmark(
+        "core.lookup",
+        "lookup(404)",
+        SETUP,
+        baseline="HTTPStatus(404)",
+    ),
+    Benchmark(
+        "core.from_message",
+        'from_message("Not Found")',
+        SETUP,
+    ),
+    Benchmark(
+        "core.from_message_normalised",
+        'from_message("not  found")',
+        SETUP,
+    ),
+]
@@ -0,0 +1,61 @@
+"""Benchmarks for raising and catching status exceptions in each range.
+
+The baseline raises and catches a plain Exception subclass, as the standard
+library's HTTPStatus is not an exception.
+"""
+
+from __future__ import annotations
+
+from ._harness import Benchmark
+
+SETUP = """
+import response_codes
+class PlainError(Exception):
+    pass
+"""
+
+RAISE_TEMPLATE = """
+try:
+    raise response_codes.{name}
+except response_codes.{name}:
+    pass
+"""
+
+CATCH_BASE_TEMPLATE = """
+try:
+    raise response_codes.{name}
+except response_codes.HTTPStatus:
+    pass
+"""
+
+BASELINE = """
+try:
+    raise PlainError
+except PlainError:
+    pass
+"""
+
+STATUSES = (
+    "HTTP_103_EARLY_HINTS",
+    "HTTP_204_NO_CONTENT",
+    "HTTP_304_NOT_MODIFIED",
+    "HTTP_404_NOT_FOUND",
+    "HTTP_503_SERVICE_UNAVAILABLE",
+)
+
+BENCHMARKS = [
+    Benchmark(
+        f"exceptions.raise_catch_{name[5]}xx",
+        RAISE_TEMPLATE.format(name=name),
+        SETUP,
+        baseline=BASELINE,
+    )
+    for name in STATUSES
+] + [
+    Benchmark(
+        "exceptions.raise_catch_base",
+        CATCH_BASE_TEMPLATE.format(name="HTTP_404_NOT_FOUND"),
+        SETUP,
+        baseline=BASELINE,
+    ),
+]
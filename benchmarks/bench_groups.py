@@ -0,0 +1,47 @@
+"""Benchmarks for status group membership and construction."""
+
+from __future__ import annotations
+
+from ._harness import Benchmark
+
+SETUP = """
+from http import HTTPStatus
+from response_codes import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+    HTTP_CLIENT_ERRORS,
+    create_status_group,
+)
+std_client_errors = frozenset(
+    status for status in HTTPStatus if 400 <= status <= 499
+)
+"""
+
+BENCHMARKS = [
+    Benchmark(
+        "groups.contains_int",
+        "404 in HTTP_CLIENT_ERRORS",
+        SETUP,
+        baseline="404 in std_client_errors",
+    ),
+    Benchmark(
+        "groups.contains_class",
+        "HTTP_404_NOT_FOUND in HTTP_CLIENT_ERRORS",
+        SETUP,
+        baseline="HTTPStatus.NOT_FOUND in std_client_errors",
+    ),
+    Benchmark(
+        "groups.contains_miss",
+        "418 in HTTP_CLIENT_ERRORS",
+        SETUP,
+        baseline="200 in std_client_errors",
+    ),
+    Benchmark(
+        "groups.create_status_group",
+        "create_status_group(HTTP_400_BAD_REQUEST, HTTP_401_UNAUTHORIZED,"
+        " HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND)",
+        SETUP,
+    ),
+]
@@ -0,0 +1,26 @@
+"""Import-time benchmarks, each measured in a fresh interpreter."""
+
+from __future__ import annotations
+
+from ._harness import Benchmark
+
+BENCHMARKS = [
+    Benchmark(
+        "import.package",
+        "import response_codes",
+        baseline="import http",
+        isolated=True,
+    ),
+    Benchmark(
+        "import.single_status",
+        "from response_codes import HTTP_404_NOT_FOUND",
+        baseline="from http import HTTPStatus",
+        isolated=True,
+    ),
+    Benchmark(
+        "import.all_statuses",
+        "from response_codes import *",
+        baseline="from http import *",
+        isolated=True,
+    ),
+]
@@ -0,0 +1,79 @@
+"""Compare two benchmark result files written by ``benchmarks.run``.
+
+Usage::
+
+    python -m benchmarks.compare BEFORE.json AFTER.json [--threshold 0.1]
+
+Exits with status 1 if any benchmark got slower by more than the threshold
+(a fraction of the earlier time), so it can gate a CI job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+DEFAULT_THRESHOLD = 0.1
+
+
+def load_results(path: str) -> dict[str, dict[str, Any]]:
+    """Load the per-benchmark results from a results file."""
+    results: dict[str, dict[str, Any]] = json.loads(Path(path).read_text())[
+        "results"
+    ]
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print a comparison table of two result files.
+
+    Returns:
+        1 if any benchmark regressed beyond the threshold, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before", help="results from the earlier commit")
+    parser.add_argument("after", help="results from the later commit")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown fraction treated as a regression (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    before = load_results(args.before)
+    after = load_results(args.after)
+    regressions = []
+
+    print(  # noqa: T201
+        f"{'benchmark':<44} {'before':>10} {'after':>10} {'change':>8}"
+    )
+    for name in sorted(before.keys() | after.keys()):
+        old = before.get(name, {}).get("ns_per_op")
+        new = after.get(name, {}).get("ns_per_op")
+        if old is None or new is None:
+            change = "added" if old is None else "removed"
+            old_text = "-" if old is None else f"{old:,.1f}"
+            new_text = "-" if new is None else f"{new:,.1f}"
+        else:
+            ratio = new / old - 1
+            change = f"{ratio:+.1%}"
+            old_text, new_text = f"{old:,.1f}", f"{new:,.1f}"
+            if ratio > args.threshold:
+                regressions.append(name)
+        print(f"{name:<44} {old_text:>10} {new_text:>10} {change:>8}")  # noqa: T201
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")  # noqa: T201
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
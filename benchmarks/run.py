@@ -0,0 +1,139 @@
+"""Run the benchmark suite and write machine-readable results.
+
+Usage::
+
+    python -m benchmarks.run [--filter TEXT] [--output PATH] [--quick]
+
+Results are printed as a table and written as JSON (by default to
+``benchmark-results.json``), so runs from two commits can be diffed with
+``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from . import (
+    bench_asgi,
+    bench_categories,
+    bench_core,
+    bench_exceptions,
+    bench_groups,
+    bench_import,
+)
+from ._harness import DEFAULT_REPEAT, MIN_RUN_TIME, run_benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ._harness import Benchmark
+
+SUITES = (
+    bench_import,
+    bench_core,
+    bench_categories,
+    bench_groups,
+    bench_exceptions,
+    bench_asgi,
+)
+
+DEFAULT_OUTPUT = "benchmark-results.json"
+
+
+def collect(name_filter: str = "") -> list[Benchmark]:
+    """Return every benchmark whose name contains `name_filter`."""
+    return [
+        benchmark
+        for suite in SUITES
+        for benchmark in suite.BENCHMARKS
+        if name_filter in benchmark.name
+    ]
+
+
+def _git_commit() -> Optional[str]:
+    """Return the current git commit, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def environment() -> dict[str, Optional[str]]:
+    """Describe the interpreter and checkout the results were taken on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _format_ns(value: Optional[float]) -> str:
+    """Format a timing in ns for the results table."""
+    return "-" if value is None else f"{value:,.1f}"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the selected benchmarks and write the results.
+
+    Returns:
+        The process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="only run benchmarks whose name contains this text",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=DEFAULT_OUTPUT,
+        help=f"JSON results file (default: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="use fewer, shorter runs (noisier, for smoke testing)",
+    )
+    args = parser.parse_args(argv)
+
+    repeat, min_run_time = DEFAULT_REPEAT, MIN_RUN_TIME
+    if args.quick:
+        repeat, min_run_time = 1, 0.01
+
+    benchmarks = collect(args.filter)
+    results = {}
+    print(f"{'benchmark':<44} {'ns/op':>12} {'stdlib ns/op':>14}")  # noqa: T201
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, repeat, min_run_time)
+        results[benchmark.name] = result
+        print(  # noqa: T201
+            f"{benchmark.name:<44}"
+            f" {_format_ns(result['ns_per_op']):>12}"
+            f" {_format_ns(result['baseline_ns_per_op']):>14}"
+        )
+
+    output = {"environment": environment(), "results": results}
+    Path(args.output).write_text(json.dumps(output, indent=2) + "\n")
+    print(f"\nResults written to {args.output}")  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
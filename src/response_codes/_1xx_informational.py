@@ -4,11 +4,11 @@ This module contains HTTP status code exceptions for informational responses
 (100-103).
 """
 
-from ._core import HTTPStatus
+from ._core import InformationalStatus
 
 
 # 1xx Informational Responses
-class HTTP_100_CONTINUE(HTTPStatus):
+class HTTP_100_CONTINUE(InformationalStatus):
     """100 Continue response status code.
 
     Indicates that the initial part of a request has been received and has not
@@ -24,7 +24,7 @@ class HTTP_100_CONTINUE(HTTPStatus):
     )
 
 
-class HTTP_101_SWITCHING_PROTOCOLS(HTTPStatus):
+class HTTP_101_SWITCHING_PROTOCOLS(InformationalStatus):
     """101 Switching Protocols response status code.
 
     Indicates the server understands and is willing to comply with the
@@ -37,7 +37,7 @@ class HTTP_101_SWITCHING_PROTOCOLS(HTTPStatus):
     description = "The requester has asked the server to switch protocols."
 
 
-class HTTP_102_PROCESSING(HTTPStatus):
+class HTTP_102_PROCESSING(InformationalStatus):
     """102 Processing response status code.
 
     Indicates that the server has received and is processing the request, but
@@ -52,7 +52,7 @@ class HTTP_102_PROCESSING(HTTPStatus):
     )
 
 
-class HTTP_103_EARLY_HINTS(HTTPStatus):
+class HTTP_103_EARLY_HINTS(InformationalStatus):
     """103 Early Hints response status code.
 
     Indicates to the client that the server is likely to send a final response
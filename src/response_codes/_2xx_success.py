@@ -4,11 +4,11 @@ This module contains HTTP status code exceptions for successful responses
 (200-208, 226).
 """
 
-from ._core import HTTPStatus
+from ._core import SuccessStatus
 
 
 # 2xx Success
-class HTTP_200_OK(HTTPStatus):
+class HTTP_200_OK(SuccessStatus):
     """200 OK response status code.
 
     Indicates that the request has succeeded. The payload sent in a 200
@@ -23,7 +23,7 @@ class HTTP_200_OK(HTTPStatus):
     )
 
 
-class HTTP_201_CREATED(HTTPStatus):
+class HTTP_201_CREATED(SuccessStatus):
     """201 Created response status code.
 
     Indicates that the request has been fulfilled and has resulted in one or
@@ -37,7 +37,7 @@ class HTTP_201_CREATED(HTTPStatus):
     )
 
 
-class HTTP_202_ACCEPTED(HTTPStatus):
+class HTTP_202_ACCEPTED(SuccessStatus):
     """202 Accepted response status code.
 
     Indicates that the request has been accepted for processing, but the
@@ -53,7 +53,7 @@ class HTTP_202_ACCEPTED(HTTPStatus):
     )
 
 
-class HTTP_203_NON_AUTHORITATIVE_INFORMATION(HTTPStatus):
+class HTTP_203_NON_AUTHORITATIVE_INFORMATION(SuccessStatus):
     """203 Non-Authoritative Information response status code.
 
     Indicates that the request was successful but the enclosed payload has
@@ -69,7 +69,7 @@ class HTTP_203_NON_AUTHORITATIVE_INFORMATION(HTTPStatus):
     )
 
 
-class HTTP_204_NO_CONTENT(HTTPStatus):
+class HTTP_204_NO_CONTENT(SuccessStatus):
     """204 No Content response status code.
 
     Indicates that the server has successfully fulfilled the request and that
@@ -83,7 +83,7 @@ class HTTP_204_NO_CONTENT(HTTPStatus):
     )
 
 
-class HTTP_205_RESET_CONTENT(HTTPStatus):
+class HTTP_205_RESET_CONTENT(SuccessStatus):
     """205 Reset Content response status code.
 
     Indicates that the server has fulfilled the request and desires that the
@@ -97,7 +97,7 @@ class HTTP_205_RESET_CONTENT(HTTPStatus):
     )
 
 
-class HTTP_206_PARTIAL_CONTENT(HTTPStatus):
+class HTTP_206_PARTIAL_CONTENT(SuccessStatus):
     """206 Partial Content response status code.
 
     Indicates that the server is successfully fulfilling a range request for
@@ -113,7 +113,7 @@ class HTTP_206_PARTIAL_CONTENT(HTTPStatus):
     )
 
 
-class HTTP_207_MULTI_STATUS(HTTPStatus):
+class HTTP_207_MULTI_STATUS(SuccessStatus):
     """207 Multi-Status response status code.
 
     Provides status for multiple independent operations in a single response.
@@ -125,7 +125,7 @@ class HTTP_207_MULTI_STATUS(HTTPStatus):
     description = "Multiple status codes might be appropriate for the response."
 
 
-class HTTP_208_ALREADY_REPORTED(HTTPStatus):
+class HTTP_208_ALREADY_REPORTED(SuccessStatus):
     """208 Already Reported response status code.
 
     Used inside a DAV: propstat response element to avoid enumerating the
@@ -140,7 +140,7 @@ class HTTP_208_ALREADY_REPORTED(HTTPStatus):
     )
 
 
-class HTTP_226_IM_USED(HTTPStatus):
+class HTTP_226_IM_USED(SuccessStatus):
     """226 IM Used response status code.
 
     The server has fulfilled a GET request for the resource, and the response
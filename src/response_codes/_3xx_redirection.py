@@ -4,11 +4,11 @@ This module contains HTTP status code exceptions for redirection responses
 (300-308).
 """
 
-from ._core import HTTPStatus
+from ._core import RedirectionStatus
 
 
 # 3xx Redirection
-class HTTP_300_MULTIPLE_CHOICES(HTTPStatus):
+class HTTP_300_MULTIPLE_CHOICES(RedirectionStatus):
     """300 Multiple Choices response status code.
 
     Indicates that the target resource has more than one representation, each
@@ -24,7 +24,7 @@ class HTTP_300_MULTIPLE_CHOICES(HTTPStatus):
     )
 
 
-class HTTP_301_MOVED_PERMANENTLY(HTTPStatus):
+class HTTP_301_MOVED_PERMANENTLY(RedirectionStatus):
     """301 Moved Permanently response status code.
 
     Indicates that the target resource has been assigned a new permanent URI
@@ -39,7 +39,7 @@ class HTTP_301_MOVED_PERMANENTLY(HTTPStatus):
     )
 
 
-class HTTP_302_FOUND(HTTPStatus):
+class HTTP_302_FOUND(RedirectionStatus):
     """302 Found response status code.
 
     Indicates that the target resource resides temporarily under a different
@@ -54,7 +54,7 @@ class HTTP_302_FOUND(HTTPStatus):
     )
 
 
-class HTTP_303_SEE_OTHER(HTTPStatus):
+class HTTP_303_SEE_OTHER(RedirectionStatus):
     """303 See Other response status code.
 
     Indicates that the server is redirecting the user agent to a different
@@ -69,7 +69,7 @@ class HTTP_303_SEE_OTHER(HTTPStatus):
     )
 
 
-class HTTP_304_NOT_MODIFIED(HTTPStatus):
+class HTTP_304_NOT_MODIFIED(RedirectionStatus):
     """304 Not Modified response status code.
 
     Indicates that a conditional GET or HEAD request has been received and
@@ -82,7 +82,7 @@ class HTTP_304_NOT_MODIFIED(HTTPStatus):
     description = "The resource has not been modified since the last request."
 
 
-class HTTP_305_USE_PROXY(HTTPStatus):
+class HTTP_305_USE_PROXY(RedirectionStatus):
     """305 Use Proxy response status code.
 
     Deprecated status code that indicated that the requested resource must be
@@ -96,7 +96,7 @@ class HTTP_305_USE_PROXY(HTTPStatus):
     )
 
 
-class HTTP_307_TEMPORARY_REDIRECT(HTTPStatus):
+class HTTP_307_TEMPORARY_REDIRECT(RedirectionStatus):
     """307 Temporary Redirect response status code.
 
     Indicates that the target resource resides temporarily under a different
@@ -111,7 +111,7 @@ class HTTP_307_TEMPORARY_REDIRECT(HTTPStatus):
     )
 
 
-class HTTP_308_PERMANENT_REDIRECT(HTTPStatus):
+class HTTP_308_PERMANENT_REDIRECT(RedirectionStatus):
     """308 Permanent Redirect response status code.
 
     Indicates that the target resource has been assigned a new permanent URI
@@ -4,11 +4,11 @@ This module contains HTTP status code exceptions for client error responses
 (400-431, 451).
 """
 
-from ._core import HTTPStatus
+from ._core import ClientErrorStatus
 
 
 # 4xx Client Errors
-class HTTP_400_BAD_REQUEST(HTTPStatus):
+class HTTP_400_BAD_REQUEST(ClientErrorStatus):
     """400 Bad Request response status code.
 
     Indicates that the server cannot or will not process the request due to
@@ -21,7 +21,7 @@ class HTTP_400_BAD_REQUEST(HTTPStatus):
     description = "The server cannot process the request due to a client error."
 
 
-class HTTP_401_UNAUTHORIZED(HTTPStatus):
+class HTTP_401_UNAUTHORIZED(ClientErrorStatus):
     """401 Unauthorized response status code.
 
     Indicates that the request has not been applied because it lacks valid
@@ -33,7 +33,7 @@ class HTTP_401_UNAUTHORIZED(HTTPStatus):
     description = "The request requires user authentication."
 
 
-class HTTP_402_PAYMENT_REQUIRED(HTTPStatus):
+class HTTP_402_PAYMENT_REQUIRED(ClientErrorStatus):
     """402 Payment Required response status code.
 
     Reserved for future use. The original intention was that this code might
@@ -45,7 +45,7 @@ class HTTP_402_PAYMENT_REQUIRED(HTTPStatus):
     description = "Reserved for future use in digital payment systems."
 
 
-class HTTP_403_FORBIDDEN(HTTPStatus):
+class HTTP_403_FORBIDDEN(ClientErrorStatus):
     """403 Forbidden response status code.
 
     Indicates that the server understood the request but refuses to authorize
@@ -59,7 +59,7 @@ class HTTP_403_FORBIDDEN(HTTPStatus):
     )
 
 
-class HTTP_404_NOT_FOUND(HTTPStatus):
+class HTTP_404_NOT_FOUND(ClientErrorStatus):
     """404 Not Found response status code.
 
     Indicates that the server cannot find the requested resource. Links that
@@ -71,7 +71,7 @@ class HTTP_404_NOT_FOUND(HTTPStatus):
     description = "The requested resource could not be found on the server."
 
 
-class HTTP_405_METHOD_NOT_ALLOWED(HTTPStatus):
+class HTTP_405_METHOD_NOT_ALLOWED(ClientErrorStatus):
     """405 Method Not Allowed response status code.
 
     Indicates that the method received in the request-line is known by the
@@ -85,7 +85,7 @@ class HTTP_405_METHOD_NOT_ALLOWED(HTTPStatus):
     )
 
 
-class HTTP_406_NOT_ACCEPTABLE(HTTPStatus):
+class HTTP_406_NOT_ACCEPTABLE(ClientErrorStatus):
     """406 Not Acceptable response status code.
 
     Indicates that the target resource does not have a current representation
@@ -101,7 +101,7 @@ class HTTP_406_NOT_ACCEPTABLE(HTTPStatus):
     )
 
 
-class HTTP_407_PROXY_AUTHENTICATION_REQUIRED(HTTPStatus):
+class HTTP_407_PROXY_AUTHENTICATION_REQUIRED(ClientErrorStatus):
     """407 Proxy Authentication Required response status code.
 
     Similar to 401 Unauthorized, but it indicates that the client needs to
@@ -113,7 +113,7 @@ class HTTP_407_PROXY_AUTHENTICATION_REQUIRED(HTTPStatus):
     description = "Authentication with the proxy server is required."
 
 
-class HTTP_408_REQUEST_TIMEOUT(HTTPStatus):
+class HTTP_408_REQUEST_TIMEOUT(ClientErrorStatus):
     """408 Request Timeout response status code.
 
     Indicates that the server did not receive a complete request message
@@ -123,9 +123,10 @@ class HTTP_408_REQUEST_TIMEOUT(HTTPStatus):
     status_code = 408
     message = "Request Timeout"
     description = "The server timed out waiting for the request."
+    retryable = True
 
 
-class HTTP_409_CONFLICT(HTTPStatus):
+class HTTP_409_CONFLICT(ClientErrorStatus):
     """409 Conflict response status code.
 
     Indicates that the request conflicts with the current state of the target
@@ -137,7 +138,7 @@ class HTTP_409_CONFLICT(HTTPStatus):
     description = "The request conflicts with the current state of the server."
 
 
-class HTTP_410_GONE(HTTPStatus):
+class HTTP_410_GONE(ClientErrorStatus):
     """410 Gone response status code.
 
     Indicates that access to the target resource is no longer available at the
@@ -152,7 +153,7 @@ class HTTP_410_GONE(HTTPStatus):
     )
 
 
-class HTTP_411_LENGTH_REQUIRED(HTTPStatus):
+class HTTP_411_LENGTH_REQUIRED(ClientErrorStatus):
     """411 Length Required response status code.
 
     Indicates that the server refuses to accept the request without a defined
@@ -164,7 +165,7 @@ class HTTP_411_LENGTH_REQUIRED(HTTPStatus):
     description = "The request did not specify the length of its content."
 
 
-class HTTP_412_PRECONDITION_FAILED(HTTPStatus):
+class HTTP_412_PRECONDITION_FAILED(ClientErrorStatus):
     """412 Precondition Failed response status code.
 
     Indicates that one or more conditions given in the request header fields
@@ -179,7 +180,7 @@ class HTTP_412_PRECONDITION_FAILED(HTTPStatus):
     )
 
 
-class HTTP_413_PAYLOAD_TOO_LARGE(HTTPStatus):
+class HTTP_413_PAYLOAD_TOO_LARGE(ClientErrorStatus):
     """413 Payload Too Large response status code.
 
     Indicates that the server is refusing to process a request because the
@@ -194,7 +195,7 @@ class HTTP_413_PAYLOAD_TOO_LARGE(HTTPStatus):
     )
 
 
-class HTTP_414_URI_TOO_LONG(HTTPStatus):
+class HTTP_414_URI_TOO_LONG(ClientErrorStatus):
     """414 URI Too Long response status code.
 
     Indicates that the server is refusing to service the request because the
@@ -208,7 +209,7 @@ class HTTP_414_URI_TOO_LONG(HTTPStatus):
     )
 
 
-class HTTP_415_UNSUPPORTED_MEDIA_TYPE(HTTPStatus):
+class HTTP_415_UNSUPPORTED_MEDIA_TYPE(ClientErrorStatus):
     """415 Unsupported Media Type response status code.
 
     Indicates that the server is refusing to service the request because the
@@ -222,7 +223,7 @@ class HTTP_415_UNSUPPORTED_MEDIA_TYPE(HTTPStatus):
     )
 
 
-class HTTP_416_RANGE_NOT_SATISFIABLE(HTTPStatus):
+class HTTP_416_RANGE_NOT_SATISFIABLE(ClientErrorStatus):
     """416 Range Not Satisfiable response status code.
 
     Indicates that none of the ranges in the request's Range header field
@@ -237,7 +238,7 @@ class HTTP_416_RANGE_NOT_SATISFIABLE(HTTPStatus):
     )
 
 
-class HTTP_417_EXPECTATION_FAILED(HTTPStatus):
+class HTTP_417_EXPECTATION_FAILED(ClientErrorStatus):
     """417 Expectation Failed response status code.
 
     Indicates that the expectation given in the request's Expect header field
@@ -252,7 +253,7 @@ class HTTP_417_EXPECTATION_FAILED(HTTPStatus):
     )
 
 
-class HTTP_418_IM_A_TEAPOT(HTTPStatus):
+class HTTP_418_IM_A_TEAPOT(ClientErrorStatus):
     """418 I'm a teapot response status code.
 
     Any attempt to brew coffee with a teapot should result in this error code.
@@ -264,7 +265,7 @@ class HTTP_418_IM_A_TEAPOT(HTTPStatus):
     description = "The server refuses to brew coffee because it is a teapot."
 
 
-class HTTP_421_MISDIRECTED_REQUEST(HTTPStatus):
+class HTTP_421_MISDIRECTED_REQUEST(ClientErrorStatus):
     """421 Misdirected Request response status code.
 
     Indicates that the request was directed at a server that is not able to
@@ -278,7 +279,7 @@ class HTTP_421_MISDIRECTED_REQUEST(HTTPStatus):
     )
 
 
-class HTTP_422_UNPROCESSABLE_ENTITY(HTTPStatus):
+class HTTP_422_UNPROCESSABLE_ENTITY(ClientErrorStatus):
     """422 Unprocessable Entity response status code.
 
     Indicates that the server understands the content type of the request
@@ -294,7 +295,7 @@ class HTTP_422_UNPROCESSABLE_ENTITY(HTTPStatus):
     )
 
 
-class HTTP_423_LOCKED(HTTPStatus):
+class HTTP_423_LOCKED(ClientErrorStatus):
     """423 Locked response status code.
 
     Indicates that the source or destination resource of a method is locked
@@ -306,7 +307,7 @@ class HTTP_423_LOCKED(HTTPStatus):
     description = "The requested resource is locked and cannot be accessed."
 
 
-class HTTP_424_FAILED_DEPENDENCY(HTTPStatus):
+class HTTP_424_FAILED_DEPENDENCY(ClientErrorStatus):
     """424 Failed Dependency response status code.
 
     Indicates that the method could not be performed on the resource because
@@ -318,7 +319,7 @@ class HTTP_424_FAILED_DEPENDENCY(HTTPStatus):
     description = "The request failed due to failure of a previous request."
 
 
-class HTTP_425_TOO_EARLY(HTTPStatus):
+class HTTP_425_TOO_EARLY(ClientErrorStatus):
     """425 Too Early response status code.
 
     Indicates that the server is unwilling to risk processing a request that
@@ -333,7 +334,7 @@ class HTTP_425_TOO_EARLY(HTTPStatus):
     )
 
 
-class HTTP_426_UPGRADE_REQUIRED(HTTPStatus):
+class HTTP_426_UPGRADE_REQUIRED(ClientErrorStatus):
     """426 Upgrade Required response status code.
 
     Indicates that the server refuses to perform the request using the current
@@ -349,7 +350,7 @@ class HTTP_426_UPGRADE_REQUIRED(HTTPStatus):
     )
 
 
-class HTTP_428_PRECONDITION_REQUIRED(HTTPStatus):
+class HTTP_428_PRECONDITION_REQUIRED(ClientErrorStatus):
     """428 Precondition Required response status code.
 
     Indicates that the origin server requires the request to be conditional to
@@ -361,7 +362,7 @@ class HTTP_428_PRECONDITION_REQUIRED(HTTPStatus):
     description = "The origin server requires the request to be conditional."
 
 
-class HTTP_429_TOO_MANY_REQUESTS(HTTPStatus):
+class HTTP_429_TOO_MANY_REQUESTS(ClientErrorStatus):
     """429 Too Many Requests response status code.
 
     Indicates the user has sent too many requests in a given amount of time
@@ -373,9 +374,10 @@ class HTTP_429_TOO_MANY_REQUESTS(HTTPStatus):
     description = (
         "The user has sent too many requests in a given amount of time."
     )
+    retryable = True
 
 
-class HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE(HTTPStatus):
+class HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE(ClientErrorStatus):
     """431 Request Header Fields Too Large response status code.
 
     Indicates that the server is unwilling to process the request because its
@@ -390,7 +392,7 @@ class HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE(HTTPStatus):
     )
 
 
-class HTTP_451_UNAVAILABLE_FOR_LEGAL_REASONS(HTTPStatus):
+class HTTP_451_UNAVAILABLE_FOR_LEGAL_REASONS(ClientErrorStatus):
     """451 Unavailable For Legal Reasons response status code.
 
     Indicates that the server is denying access to the resource as a
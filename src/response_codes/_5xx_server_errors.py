@@ -4,11 +4,11 @@ This module contains HTTP status code exceptions for server error responses
 (500-511).
 """
 
-from ._core import HTTPStatus
+from ._core import ServerErrorStatus
 
 
 # 5xx Server Errors
-class HTTP_500_INTERNAL_SERVER_ERROR(HTTPStatus):
+class HTTP_500_INTERNAL_SERVER_ERROR(ServerErrorStatus):
     """500 Internal Server Error response status code.
 
     Indicates that the server encountered an unexpected condition that
@@ -21,9 +21,10 @@ class HTTP_500_INTERNAL_SERVER_ERROR(HTTPStatus):
         "The server encountered an unexpected condition that "
         "prevented fulfilling the request."
     )
+    retryable = True
 
 
-class HTTP_501_NOT_IMPLEMENTED(HTTPStatus):
+class HTTP_501_NOT_IMPLEMENTED(ServerErrorStatus):
     """501 Not Implemented response status code.
 
     Indicates that the server does not support the functionality required to
@@ -38,7 +39,7 @@ class HTTP_501_NOT_IMPLEMENTED(HTTPStatus):
     )
 
 
-class HTTP_502_BAD_GATEWAY(HTTPStatus):
+class HTTP_502_BAD_GATEWAY(ServerErrorStatus):
     """502 Bad Gateway response status code.
 
     Indicates that the server, while acting as a gateway or proxy, received an
@@ -53,7 +54,7 @@ class HTTP_502_BAD_GATEWAY(HTTPStatus):
     )
 
 
-class HTTP_503_SERVICE_UNAVAILABLE(HTTPStatus):
+class HTTP_503_SERVICE_UNAVAILABLE(ServerErrorStatus):
     """503 Service Unavailable response status code.
 
     Indicates that the server is currently unable to handle the request due to
@@ -63,9 +64,10 @@ class HTTP_503_SERVICE_UNAVAILABLE(HTTPStatus):
     status_code = 503
     message = "Service Unavailable"
     description = "The server is temporarily unable to handle the request."
+    retryable = True
 
 
-class HTTP_504_GATEWAY_TIMEOUT(HTTPStatus):
+class HTTP_504_GATEWAY_TIMEOUT(ServerErrorStatus):
     """504 Gateway Timeout response status code.
 
     Indicates that the server, while acting as a gateway or proxy, did not
@@ -79,9 +81,10 @@ class HTTP_504_GATEWAY_TIMEOUT(HTTPStatus):
         "The gateway server did not receive a timely response "
         "from the upstream server."
     )
+    retryable = True
 
 
-class HTTP_505_HTTP_VERSION_NOT_SUPPORTED(HTTPStatus):
+class HTTP_505_HTTP_VERSION_NOT_SUPPORTED(ServerErrorStatus):
     """505 HTTP Version Not Supported response status code.
 
     Indicates that the server does not support, or refuses to support, the
@@ -96,7 +99,7 @@ class HTTP_505_HTTP_VERSION_NOT_SUPPORTED(HTTPStatus):
     )
 
 
-class HTTP_506_VARIANT_ALSO_NEGOTIATES(HTTPStatus):
+class HTTP_506_VARIANT_ALSO_NEGOTIATES(ServerErrorStatus):
     """506 Variant Also Negotiates response status code.
 
     Indicates that the server has an internal configuration error: the chosen
@@ -109,7 +112,7 @@ class HTTP_506_VARIANT_ALSO_NEGOTIATES(HTTPStatus):
     description = "The server has a configuration error in content negotiation."
 
 
-class HTTP_507_INSUFFICIENT_STORAGE(HTTPStatus):
+class HTTP_507_INSUFFICIENT_STORAGE(ServerErrorStatus):
     """507 Insufficient Storage response status code.
 
     Indicates that the server is unable to store the representation needed to
@@ -124,7 +127,7 @@ class HTTP_507_INSUFFICIENT_STORAGE(HTTPStatus):
     )
 
 
-class HTTP_508_LOOP_DETECTED(HTTPStatus):
+class HTTP_508_LOOP_DETECTED(ServerErrorStatus):
     """508 Loop Detected response status code.
 
     Indicates that the server terminated an operation because it encountered
@@ -138,7 +141,7 @@ class HTTP_508_LOOP_DETECTED(HTTPStatus):
     )
 
 
-class HTTP_510_NOT_EXTENDED(HTTPStatus):
+class HTTP_510_NOT_EXTENDED(ServerErrorStatus):
     """510 Not Extended response status code.
 
     Indicates that further extensions to the request are required for the
@@ -153,7 +156,7 @@ class HTTP_510_NOT_EXTENDED(HTTPStatus):
     )
 
 
-class HTTP_511_NETWORK_AUTHENTICATION_REQUIRED(HTTPStatus):
+class HTTP_511_NETWORK_AUTHENTICATION_REQUIRED(ServerErrorStatus):
     """511 Network Authentication Required response status code.
 
     Indicates that the client needs to authenticate to gain network access.
@@ -12,6 +12,10 @@ The module provides status codes in the following categories:
     - 4xx: Client error responses (400-431, 451)
     - 5xx: Server error responses (500-511)
 
+Every status class derives from the base class of its category
+(InformationalStatus, SuccessStatus, RedirectionStatus, ClientErrorStatus
+or ServerErrorStatus), so ``except ClientErrorStatus`` catches any 4xx.
+
 Each status code class provides:
     - status_code: The numeric HTTP status code
     - message: The standard HTTP status message
@@ -25,116 +29,226 @@ create_status_group() utility function:
     - HTTP_REDIRECTION: 3xx status codes
     - HTTP_CLIENT_ERRORS: Common 4xx status codes
     - HTTP_SERVER_ERRORS: Common 5xx status codes
+
+Status classes can also be looked up from a numeric code at runtime with
+lookup() and from_code(), or from a reason phrase with from_message().
+
+Submodules are imported lazily (PEP 562): each status range module is only
+loaded the first time one of its names is accessed.
 """
 
-# 1xx Informational responses
-from ._1xx_informational import (
-    HTTP_100_CONTINUE,
-    HTTP_101_SWITCHING_PROTOCOLS,
-    HTTP_102_PROCESSING,
-    HTTP_103_EARLY_HINTS,
-)
-
-# 2xx Success responses
-from ._2xx_success import (
-    HTTP_200_OK,
-    HTTP_201_CREATED,
-    HTTP_202_ACCEPTED,
-    HTTP_203_NON_AUTHORITATIVE_INFORMATION,
-    HTTP_204_NO_CONTENT,
-    HTTP_205_RESET_CONTENT,
-    HTTP_206_PARTIAL_CONTENT,
-    HTTP_207_MULTI_STATUS,
-    HTTP_208_ALREADY_REPORTED,
-    HTTP_226_IM_USED,
-)
-
-# 3xx Redirection responses
-from ._3xx_redirection import (
-    HTTP_300_MULTIPLE_CHOICES,
-    HTTP_301_MOVED_PERMANENTLY,
-    HTTP_302_FOUND,
-    HTTP_303_SEE_OTHER,
-    HTTP_304_NOT_MODIFIED,
-    HTTP_305_USE_PROXY,
-    HTTP_307_TEMPORARY_REDIRECT,
-    HTTP_308_PERMANENT_REDIRECT,
-)
-
-# 4xx Client error responses
-from ._4xx_client_errors import (
-    HTTP_400_BAD_REQUEST,
-    HTTP_401_UNAUTHORIZED,
-    HTTP_402_PAYMENT_REQUIRED,
-    HTTP_403_FORBIDDEN,
-    HTTP_404_NOT_FOUND,
-    HTTP_405_METHOD_NOT_ALLOWED,
-    HTTP_406_NOT_ACCEPTABLE,
-    HTTP_407_PROXY_AUTHENTICATION_REQUIRED,
-    HTTP_408_REQUEST_TIMEOUT,
-    HTTP_409_CONFLICT,
-    HTTP_410_GONE,
-    HTTP_411_LENGTH_REQUIRED,
-    HTTP_412_PRECONDITION_FAILED,
-    HTTP_413_PAYLOAD_TOO_LARGE,
-    HTTP_414_URI_TOO_LONG,
-    HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-    HTTP_416_RANGE_NOT_SATISFIABLE,
-    HTTP_417_EXPECTATION_FAILED,
-    HTTP_418_IM_A_TEAPOT,
-    HTTP_421_MISDIRECTED_REQUEST,
-    HTTP_422_UNPROCESSABLE_ENTITY,
-    HTTP_423_LOCKED,
-    HTTP_424_FAILED_DEPENDENCY,
-    HTTP_425_TOO_EARLY,
-    HTTP_426_UPGRADE_REQUIRED,
-    HTTP_428_PRECONDITION_REQUIRED,
-    HTTP_429_TOO_MANY_REQUESTS,
-    HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE,
-    HTTP_451_UNAVAILABLE_FOR_LEGAL_REASONS,
-)
-
-# 5xx Server error responses
-from ._5xx_server_errors import (
-    HTTP_500_INTERNAL_SERVER_ERROR,
-    HTTP_501_NOT_IMPLEMENTED,
-    HTTP_502_BAD_GATEWAY,
-    HTTP_503_SERVICE_UNAVAILABLE,
-    HTTP_504_GATEWAY_TIMEOUT,
-    HTTP_505_HTTP_VERSION_NOT_SUPPORTED,
-    HTTP_506_VARIANT_ALSO_NEGOTIATES,
-    HTTP_507_INSUFFICIENT_STORAGE,
-    HTTP_508_LOOP_DETECTED,
-    HTTP_510_NOT_EXTENDED,
-    HTTP_511_NETWORK_AUTHENTICATION_REQUIRED,
-)
-
-# Core infrastructure
-from ._core import HTTPStatus, HTTPStatusMeta, create_status_group
-
-# Predefined status code groups
-from ._groups import (
-    HTTP_CLIENT_ERRORS,
-    HTTP_INFORMATIONAL,
-    HTTP_REDIRECTION,
-    HTTP_SERVER_ERRORS,
-    HTTP_SUCCESS,
-)
-
-# HTTP status categories
-from ._is_category import (
-    is_client_error,
-    is_informational,
-    is_redirection,
-    is_server_error,
-    is_success,
-)
+from importlib import import_module
+
+# Avoid importing `typing` at runtime; it dominates the package import time.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    # 1xx Informational responses
+    from ._1xx_informational import (
+        HTTP_100_CONTINUE,
+        HTTP_101_SWITCHING_PROTOCOLS,
+        HTTP_102_PROCESSING,
+        HTTP_103_EARLY_HINTS,
+    )
+
+    # 2xx Success responses
+    from ._2xx_success import (
+        HTTP_200_OK,
+        HTTP_201_CREATED,
+        HTTP_202_ACCEPTED,
+        HTTP_203_NON_AUTHORITATIVE_INFORMATION,
+        HTTP_204_NO_CONTENT,
+        HTTP_205_RESET_CONTENT,
+        HTTP_206_PARTIAL_CONTENT,
+        HTTP_207_MULTI_STATUS,
+        HTTP_208_ALREADY_REPORTED,
+        HTTP_226_IM_USED,
+    )
+
+    # 3xx Redirection responses
+    from ._3xx_redirection import (
+        HTTP_300_MULTIPLE_CHOICES,
+        HTTP_301_MOVED_PERMANENTLY,
+        HTTP_302_FOUND,
+        HTTP_303_SEE_OTHER,
+        HTTP_304_NOT_MODIFIED,
+        HTTP_305_USE_PROXY,
+        HTTP_307_TEMPORARY_REDIRECT,
+        HTTP_308_PERMANENT_REDIRECT,
+    )
+
+    # 4xx Client error responses
+    from ._4xx_client_errors import (
+        HTTP_400_BAD_REQUEST,
+        HTTP_401_UNAUTHORIZED,
+        HTTP_402_PAYMENT_REQUIRED,
+        HTTP_403_FORBIDDEN,
+        HTTP_404_NOT_FOUND,
+        HTTP_405_METHOD_NOT_ALLOWED,
+        HTTP_406_NOT_ACCEPTABLE,
+        HTTP_407_PROXY_AUTHENTICATION_REQUIRED,
+        HTTP_408_REQUEST_TIMEOUT,
+        HTTP_409_CONFLICT,
+        HTTP_410_GONE,
+        HTTP_411_LENGTH_REQUIRED,
+        HTTP_412_PRECONDITION_FAILED,
+        HTTP_413_PAYLOAD_TOO_LARGE,
+        HTTP_414_URI_TOO_LONG,
+        HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        HTTP_416_RANGE_NOT_SATISFIABLE,
+        HTTP_417_EXPECTATION_FAILED,
+        HTTP_418_IM_A_TEAPOT,
+        HTTP_421_MISDIRECTED_REQUEST,
+        HTTP_422_UNPROCESSABLE_ENTITY,
+        HTTP_423_LOCKED,
+        HTTP_424_FAILED_DEPENDENCY,
+        HTTP_425_TOO_EARLY,
+        HTTP_426_UPGRADE_REQUIRED,
+        HTTP_428_PRECONDITION_REQUIRED,
+        HTTP_429_TOO_MANY_REQUESTS,
+        HTTP_431_REQUEST_HEADER_FIELDS_TOO_LARGE,
+        HTTP_451_UNAVAILABLE_FOR_LEGAL_REASONS,
+    )
+
+    # 5xx Server error responses
+    from ._5xx_server_errors import (
+        HTTP_500_INTERNAL_SERVER_ERROR,
+        HTTP_501_NOT_IMPLEMENTED,
+        HTTP_502_BAD_GATEWAY,
+        HTTP_503_SERVICE_UNAVAILABLE,
+        HTTP_504_GATEWAY_TIMEOUT,
+        HTTP_505_HTTP_VERSION_NOT_SUPPORTED,
+        HTTP_506_VARIANT_ALSO_NEGOTIATES,
+        HTTP_507_INSUFFICIENT_STORAGE,
+        HTTP_508_LOOP_DETECTED,
+        HTTP_510_NOT_EXTENDED,
+        HTTP_511_NETWORK_AUTHENTICATION_REQUIRED,
+    )
+
+    # Asyncio retry execution
+    from ._aio_retry import AsyncRetrier, RetryBudget
+
+    # ASGI middleware
+    from ._asgi import ASGIStatusMiddleware
+
+    # Circuit breaking
+    from ._breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+    # Core infrastructure
+    from ._core import (
+        ClientErrorStatus,
+        HTTPStatus,
+        HTTPStatusMeta,
+        InformationalStatus,
+        RedirectionStatus,
+        ServerErrorStatus,
+        StatusCode,
+        SuccessStatus,
+        create_status_group,
+        from_code,
+        from_message,
+        lookup,
+    )
+
+    # Status counting
+    from ._counter import StatusCounter
+
+    # Handler dispatch
+    from ._dispatch import StatusDispatcher
+
+    # Predefined status code groups
+    from ._groups import (
+        HTTP_CLIENT_ERRORS,
+        HTTP_INFORMATIONAL,
+        HTTP_REDIRECTION,
+        HTTP_SERVER_ERRORS,
+        HTTP_SUCCESS,
+    )
+
+    # Raise instrumentation
+    from ._instrument import RaiseInstrument, RaiseSample
+
+    # HTTP status categories
+    from ._is_category import (
+        StatusCategory,
+        category_of,
+        classify_many,
+        count_by_category,
+        is_client_error,
+        is_informational,
+        is_redirection,
+        is_server_error,
+        is_success,
+    )
+
+    # Problem Details rendering
+    from ._problem import PROBLEM_JSON_MEDIA_TYPE, ProblemRenderer
+
+    # Retry decisions
+    from ._retry import (
+        DEFAULT_RETRY_POLICY,
+        RetryPolicy,
+        parse_retry_after,
+        should_retry,
+    )
+
+    # Status-line parsing and formatting
+    from ._status_line import (
+        ParsedStatusLine,
+        format_status_line,
+        parse_status_line,
+    )
+
+    # Compact status transport
+    from ._transport import pack_statuses, unpack_statuses
+
+    # Sliding-window tracking
+    from ._window import ErrorRateWindow
+
+    # WSGI middleware
+    from ._wsgi import WSGIStatusMiddleware
 
 __all__ = [
     # Core classes and utilities
     "HTTPStatus",
     "HTTPStatusMeta",
+    "StatusCode",
+    "InformationalStatus",
+    "SuccessStatus",
+    "RedirectionStatus",
+    "ClientErrorStatus",
+    "ServerErrorStatus",
     "create_status_group",
+    "lookup",
+    "from_code",
+    "from_message",
+    "StatusCategory",
+    "category_of",
+    "classify_many",
+    "count_by_category",
+    "StatusCounter",
+    "ErrorRateWindow",
+    "RetryPolicy",
+    "AsyncRetrier",
+    "RetryBudget",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "ASGIStatusMiddleware",
+    "WSGIStatusMiddleware",
+    "StatusDispatcher",
+    "RaiseInstrument",
+    "RaiseSample",
+    "DEFAULT_RETRY_POLICY",
+    "parse_retry_after",
+    "should_retry",
+    "ParsedStatusLine",
+    "parse_status_line",
+    "format_status_line",
+    "PROBLEM_JSON_MEDIA_TYPE",
+    "ProblemRenderer",
+    "pack_statuses",
+    "unpack_statuses",
     "is_informational",
     "is_success",
     "is_redirection",
@@ -214,3 +328,86 @@ __all__ = [
     "HTTP_CLIENT_ERRORS",
     "HTTP_SERVER_ERRORS",
 ]
+
+# Submodule defining each status range, keyed by the first digit of the code.
+_STATUS_MODULES = {
+    "1": "._1xx_informational",
+    "2": "._2xx_success",
+    "3": "._3xx_redirection",
+    "4": "._4xx_client_errors",
+    "5": "._5xx_server_errors",
+}
+
+# Submodule defining every other public name.
+_LAZY_ATTRS = {
+    "HTTPStatus": "._core",
+    "HTTPStatusMeta": "._core",
+    "StatusCode": "._core",
+    "InformationalStatus": "._core",
+    "SuccessStatus": "._core",
+    "RedirectionStatus": "._core",
+    "ClientErrorStatus": "._core",
+    "ServerErrorStatus": "._core",
+    "create_status_group": "._core",
+    "lookup": "._core",
+    "from_code": "._core",
+    "from_message": "._core",
+    "StatusCategory": "._is_category",
+    "category_of": "._is_category",
+    "classify_many": "._is_category",
+    "count_by_category": "._is_category",
+    "is_informational": "._is_category",
+    "is_success": "._is_category",
+    "is_redirection": "._is_category",
+    "is_client_error": "._is_category",
+    "is_server_error": "._is_category",
+    "StatusCounter": "._counter",
+    "ErrorRateWindow": "._window",
+    "RetryPolicy": "._retry",
+    "DEFAULT_RETRY_POLICY": "._retry",
+    "parse_retry_after": "._retry",
+    "should_retry": "._retry",
+    "AsyncRetrier": "._aio_retry",
+    "RetryBudget": "._aio_retry",
+    "CircuitBreaker": "._breaker",
+    "CircuitOpenError": "._breaker",
+    "CircuitState": "._breaker",
+    "ASGIStatusMiddleware": "._asgi",
+    "WSGIStatusMiddleware": "._wsgi",
+    "StatusDispatcher": "._dispatch",
+    "RaiseInstrument": "._instrument",
+    "RaiseSample": "._instrument",
+    "ParsedStatusLine": "._status_line",
+    "parse_status_line": "._status_line",
+    "format_status_line": "._status_line",
+    "PROBLEM_JSON_MEDIA_TYPE": "._problem",
+    "ProblemRenderer": "._problem",
+    "pack_statuses": "._transport",
+    "unpack_statuses": "._transport",
+    "HTTP_INFORMATIONAL": "._groups",
+    "HTTP_SUCCESS": "._groups",
+    "HTTP_REDIRECTION": "._groups",
+    "HTTP_CLIENT_ERRORS": "._groups",
+    "HTTP_SERVER_ERRORS": "._groups",
+}
+
+_PUBLIC_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> object:
+    """Import the submodule defining `name` on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None and name in _PUBLIC_NAMES:
+        module_name = _STATUS_MODULES.get(name[5:6])
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names alongside the module's current globals."""
+    return sorted(_PUBLIC_NAMES.union(globals()))
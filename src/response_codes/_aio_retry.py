@@ -0,0 +1,213 @@
+"""Asyncio retry executor driven by raised HTTPStatus exceptions.
+
+This module contains AsyncRetrier, which retries coroutine functions that
+raise retryable status exceptions, and RetryBudget, which caps retries
+across every task sharing it.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union, cast
+
+from ._core import _REGISTRY_SIZE, HTTPStatus
+from ._counter import StatusCounter
+from ._is_category import (
+    StatusCategory,
+    StatusValue,
+    _status_table,
+)
+from ._retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable
+
+_T = TypeVar("_T")
+_F = TypeVar("_F", bound=Callable[..., "Awaitable[Any]"])
+
+
+class RetryBudget:
+    """A token bucket limiting retries across concurrent tasks.
+
+    Every call deposits `ratio` tokens (up to `capacity`) and every retry
+    spends one, so retries are capped at roughly `ratio` times the call
+    rate once the initial `capacity` is used up. Sharing one budget between
+    tasks stops a burst of failures from multiplying the load on an
+    upstream that is already struggling.
+
+    The budget is not thread-safe; share it between tasks of one event
+    loop.
+    """
+
+    __slots__ = ("capacity", "ratio", "tokens")
+
+    def __init__(self, ratio: float = 0.1, capacity: float = 10.0) -> None:
+        """Create a full budget.
+
+        Args:
+            ratio: Tokens deposited per call, i.e. the fraction of calls
+                that may be retried in the long run.
+            capacity: Maximum number of tokens, and so the largest burst of
+                retries allowed.
+
+        Raises:
+            ValueError: If `ratio` is negative or `capacity` is below 1.
+        """
+        if ratio < 0 or capacity < 1:
+            msg = "ratio must be non-negative and capacity at least 1"
+            raise ValueError(msg)
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+
+    def deposit(self) -> None:
+        """Credit the budget for a new call."""
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend one token for a retry, returning False if none are left."""
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def __repr__(self) -> str:
+        """Return a representation showing the remaining tokens."""
+        return (
+            f"{type(self).__name__}(ratio={self.ratio!r}, "
+            f"capacity={self.capacity!r}, tokens={self.tokens!r})"
+        )
+
+
+class AsyncRetrier:
+    """Retry coroutine functions that raise retryable HTTPStatus exceptions.
+
+    Retries wait with ``asyncio.sleep``, so the event loop is never
+    blocked, and cancellation propagates immediately, including during a
+    wait. Delays come from the RetryPolicy; an exception with a
+    ``retry_after`` attribute (a ``Retry-After`` header value or a number of
+    seconds) overrides the backoff. Every delay is capped at the policy's
+    ``max_delay``.
+
+    The ``failures`` and ``retries`` counters record, per status code, every
+    failed attempt and every retry scheduled.
+
+    Examples:
+        >>> retrier = AsyncRetrier(retry_on=[StatusCategory.SERVER_ERROR])
+        >>> @retrier
+        ... async def fetch(url: str) -> bytes: ...
+        >>> body = await fetch("https://example.com/")
+        >>> retrier.retries[503]
+        2
+    """
+
+    __slots__ = ("_sleep", "_table", "budget", "failures", "policy", "retries")
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        *,
+        retry_on: Optional[Iterable[Union[StatusValue, StatusCategory]]] = None,
+        budget: Optional[RetryBudget] = None,
+        sleep: Optional[Callable[[float], Awaitable[object]]] = None,
+    ) -> None:
+        """Create a retrier.
+
+        Args:
+            policy: Decides the attempt limit and delays. Defaults to
+                DEFAULT_RETRY_POLICY.
+            retry_on: Statuses (ints, classes or instances) and
+                StatusCategory members to retry. Defaults to the policy's
+                retryable codes.
+            budget: Retry budget shared with other retriers, if any.
+            sleep: Coroutine function used to wait between attempts.
+                Defaults to ``asyncio.sleep``.
+
+        Raises:
+            TypeError: If an item of `retry_on` is not a supported type.
+            ValueError: If a code in `retry_on` is outside the range 0-999.
+        """
+        self.policy = DEFAULT_RETRY_POLICY if policy is None else policy
+        self._table = None if retry_on is None else _status_table(retry_on)
+        self.budget = budget
+        self._sleep = sleep
+        self.failures = StatusCounter()
+        self.retries = StatusCounter()
+
+    def _is_retryable(self, code: int) -> bool:
+        """Return True if failures with `code` should be retried."""
+        if self._table is None:
+            return self.policy.is_retryable(code)
+        return 0 <= code < _REGISTRY_SIZE and self._table[code] == 1
+
+    def _delay(self, exc: HTTPStatus, attempt: int) -> float:
+        """Return how long to wait after `exc` ended attempt `attempt`."""
+        retry_after = getattr(exc, "retry_after", None)
+        if isinstance(retry_after, (int, float)):
+            if math.isfinite(retry_after):
+                return min(max(float(retry_after), 0.0), self.policy.max_delay)
+            retry_after = None
+        return self.policy.delay(
+            attempt, retry_after if isinstance(retry_after, str) else None
+        )
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[_T]],
+        /,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> _T:
+        """Await ``func(*args, **kwargs)``, retrying retryable failures.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            HTTPStatus: The last failure, once it is not retryable, the
+                attempt limit is reached, or the budget is exhausted.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await func(*args, **kwargs)
+            except HTTPStatus as exc:
+                code = exc.status_code
+                counted = 0 <= code < _REGISTRY_SIZE
+                if counted:
+                    self.failures.add(code)
+                if (
+                    attempt >= self.policy.max_attempts
+                    or not self._is_retryable(code)
+                    or (self.budget is not None and not self.budget.try_spend())
+                ):
+                    raise
+                if counted:
+                    self.retries.add(code)
+                delay = self._delay(exc, attempt)
+            if self._sleep is None:
+                # Imported here so importing the package never loads asyncio.
+                import asyncio  # noqa: PLC0415
+
+                await asyncio.sleep(delay)
+            else:
+                await self._sleep(delay)
+
+    def __call__(self, func: _F) -> _F:
+        """Wrap a coroutine function so every call goes through call()."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            return await self.call(func, *args, **kwargs)
+
+        return cast("_F", wrapper)
+
+
+__all__ = [
+    "AsyncRetrier",
+    "RetryBudget",
+]
@@ -0,0 +1,137 @@
+"""ASGI middleware turning raised status exceptions into responses.
+
+This module contains ASGIStatusMiddleware, which catches HTTPStatus
+exceptions raised by an ASGI application and sends them as JSON error
+responses, using headers and bodies pre-built once per status class.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from ._core import HTTPStatus
+from ._error_body import _render_error_body
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable, MutableMapping
+
+    from ._problem import ProblemRenderer
+
+    _Scope = MutableMapping[str, Any]
+    _Message = MutableMapping[str, Any]
+    _Receive = Callable[[], Awaitable[_Message]]
+    _Send = Callable[[_Message], Awaitable[None]]
+    _ASGIApp = Callable[[_Scope, _Receive, _Send], Awaitable[None]]
+    _Headers = tuple[tuple[bytes, bytes], ...]
+
+
+class ASGIStatusMiddleware:
+    """Send HTTPStatus exceptions raised by an ASGI app as error responses.
+
+    An exception raised before the application starts its response is sent
+    as a JSON error body, such as
+    ``{"error_code": 404, "message": "Not Found"}``, or as an RFC 9457
+    Problem Details document when a ProblemRenderer is given. The status
+    code, headers and body are built once per class and reused; only an
+    exception's ``detail`` is encoded per response.
+
+    ``send`` is wrapped only to note when the application sends
+    ``http.response.start``. A status raised after that can no longer
+    become a response, so it is re-raised unchanged for the server to
+    report.
+
+    Examples:
+        >>> async def app(scope, receive, send):
+        ...     raise HTTP_404_NOT_FOUND("no such user")
+        >>> app = ASGIStatusMiddleware(app)
+    """
+
+    __slots__ = ("_extra_headers", "_problem_renderer", "_responses", "app")
+
+    def __init__(
+        self,
+        app: _ASGIApp,
+        *,
+        problem_renderer: Optional[ProblemRenderer] = None,
+        headers: Iterable[tuple[bytes, bytes]] = (),
+    ) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: The ASGI application.
+            problem_renderer: Renderer for ``application/problem+json``
+                bodies. If None, bodies come from ``to_json_bytes()``.
+            headers: Extra headers sent with every error response.
+        """
+        self.app = app
+        self._problem_renderer = problem_renderer
+        self._extra_headers = tuple(headers)
+        self._responses: dict[
+            type[HTTPStatus], tuple[int, _Headers, bytes]
+        ] = {}
+
+    def _build(
+        self, status: type[HTTPStatus], detail: Optional[str]
+    ) -> tuple[int, _Headers, bytes]:
+        """Build the status code, headers and body for a response."""
+        status, media_type, body = _render_error_body(
+            status, detail, self._problem_renderer
+        )
+        if not media_type:
+            return status.status_code, self._extra_headers, body
+        headers = (
+            (b"content-type", media_type.encode("ascii")),
+            (b"content-length", b"%d" % len(body)),
+            *self._extra_headers,
+        )
+        return status.status_code, headers, body
+
+    def response(self, exc: HTTPStatus) -> tuple[int, _Headers, bytes]:
+        """Return the status code, headers and body sent for `exc`.
+
+        Responses for exceptions without a detail are cached per class.
+        """
+        status = type(exc)
+        if exc.detail is not None:
+            return self._build(status, exc.detail)
+        cached = self._responses.get(status)
+        if cached is None:
+            cached = self._responses[status] = self._build(status, None)
+        return cached
+
+    async def __call__(
+        self, scope: _Scope, receive: _Receive, send: _Send
+    ) -> None:
+        """Run the application, sending raised statuses as responses."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = False
+
+        # A plain function returning send's awaitable, so each message
+        # costs no extra coroutine.
+        def tracking_send(message: _Message) -> Awaitable[None]:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            return send(message)
+
+        try:
+            await self.app(scope, receive, tracking_send)
+        except HTTPStatus as exc:
+            if started:
+                raise
+            code, headers, body = self.response(exc)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": code,
+                    "headers": list(headers),
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+
+
+__all__ = [
+    "ASGIStatusMiddleware",
+]
@@ -0,0 +1,340 @@
+"""Circuit breaking driven by the share of failing response statuses.
+
+This module contains CircuitBreaker, which stops calls to an upstream once
+too many of its responses fail, and CircuitOpenError, raised while the
+circuit is open.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+from ._5xx_server_errors import HTTP_503_SERVICE_UNAVAILABLE
+from ._core import _REGISTRY_SIZE, HTTPStatus
+from ._is_category import (
+    _CATEGORY_TABLE,
+    StatusCategory,
+    StatusValue,
+    _get_status_code,
+    _status_table,
+)
+from ._window import ErrorRateWindow
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+# Failures that trip the circuit unless configured otherwise.
+_DEFAULT_TRIP_ON: tuple[Union[StatusValue, StatusCategory], ...] = (
+    StatusCategory.SERVER_ERROR,
+    429,
+)
+
+# Code recorded for calls that complete without raising a status.
+_SUCCESS_CODE = 200
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(HTTP_503_SERVICE_UNAVAILABLE):
+    """Raised instead of calling an upstream whose circuit is open.
+
+    It is a 503 Service Unavailable, so it can be returned to clients
+    unchanged. The ``retry_after`` attribute holds the seconds until the
+    circuit lets a trial call through.
+    """
+
+    def __init__(
+        self, detail: Optional[str] = None, retry_after: float = 0.0
+    ) -> None:
+        """Initialize the error with the time left until a trial call."""
+        super().__init__(detail)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Fail fast once too many responses from an upstream are failures.
+
+    Outcomes are recorded as status codes, classes or raised HTTPStatus
+    exceptions, and counted per category over a sliding window. The circuit
+    moves through three states:
+
+    - closed: calls are allowed. Once at least `min_calls` outcomes are in
+      the window and the share of failures reaches `threshold`, it opens.
+    - open: calls are refused for `reset_timeout` seconds, then it becomes
+      half-open.
+    - half-open: up to `half_open_calls` trial calls are allowed. The first
+      outcome closes the circuit if it succeeded, or opens it again if not.
+
+    Checking a closed circuit takes no lock; recording an outcome and
+    changing state take one short lock, so a breaker can be shared between
+    threads and asyncio tasks.
+
+    Examples:
+        >>> breaker = CircuitBreaker(threshold=0.5, min_calls=10)
+        >>> with breaker:  # raises CircuitOpenError if the circuit is open
+        ...     response = call_upstream()  # may raise HTTPStatus exceptions
+        >>> breaker.record(response.status)  # or record codes directly
+        >>> breaker.state
+        <CircuitState.CLOSED: 'closed'>
+    """
+
+    __slots__ = (
+        "_clock",
+        "_half_open_calls",
+        "_lock",
+        "_min_calls",
+        "_opened_at",
+        "_probes",
+        "_reset_timeout",
+        "_state",
+        "_table",
+        "_threshold",
+        "_trip_categories",
+        "_trip_codes",
+        "_window",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        threshold: float = 0.5,
+        *,
+        trip_on: Optional[Iterable[Union[StatusValue, StatusCategory]]] = None,
+        window: float = 10.0,
+        granularity: float = 1.0,
+        min_calls: int = 20,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a closed circuit breaker.
+
+        Args:
+            threshold: Share of failures, above 0 and at most 1, that opens
+                the circuit.
+            trip_on: Statuses (ints, classes or instances) and
+                StatusCategory members counted as failures. Defaults to
+                server errors and 429 Too Many Requests.
+            window: Length of the sliding window in seconds.
+            granularity: Length of each window bucket in seconds.
+            min_calls: Outcomes needed in the window before it can open.
+            reset_timeout: Seconds the circuit stays open.
+            half_open_calls: Trial calls allowed while half-open.
+            clock: Function returning the current time in seconds.
+
+        Raises:
+            TypeError: If an item of `trip_on` is not a supported type.
+            ValueError: If an argument is out of range.
+        """
+        if not 0 < threshold <= 1:
+            msg = "threshold must be above 0 and at most 1"
+            raise ValueError(msg)
+        if min_calls < 1 or half_open_calls < 1 or reset_timeout < 0:
+            msg = (
+                "min_calls and half_open_calls must be at least 1 and "
+                "reset_timeout non-negative"
+            )
+            raise ValueError(msg)
+        items = tuple(_DEFAULT_TRIP_ON if trip_on is None else trip_on)
+        self._table = _status_table(items)
+        categories = {
+            item for item in items if isinstance(item, StatusCategory)
+        }
+        # Codes already covered by a category are counted through it.
+        codes = {
+            code
+            for code, flag in enumerate(self._table)
+            if flag and _CATEGORY_TABLE[code] not in categories
+        }
+        self._trip_categories = tuple(sorted(categories))
+        self._trip_codes = tuple(sorted(codes))
+        self._window = ErrorRateWindow(
+            window, granularity, per_code=bool(codes), clock=clock
+        )
+        self._threshold = threshold
+        self._min_calls = min_calls
+        self._reset_timeout = reset_timeout
+        self._half_open_calls = half_open_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def _failures(self) -> int:
+        """Return the number of failures within the window."""
+        window = self._window
+        failures = 0
+        for category in self._trip_categories:
+            failures += window.category_count(category)
+        for code in self._trip_codes:
+            failures += window.code_count(code)
+        return failures
+
+    def _open(self) -> None:
+        """Open the circuit, starting the reset timeout."""
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probes = 0
+
+    def _close(self) -> None:
+        """Close the circuit and forget the outcomes that opened it."""
+        self._state = CircuitState.CLOSED
+        self._window.reset()
+        self._probes = 0
+
+    def _current_state(self) -> CircuitState:
+        """Return the state, moving from open to half-open on timeout."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        with self._lock:
+            return self._current_state()
+
+    def is_failure(self, value: StatusValue) -> bool:
+        """Return True if `value` counts as a failure for this breaker."""
+        code = value if type(value) is int else _get_status_code(value)
+        return 0 <= code < _REGISTRY_SIZE and self._table[code] == 1
+
+    def record(self, value: StatusValue) -> None:
+        """Record the outcome of a call to the upstream.
+
+        Args:
+            value: The response status as an int, class or instance, such
+                as a raised HTTPStatus exception.
+
+        Raises:
+            TypeError: If `value` is not a supported type.
+        """
+        code = value if type(value) is int else _get_status_code(value)
+        failed = 0 <= code < _REGISTRY_SIZE and self._table[code] == 1
+        with self._lock:
+            self._window.record(code)
+            state = self._current_state()
+            if state is CircuitState.HALF_OPEN:
+                if failed:
+                    self._open()
+                else:
+                    self._close()
+            elif failed and state is CircuitState.CLOSED:
+                total = self._window.total()
+                if (
+                    total >= self._min_calls
+                    and self._failures() >= self._threshold * total
+                ):
+                    self._open()
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be made now.
+
+        While half-open, each True return reserves one of the trial calls,
+        whose outcome should then be recorded.
+        """
+        if self._state is CircuitState.CLOSED:
+            return True
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return True
+            if state is CircuitState.OPEN:
+                return False
+            if self._probes < self._half_open_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def _open_error(self) -> CircuitOpenError:
+        """Build the error raised for a refused call."""
+        remaining = self._reset_timeout - (self._clock() - self._opened_at)
+        return CircuitOpenError("circuit open", max(0.0, remaining))
+
+    def _release(self) -> None:
+        """Give back a trial call that ended without a status."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def failure_rate(self) -> float:
+        """Return the share of failures within the window."""
+        with self._lock:
+            total = self._window.total()
+            return self._failures() / total if total else 0.0
+
+    def category_counts(self) -> dict[StatusCategory, int]:
+        """Return the count of outcomes per category within the window."""
+        with self._lock:
+            return self._window.category_counts()
+
+    def reset(self) -> None:
+        """Close the circuit and discard every recorded outcome."""
+        with self._lock:
+            self._close()
+
+    def __enter__(self) -> CircuitBreaker:  # noqa: PYI034
+        """Start a call, raising CircuitOpenError if it is not allowed.
+
+        A block that exits normally is recorded as a success, and one that
+        raises an HTTPStatus exception is recorded with that status. Other
+        exceptions are not recorded.
+        """
+        if not self.allow_request():
+            raise self._open_error()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Record the outcome of the call; exceptions are never suppressed."""
+        if exc is None:
+            self.record(_SUCCESS_CODE)
+        elif isinstance(exc, HTTPStatus):
+            self.record(exc)
+        else:
+            self._release()
+
+    async def __aenter__(self) -> CircuitBreaker:  # noqa: PYI034
+        """Start a call from a coroutine, like ``__enter__``."""
+        return self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Record the outcome of the call, like ``__exit__``."""
+        self.__exit__(exc_type, exc, traceback)
+
+    def __repr__(self) -> str:
+        """Return a representation showing the state and threshold."""
+        return (
+            f"<{type(self).__name__} state={self.state.value!r} "
+            f"threshold={self._threshold!r}>"
+        )
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+]
@@ -6,6 +6,162 @@ functions that form the foundation of the response_codes package.
 
 from __future__ import annotations
 
+# The names used in annotations are imported at runtime, so
+# typing.get_type_hints() can resolve them on the public classes.
+from collections.abc import Mapping  # noqa: TC003
+from importlib import import_module
+from sys import intern
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Union
+
+if TYPE_CHECKING:
+    from ._is_category import StatusCategory
+    from ._json import _JsonTemplate
+
+# Size of the flat code-to-class table. Every valid HTTP status code is a
+# three-digit number, so slots 0-999 cover the whole space.
+_REGISTRY_SIZE = 1000
+
+# Flat table indexed directly by status code, populated by HTTPStatusMeta as
+# each concrete status class is created.
+_REGISTRY: list[Optional[type[HTTPStatus]]] = [None] * _REGISTRY_SIZE
+
+# Reverse index from reason phrase to status class. Each registered message is
+# stored both verbatim and in normalised form (see _normalise_message).
+_MESSAGE_INDEX: dict[str, type[HTTPStatus]] = {}
+
+
+# Modules defining the built-in status classes. The package imports them
+# lazily, so registry lookups load them on demand before reporting a miss.
+_STATUS_MODULES = (
+    "response_codes._1xx_informational",
+    "response_codes._2xx_success",
+    "response_codes._3xx_redirection",
+    "response_codes._4xx_client_errors",
+    "response_codes._5xx_server_errors",
+)
+_registry_loaded = False
+
+# Called with every new status instance while instrumentation is enabled (see
+# _instrument.RaiseInstrument). None when disabled, so HTTPStatus.__init__
+# pays for a single global check.
+_raise_hook: Optional[Callable[[HTTPStatus], object]] = None
+
+
+def _load_registry() -> None:
+    """Import every built-in status module so the registry is complete."""
+    global _registry_loaded  # noqa: PLW0603
+    if not _registry_loaded:
+        for module_name in _STATUS_MODULES:
+            import_module(module_name)
+        _registry_loaded = True
+
+
+def _set_raise_hook(
+    hook: Optional[Callable[[HTTPStatus], object]],
+) -> Optional[Callable[[HTTPStatus], object]]:
+    """Install the hook called for every new status instance.
+
+    Args:
+        hook: The new hook, or None to disable the hook.
+
+    Returns:
+        The previously installed hook, or None.
+    """
+    global _raise_hook  # noqa: PLW0603
+    previous = _raise_hook
+    _raise_hook = hook
+    return previous
+
+
+def _normalise_message(message: str) -> str:
+    """Return the case-folded, whitespace-normalised form of a message."""
+    return " ".join(message.split()).casefold()
+
+
+class StatusCode(int):
+    """An HTTP status code as a plain ``int`` value.
+
+    Comparisons, hashing and arithmetic are inherited unchanged from
+    ``int``, so they run at C speed, and the value can be used anywhere an
+    integer is expected (``struct.pack``, ``array``, indexing). One instance
+    is interned per code, reachable from a status class as
+    ``HTTP_404_NOT_FOUND.code``.
+
+    Examples:
+        >>> code = HTTP_404_NOT_FOUND.code
+        >>> code == 404
+        True
+        >>> code.message
+        'Not Found'
+    """
+
+    __slots__ = ()
+
+    @property
+    def status_class(self) -> Optional[type[HTTPStatus]]:
+        """The status class registered for this code, if any."""
+        return lookup(self)
+
+    @property
+    def message(self) -> str:
+        """The reason phrase of the registered class ("" if unregistered)."""
+        status_class = lookup(self)
+        return "" if status_class is None else status_class.message
+
+    @property
+    def category(self) -> StatusCategory:
+        """The StatusCategory this code falls into."""
+        from ._is_category import category_of  # noqa: PLC0415
+
+        return category_of(self)
+
+    def __repr__(self) -> str:
+        """Return a representation such as ``StatusCode(404)``."""
+        return f"{type(self).__name__}({int(self)})"
+
+    __str__ = int.__repr__
+
+    def __reduce__(self) -> tuple[object, tuple[int]]:
+        """Unpickle to the interned instance for the code."""
+        return (_intern_code, (int(self),))
+
+
+# Interned StatusCode instances, indexed by code.
+_CODES: list[Optional[StatusCode]] = [None] * _REGISTRY_SIZE
+
+
+def _intern_code(code: int) -> StatusCode:
+    """Return the interned StatusCode for `code`."""
+    if not 0 <= code < _REGISTRY_SIZE:
+        return StatusCode(code)
+    value = _CODES[code]
+    if value is None:
+        value = _CODES[code] = StatusCode(code)
+    return value
+
+
+# HTTP versions whose status lines status_line() can render.
+_STATUS_LINE_VERSIONS = (b"1.0", b"1.1")
+
+
+def _render_status_line(code: int, message: str, version: bytes) -> bytes:
+    """Encode an HTTP/1.x status line, including the trailing CRLF.
+
+    Characters in the reason phrase that latin-1 cannot encode are sent as
+    ``?``.
+    """
+    reason = message.encode("latin-1", errors="replace")
+    return b"HTTP/%b %03d %b\r\n" % (version, code, reason)
+
+
+def _register(status_class: type[HTTPStatus], code: int) -> None:
+    """Add a status class to the code table and reason-phrase index."""
+    _REGISTRY[code] = status_class
+    message = status_class.message
+    if message:
+        for key in (message, _normalise_message(message)):
+            _MESSAGE_INDEX.setdefault(key, status_class)
+
 
 class HTTPStatusMeta(type):
     """Base meta-class for HTTP status code exceptions.
@@ -16,6 +172,11 @@ class HTTPStatusMeta(type):
         status_code (int): The numeric HTTP status code
         message (str): The standard HTTP status message
         description (str): A detailed description of the status code
+        code (StatusCode): The status code as an interned ``int`` value
+        retryable (bool): Whether a request failing with this status may
+            be retried
+        wsgi_status (str): The status string passed to a WSGI
+            ``start_response`` callable, such as ``"404 Not Found"``
     """
 
     def __init__(
@@ -30,6 +191,30 @@ class HTTPStatusMeta(type):
             cls.message = ""
         if not hasattr(cls, "description"):
             cls.description = ""
+        if not hasattr(cls, "retryable"):
+            cls.retryable = False
+        if "code" not in namespace and isinstance(cls.status_code, int):
+            cls.code = _intern_code(cls.status_code)
+        if "wsgi_status" not in namespace:
+            # Interned, so every response with this status shares one string.
+            cls.wsgi_status = intern(
+                f"{int(cls.status_code):03d} {cls.message}"
+            )
+        # Filled on first use by status_line(), keyed by HTTP version.
+        cls._status_lines: dict[bytes, bytes] = {}
+        # Filled on first use by the JSON renderer, keyed by whether the
+        # description is included.
+        cls._json_templates: dict[bool, _JsonTemplate] = {}
+        # Register classes that define their own status code. The first class
+        # registered for a code wins, so subclasses of a built-in status (or a
+        # redefinition in user code) never shadow the standard class.
+        code = namespace.get("status_code")
+        if isinstance(code, int) and 0 < code < _REGISTRY_SIZE:
+            # Built-in classes always register before user-defined ones.
+            if cls.__module__ not in _STATUS_MODULES:
+                _load_registry()
+            if _REGISTRY[code] is None:
+                _register(cls, code)  # type: ignore[arg-type]
 
     def __int__(cls) -> int:
         """Convert the status code to an integer.
@@ -39,6 +224,42 @@ class HTTPStatusMeta(type):
         """
         return cls.status_code
 
+    def __index__(cls) -> int:
+        """Return the status code, so the class can be used as an index.
+
+        Returns:
+            int: The numeric HTTP status code
+        """
+        return cls.status_code
+
+    def status_line(cls, version: bytes = b"1.1") -> bytes:
+        """Return the encoded status line for this status.
+
+        Each line is rendered on first use and cached on the class, so
+        response writers can send the returned bytes as-is on every
+        response. Reason-phrase characters outside latin-1 are sent as
+        ``?``.
+
+        Args:
+            version: The HTTP version, either ``b"1.0"`` or ``b"1.1"``.
+
+        Returns:
+            bytes: The status line, such as ``HTTP/1.1 404 Not Found``
+                followed by CRLF.
+
+        Raises:
+            ValueError: If `version` is not a supported HTTP/1.x version.
+        """
+        line = cls._status_lines.get(version)
+        if line is None:
+            if version not in _STATUS_LINE_VERSIONS:
+                msg = f"unsupported HTTP version {version!r}"
+                raise ValueError(msg)
+            line = cls._status_lines[version] = _render_status_line(
+                int(cls.status_code), cls.message, version
+            )
+        return line
+
     def __str__(cls) -> str:
         """Convert the status code to a string.
 
@@ -130,6 +351,48 @@ class HTTPStatusMeta(type):
         return hash(cls.status_code)
 
 
+def _build_json_template(
+    status: Union[HTTPStatus, type[HTTPStatus]], *, description: bool
+) -> _JsonTemplate:
+    """Build and cache the JSON template for the class of `status`."""
+    from ._json import _JsonTemplate  # noqa: PLC0415
+
+    status_class = status if isinstance(status, type) else type(status)
+    template = _JsonTemplate(status_class, description=description)
+    status_class._json_templates[description] = template  # noqa: SLF001
+    return template
+
+
+if TYPE_CHECKING:
+    # Type checkers see classmethod, which binds away the first argument on
+    # both class and instance access, so the wrapped methods keep their real
+    # signatures instead of becoming Callable[..., Any].
+    _hybridmethod = classmethod
+else:
+
+    class _hybridmethod:
+        """Method that binds to the class or the instance it is accessed on.
+
+        A plain method on HTTPStatus would shadow a metaclass method of the
+        same name on class access, so methods usable in both ways go through
+        this.
+        """
+
+        __slots__ = ("__func__",)
+
+        def __init__(self, func: Callable[..., Any]) -> None:
+            """Wrap `func`, which takes a status class or instance first."""
+            self.__func__ = func
+
+        def __get__(
+            self, instance: Optional[object], owner: type
+        ) -> Callable[..., Any]:
+            """Bind the wrapped function to `instance`, or to `owner`."""
+            return self.__func__.__get__(
+                owner if instance is None else instance, owner
+            )
+
+
 class HTTPStatus(Exception, metaclass=HTTPStatusMeta):
     """Base class for HTTP status code exceptions.
 
@@ -140,6 +403,9 @@ class HTTPStatus(Exception, metaclass=HTTPStatusMeta):
         status_code (int): The numeric HTTP status code
         message (str): The standard HTTP status message
         description (str): A detailed description of the status code
+        code (StatusCode): The status code as an interned ``int`` value
+        retryable (bool): Whether a request failing with this status may
+            be retried
 
     Examples:
         >>> status = HTTP_404_NOT_FOUND()
@@ -152,10 +418,263 @@ class HTTPStatus(Exception, metaclass=HTTPStatusMeta):
     status_code: int = 0
     message: str = ""
     description: str = ""
+    retryable: bool = False
+    wsgi_status: str = "000 "
+    detail: Optional[str] = None
+    code: StatusCode
+    if TYPE_CHECKING:
+        # Set by the metaclass. Declared for type checkers only, as the JSON
+        # module is imported on first use.
+        _json_templates: ClassVar[dict[bool, _JsonTemplate]]
+
+    def __init__(self, detail: Optional[str] = None) -> None:
+        """Initialize the HTTP status exception with a formatted message.
 
-    def __init__(self) -> None:
-        """Initialize the HTTP status exception with a formatted message."""
+        Args:
+            detail: Optional explanation specific to this occurrence, which
+                is included in serialized error bodies.
+        """
         super().__init__(self.message)
+        self.detail = detail
+        if _raise_hook is not None:
+            _raise_hook(self)
+
+    def __reduce__(self) -> Union[str, tuple[object, ...]]:
+        """Pickle registered statuses as their code and detail only.
+
+        Instances of registered classes are rebuilt from the registry when
+        unpickled, so the class path is never written out. Any other
+        instance attributes are kept as pickled state. Unpickling does not
+        call the constructor, so it is not reported to the raise hook.
+        """
+        status_class = type(self)
+        code = status_class.status_code
+        if not (0 < code < _REGISTRY_SIZE and _REGISTRY[code] is status_class):
+            return (_new_status, (status_class,), self.__dict__)
+        args = (code,) if self.detail is None else (code, self.detail)
+        state = {k: v for k, v in self.__dict__.items() if k != "detail"}
+        if state:
+            return (_rebuild_status, args, state)
+        return (_rebuild_status, args)
+
+    @_hybridmethod
+    def to_json(
+        self: Union[HTTPStatus, type[HTTPStatus]],
+        detail: Optional[str] = None,
+        *,
+        description: bool = False,
+    ) -> str:
+        """Serialize the status as a JSON error body.
+
+        Works on both the class and an instance. The constant fields are
+        encoded once per class and cached; only `detail` is encoded per
+        call.
+
+        Args:
+            detail: Detail text to include. Defaults to the instance's
+                ``detail``, if any.
+            description: Whether to include the status description.
+
+        Returns:
+            str: A document such as
+                ``{"error_code": 404, "message": "Not Found"}``
+
+        Examples:
+            >>> HTTP_404_NOT_FOUND.to_json()
+            '{"error_code": 404, "message": "Not Found"}'
+            >>> HTTP_404_NOT_FOUND("gone").to_json()
+            '{"error_code": 404, "message": "Not Found", "detail": "gone"}'
+        """
+        template = self._json_templates.get(description)
+        if template is None:
+            template = _build_json_template(self, description=description)
+        return template.render(self.detail if detail is None else detail)
+
+    @_hybridmethod
+    def to_json_bytes(
+        self: Union[HTTPStatus, type[HTTPStatus]],
+        detail: Optional[str] = None,
+        *,
+        description: bool = False,
+    ) -> bytes:
+        """Serialize the status as a UTF-8 encoded JSON error body.
+
+        Takes the same arguments as to_json(), and returns bytes ready to
+        write to a response body.
+
+        Returns:
+            bytes: The encoded JSON document.
+        """
+        template = self._json_templates.get(description)
+        if template is None:
+            template = _build_json_template(self, description=description)
+        return template.render_bytes(self.detail if detail is None else detail)
+
+    @_hybridmethod
+    def to_problem_json(
+        self: Union[HTTPStatus, type[HTTPStatus]],
+        detail: Optional[str] = None,
+        *,
+        instance: Optional[str] = None,
+        extensions: Optional[Mapping[str, object]] = None,
+    ) -> bytes:
+        """Serialize the status as an RFC 9457 Problem Details document.
+
+        Works on both the class and an instance, with the problem type
+        ``about:blank``. Use a ProblemRenderer to configure a type URI base
+        or to stream the document into an output buffer.
+
+        Args:
+            detail: Explanation specific to this occurrence. Defaults to the
+                instance's ``detail``, if any.
+            instance: URI reference identifying this occurrence.
+            extensions: Extra members to include, with JSON-serializable
+                values.
+
+        Returns:
+            bytes: The encoded ``application/problem+json`` document.
+        """
+        from ._problem import _DEFAULT_RENDERER  # noqa: PLC0415
+
+        return _DEFAULT_RENDERER.render(
+            self, detail, instance=instance, extensions=extensions
+        )
+
+
+# Category bases. They define no status code, so they are never registered;
+# every built-in status derives from the one matching its range, which lets
+# a single ``except`` clause (one subclass check) catch a whole category.
+# Subclasses are expected to keep a code within their base's range.
+
+
+class InformationalStatus(HTTPStatus):
+    """Base class of the 1xx informational statuses."""
+
+
+class SuccessStatus(HTTPStatus):
+    """Base class of the 2xx success statuses."""
+
+
+class RedirectionStatus(HTTPStatus):
+    """Base class of the 3xx redirection statuses."""
+
+
+class ClientErrorStatus(HTTPStatus):
+    """Base class of the 4xx client error statuses.
+
+    Examples:
+        >>> try:
+        ...     raise HTTP_404_NOT_FOUND
+        ... except ClientErrorStatus as exc:
+        ...     exc.status_code
+        404
+    """
+
+
+class ServerErrorStatus(HTTPStatus):
+    """Base class of the 5xx server error statuses."""
+
+
+def _new_status(
+    status_class: type[HTTPStatus], detail: Optional[str] = None
+) -> HTTPStatus:
+    """Create a status instance without calling its constructor.
+
+    Used when unpickling, so statuses received from another process are not
+    reported to the raise hook as raised here.
+    """
+    exc = status_class.__new__(status_class)
+    Exception.__init__(exc, status_class.message)
+    exc.detail = detail
+    return exc
+
+
+def _rebuild_status(code: int, detail: Optional[str] = None) -> HTTPStatus:
+    """Recreate a pickled status instance from its registered code."""
+    return _new_status(from_code(code), detail)
+
+
+def lookup(code: int) -> Optional[type[HTTPStatus]]:
+    """Return the status class registered for a numeric status code.
+
+    This is a single index into a flat table, so it is cheap enough to call
+    for every response handled.
+
+    Args:
+        code: The numeric HTTP status code.
+
+    Returns:
+        The registered HTTPStatus subclass, or None if no class is
+        registered for the code.
+    """
+    if 0 <= code < _REGISTRY_SIZE:
+        status_class = _REGISTRY[code]
+        if status_class is None and not _registry_loaded:
+            _load_registry()
+            status_class = _REGISTRY[code]
+        return status_class
+    return None
+
+
+def from_code(
+    code: int, default: Optional[type[HTTPStatus]] = None
+) -> type[HTTPStatus]:
+    """Return the status class for a numeric status code.
+
+    Args:
+        code: The numeric HTTP status code.
+        default: Fallback class returned when no class is registered for
+            the code.
+
+    Returns:
+        The registered HTTPStatus subclass, or `default` if given.
+
+    Raises:
+        ValueError: If no class is registered for the code and no `default`
+            was given.
+    """
+    status_class = lookup(code)
+    if status_class is not None:
+        return status_class
+    if default is not None:
+        return default
+    msg = f"{code!r} is not a registered HTTP status code"
+    raise ValueError(msg)
+
+
+def from_message(
+    message: str, default: Optional[type[HTTPStatus]] = None
+) -> type[HTTPStatus]:
+    """Return the status class for a reason phrase.
+
+    Exact phrases such as ``"Not Found"`` resolve with a single hash probe.
+    Otherwise the phrase is matched case-insensitively with runs of
+    whitespace collapsed, so ``"  not   FOUND "`` also resolves.
+
+    Args:
+        message: The HTTP reason phrase.
+        default: Fallback class returned when no class is registered for
+            the phrase.
+
+    Returns:
+        The registered HTTPStatus subclass, or `default` if given.
+
+    Raises:
+        ValueError: If no class is registered for the phrase and no
+            `default` was given.
+    """
+    status_class = _MESSAGE_INDEX.get(message)
+    if status_class is None:
+        _load_registry()
+        status_class = _MESSAGE_INDEX.get(message) or _MESSAGE_INDEX.get(
+            _normalise_message(message)
+        )
+    if status_class is not None:
+        return status_class
+    if default is not None:
+        return default
+    msg = f"{message!r} is not a registered HTTP reason phrase"
+    raise ValueError(msg)
 
 
 # Utility function to create custom groups
@@ -179,7 +698,16 @@ def create_status_group(
 
 
 __all__ = [
+    "ClientErrorStatus",
     "HTTPStatus",
     "HTTPStatusMeta",
+    "InformationalStatus",
+    "RedirectionStatus",
+    "ServerErrorStatus",
+    "StatusCode",
+    "SuccessStatus",
     "create_status_group",
+    "from_code",
+    "from_message",
+    "lookup",
 ]
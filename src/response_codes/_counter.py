@@ -0,0 +1,201 @@
+"""Fixed-size counter of HTTP status codes.
+
+This module contains StatusCounter, a counter backed by a flat array with one
+slot per status code, so counting never hashes a key.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+from typing import TYPE_CHECKING, Optional, Union
+
+from ._core import _REGISTRY, _REGISTRY_SIZE, HTTPStatus, _load_registry
+from ._is_category import (
+    _CATEGORY_BOUNDS,
+    StatusCategory,
+    StatusValue,
+    _as_code_buffer,
+    _get_status_code,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+def _counter_index(value: StatusValue) -> int:
+    """Return the array slot for a status value.
+
+    Raises:
+        TypeError: If `value` is not a supported type.
+        ValueError: If the code is outside the range 0-999.
+    """
+    code = value if type(value) is int else _get_status_code(value)
+    if not 0 <= code < _REGISTRY_SIZE:
+        msg = f"status code {code!r} is outside the range 0-999"
+        raise ValueError(msg)
+    return code
+
+
+class StatusCounter:
+    """Count HTTP responses by status code.
+
+    Counts live in a 1000-slot ``array('Q')`` indexed directly by status code,
+    so ``add()`` is a single array increment. Codes are accepted as an
+    ``int``, a status class, or a status instance.
+
+    Examples:
+        >>> counter = StatusCounter()
+        >>> counter.add(404)
+        >>> counter.add(HTTP_404_NOT_FOUND)
+        >>> counter[404]
+        2
+        >>> counter.most_common(1)
+        [(<class '...HTTP_404_NOT_FOUND'>, 2)]
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, codes: Optional[Iterable[StatusValue]] = None) -> None:
+        """Create an empty counter, optionally counting `codes` straight away.
+
+        Args:
+            codes: Status values to count, accepted in any form add_many()
+                supports.
+        """
+        self._counts = array("Q", bytes(8 * _REGISTRY_SIZE))
+        if codes is not None:
+            self.add_many(codes)
+
+    def add(self, value: StatusValue, count: int = 1) -> None:
+        """Add `count` occurrences of a status code.
+
+        Args:
+            value: The status code as an int, class or instance.
+            count: The number of occurrences to add.
+
+        Raises:
+            TypeError: If `value` is not a supported type.
+            ValueError: If the code is outside the range 0-999, or `count`
+                is less than 1.
+        """
+        if count < 1:
+            msg = f"count must be at least 1, not {count!r}"
+            raise ValueError(msg)
+        self._counts[_counter_index(value)] += count
+
+    def add_many(self, codes: Iterable[StatusValue]) -> None:
+        """Count every status value in `codes`.
+
+        Items are tallied in C by collections.Counter before being folded into
+        the array, so buffers such as ``array('H')`` and memoryviews are
+        counted without a Python-level loop per item. Buffers are read the
+        same way as by classify_many().
+
+        Args:
+            codes: Any iterable of ints, status classes or status instances,
+                or a buffer of integer codes.
+
+        Every code is checked before any is added, so the counter is left
+        unchanged if an item is rejected.
+
+        Raises:
+            TypeError: If an item is not a supported type.
+            ValueError: If a code is outside the range 0-999.
+        """
+        view = _as_code_buffer(codes)
+        tally = Counter(codes if view is None else view)
+        pending = [
+            (_counter_index(value), count) for value, count in tally.items()
+        ]
+        counts = self._counts
+        for code, count in pending:
+            counts[code] += count
+
+    def merge(self, other: StatusCounter) -> None:
+        """Add every count from `other` into this counter in place."""
+        counts = self._counts
+        for code, count in enumerate(other._counts):
+            if count:
+                counts[code] += count
+
+    def clear(self) -> None:
+        """Reset every count to zero."""
+        self._counts = array("Q", bytes(8 * _REGISTRY_SIZE))
+
+    def total(self) -> int:
+        """Return the total number of counted responses."""
+        return sum(self._counts)
+
+    def category_counts(self) -> dict[StatusCategory, int]:
+        """Return the total count for each status category.
+
+        Codes outside the standard ranges are rolled up into
+        ``StatusCategory.UNKNOWN``.
+        """
+        counts = self._counts
+        rollup = {
+            category: sum(counts[low : high + 1])
+            for category, low, high in _CATEGORY_BOUNDS
+        }
+        rollup[StatusCategory.UNKNOWN] = self.total() - sum(rollup.values())
+        return {category: rollup[category] for category in StatusCategory}
+
+    def most_common(
+        self, n: Optional[int] = None
+    ) -> list[tuple[Union[type[HTTPStatus], int], int]]:
+        """List the most common status codes and their counts.
+
+        Registered codes are returned as their status class; unregistered
+        codes are returned as a plain ``int``.
+
+        Args:
+            n: The number of entries to return. Returns every non-zero entry
+                if None.
+
+        Returns:
+            A list of ``(status, count)`` pairs, most common first.
+        """
+        _load_registry()
+        entries: list[tuple[Union[type[HTTPStatus], int], int]] = []
+        for code, count in enumerate(self._counts):
+            if count:
+                status_class = _REGISTRY[code]
+                entries.append(
+                    (code if status_class is None else status_class, count)
+                )
+        if n is None:
+            return sorted(entries, key=itemgetter(1), reverse=True)
+        return nlargest(n, entries, key=itemgetter(1))
+
+    def __getitem__(self, value: StatusValue) -> int:
+        """Return the count for a status code (0 if never counted)."""
+        code = value if type(value) is int else _get_status_code(value)
+        if 0 <= code < _REGISTRY_SIZE:
+            return self._counts[code]
+        return 0
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate ``(code, count)`` pairs for every non-zero count."""
+        return (
+            (code, count) for code, count in enumerate(self._counts) if count
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if `other` is a StatusCounter with the same counts."""
+        if isinstance(other, StatusCounter):
+            return self._counts == other._counts
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a representation listing the non-zero counts."""
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+__all__ = [
+    "StatusCounter",
+]
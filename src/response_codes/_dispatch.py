@@ -0,0 +1,228 @@
+"""Dispatching status exceptions to handlers.
+
+This module contains StatusDispatcher, which maps status classes, code
+ranges and categories to handlers, compiling the resolution for every
+registered status class into a flat table indexed by status code.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Generic, Optional, TypeVar, Union
+
+from ._core import _REGISTRY, _REGISTRY_SIZE, HTTPStatus, _load_registry
+from ._is_category import _CATEGORY_MEMBERS, StatusCategory, _code_category
+
+_R = TypeVar("_R")
+
+# Marks classes not yet in the per-class cache (None means "no handler").
+_MISSING = object()
+
+_DispatchKey = Union[type[HTTPStatus], StatusCategory, range, int]
+
+
+class StatusDispatcher(Generic[_R]):
+    """Find the handler for a status exception without walking its MRO.
+
+    Handlers are registered under one of four kinds of key, and a status
+    class resolves to the first match in this order:
+
+    1. A status class, matching it and its subclasses. The most specific
+       class in the MRO wins, so a category base such as
+       ClientErrorStatus can be used too.
+    2. A ``range`` of codes, or a single ``int`` code. The narrowest range
+       containing the class's code wins.
+    3. A StatusCategory member, matching every code in that category.
+    4. HTTPStatus itself, matching everything.
+
+    The resolution for every registered status class is compiled into a
+    1000-entry table on first use, so dispatching a built-in status is one
+    index and one identity check. Other classes, such as user subclasses,
+    are resolved once and cached. Registering or removing a handler
+    invalidates both.
+
+    Examples:
+        >>> dispatcher = StatusDispatcher()
+        >>> dispatcher.register(HTTP_404_NOT_FOUND, not_found_page)
+        >>> dispatcher.register(StatusCategory.SERVER_ERROR, error_page)
+        >>> dispatcher.register(HTTPStatus, generic_page)
+        >>> dispatcher.dispatch(HTTP_503_SERVICE_UNAVAILABLE(), request)
+    """
+
+    __slots__ = (
+        "_by_class",
+        "_categories",
+        "_classes",
+        "_default",
+        "_ranges",
+        "_table",
+    )
+
+    def __init__(self) -> None:
+        """Create a dispatcher with no handlers."""
+        self._classes: dict[type[HTTPStatus], Callable[..., _R]] = {}
+        self._ranges: dict[range, Callable[..., _R]] = {}
+        self._categories: dict[StatusCategory, Callable[..., _R]] = {}
+        self._default: Optional[Callable[..., _R]] = None
+        self._table: Optional[
+            list[Optional[tuple[type[HTTPStatus], Optional[Callable[..., _R]]]]]
+        ] = None
+        self._by_class: dict[type[HTTPStatus], object] = {}
+
+    @staticmethod
+    def _range_key(key: Union[range, int]) -> range:
+        """Normalise a code or range key, validating it.
+
+        Raises:
+            ValueError: If the range is empty or has a step other than 1.
+        """
+        if isinstance(key, int):
+            return range(key, key + 1)
+        if not key or key.step != 1:
+            msg = "code ranges must be non-empty with a step of 1"
+            raise ValueError(msg)
+        return key
+
+    def register(self, key: _DispatchKey, handler: Callable[..., _R]) -> None:
+        """Register a handler, replacing any handler for the same key.
+
+        Args:
+            key: A status class, a StatusCategory member, a ``range`` of
+                codes or a single code, or HTTPStatus for every status.
+            handler: Called by dispatch() with the exception and any extra
+                arguments.
+
+        Raises:
+            TypeError: If `key` is not a supported kind of key.
+            ValueError: If `key` is an empty range or has a step other
+                than 1.
+        """
+        if key is HTTPStatus:
+            self._default = handler
+        elif isinstance(key, StatusCategory):
+            self._categories[key] = handler
+        elif isinstance(key, type) and issubclass(key, HTTPStatus):
+            self._classes[key] = handler
+        elif isinstance(key, (range, int)) and not isinstance(key, bool):
+            self._ranges[self._range_key(key)] = handler
+        else:
+            msg = "key must be a status class, StatusCategory, range or int"
+            raise TypeError(msg)
+        self._invalidate()
+
+    def handles(
+        self, key: _DispatchKey
+    ) -> Callable[[Callable[..., _R]], Callable[..., _R]]:
+        """Return a decorator registering the decorated function for `key`.
+
+        Examples:
+            >>> @dispatcher.handles(range(400, 500))
+            ... def client_error(exc, request): ...
+        """
+
+        def decorator(handler: Callable[..., _R]) -> Callable[..., _R]:
+            self.register(key, handler)
+            return handler
+
+        return decorator
+
+    def unregister(self, key: _DispatchKey) -> None:
+        """Remove the handler registered for `key`.
+
+        Raises:
+            KeyError: If no handler is registered for `key`.
+        """
+        if key is HTTPStatus:
+            if self._default is None:
+                raise KeyError(key)
+            self._default = None
+        elif isinstance(key, StatusCategory):
+            del self._categories[key]
+        elif isinstance(key, type):
+            del self._classes[key]
+        else:
+            del self._ranges[self._range_key(key)]
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Discard the compiled table and the per-class cache."""
+        self._table = None
+        self._by_class = {}
+
+    def _resolve(
+        self, status_class: type[HTTPStatus]
+    ) -> Optional[Callable[..., _R]]:
+        """Find the handler for a status class by walking the rules."""
+        classes = self._classes
+        for klass in status_class.__mro__:
+            if klass is HTTPStatus:
+                break
+            handler = classes.get(klass)
+            if handler is not None:
+                return handler
+        code = status_class.status_code
+        best: Optional[range] = None
+        for codes in self._ranges:
+            if code in codes and (best is None or len(codes) < len(best)):
+                best = codes
+        if best is not None:
+            return self._ranges[best]
+        handler = self._categories.get(_CATEGORY_MEMBERS[_code_category(code)])
+        if handler is not None:
+            return handler
+        return self._default
+
+    def _compile(
+        self,
+    ) -> list[Optional[tuple[type[HTTPStatus], Optional[Callable[..., _R]]]]]:
+        """Build the code-indexed table for every registered status class."""
+        _load_registry()
+        table = [
+            None
+            if status_class is None
+            else (status_class, self._resolve(status_class))
+            for status_class in _REGISTRY
+        ]
+        self._table = table
+        return table
+
+    def resolve(
+        self, status: Union[HTTPStatus, type[HTTPStatus]]
+    ) -> Optional[Callable[..., _R]]:
+        """Return the handler for a status class or instance, or None."""
+        status_class = status if isinstance(status, type) else type(status)
+        table = self._table
+        if table is None:
+            table = self._compile()
+        code = status_class.status_code
+        if 0 <= code < _REGISTRY_SIZE:
+            entry = table[code]
+            if entry is not None and entry[0] is status_class:
+                return entry[1]
+        handler = self._by_class.get(status_class, _MISSING)
+        if handler is _MISSING:
+            handler = self._by_class[status_class] = self._resolve(status_class)
+        return handler  # type: ignore[return-value]
+
+    def dispatch(
+        self,
+        exc: HTTPStatus,
+        *args: object,
+        **kwargs: object,
+    ) -> _R:
+        """Call the handler for `exc` with it and any extra arguments.
+
+        Returns:
+            The handler's return value.
+
+        Raises:
+            HTTPStatus: `exc` itself, if no handler matches it.
+        """
+        handler = self.resolve(exc)
+        if handler is None:
+            raise exc
+        return handler(exc, *args, **kwargs)
+
+
+__all__ = [
+    "StatusDispatcher",
+]
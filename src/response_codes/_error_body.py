@@ -0,0 +1,46 @@
+"""Error response bodies shared by the ASGI and WSGI middleware."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from ._5xx_server_errors import HTTP_500_INTERNAL_SERVER_ERROR
+from ._problem import PROBLEM_JSON_MEDIA_TYPE
+
+if TYPE_CHECKING:
+    from ._core import HTTPStatus
+    from ._problem import ProblemRenderer
+
+_JSON_MEDIA_TYPE = "application/json"
+
+# Statuses whose responses must not have a body (RFC 9110, 6.4.1).
+_NO_BODY_CODES = frozenset({204, 304})
+
+
+def _render_error_body(
+    status: type[HTTPStatus],
+    detail: Optional[str],
+    problem_renderer: Optional[ProblemRenderer],
+) -> tuple[type[HTTPStatus], str, bytes]:
+    """Render the body of an error response for a status class.
+
+    Classes without a valid status code (such as HTTPStatus itself) are
+    sent as 500 Internal Server Error.
+
+    Returns:
+        The class to respond with, the body's media type, and the body.
+        The media type and body are empty for 1xx, 204 and 304 responses.
+    """
+    code = status.status_code
+    if not 100 <= code < 1000:  # noqa: PLR2004
+        status = HTTP_500_INTERNAL_SERVER_ERROR
+        code = status.status_code
+    if code < 200 or code in _NO_BODY_CODES:  # noqa: PLR2004
+        return status, "", b""
+    if problem_renderer is not None:
+        return (
+            status,
+            PROBLEM_JSON_MEDIA_TYPE,
+            problem_renderer.render(status, detail),
+        )
+    return status, _JSON_MEDIA_TYPE, status.to_json_bytes(detail)
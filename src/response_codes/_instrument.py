@@ -0,0 +1,218 @@
+"""Counting the statuses a program raises, and where it raises them.
+
+This module contains RaiseInstrument, which hooks HTTPStatus creation to
+count statuses per class and sample the code raising them.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import deque
+from operator import itemgetter
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+
+from . import _core
+from ._core import HTTPStatus, _set_raise_hook
+
+if TYPE_CHECKING:
+    from types import FrameType, TracebackType
+
+# Serialises installing and removing the hook.
+_HOOK_LOCK = threading.Lock()
+
+
+class RaiseSample(NamedTuple):
+    """A sampled status and the code that created it.
+
+    Attributes:
+        status_class: The class of the status.
+        detail: The status's detail, if any.
+        filename: The file of the calling code.
+        lineno: The line of the calling code.
+        function: The name of the calling function.
+        thread_id: The identifier of the thread that created the status.
+    """
+
+    status_class: type[HTTPStatus]
+    detail: Optional[str]
+    filename: str
+    lineno: int
+    function: str
+    thread_id: int
+
+
+class RaiseInstrument:
+    """Count the statuses created by a program, sampling where they come from.
+
+    While enabled, every HTTPStatus instance is counted against its class
+    as it is created, which covers ``raise HTTP_404_NOT_FOUND`` and
+    ``raise HTTP_404_NOT_FOUND("detail")`` alike. Every `sample_every`-th
+    status is also recorded as a RaiseSample naming the function and line
+    that created it, and passed to `sink`. By default samples are kept in
+    the bounded `samples` deque.
+
+    While disabled, the cost to each status is one global check in
+    ``HTTPStatus.__init__``. Only one instrument can be enabled at a time.
+
+    Counts are read with counts() and total(), which copy the current values
+    without locking, so they can be called from another thread while
+    statuses are being raised. Counting takes no lock either; threads racing
+    to count the same class may very occasionally lose an increment.
+
+    Examples:
+        >>> with RaiseInstrument(sample_every=100) as instrument:
+        ...     handle_requests()
+        >>> instrument.counts()
+        [(<class '...HTTP_404_NOT_FOUND'>, 312), ...]
+        >>> instrument.samples[0].function
+        'get_user'
+    """
+
+    __slots__ = (
+        "_countdown",
+        "_counts",
+        "_sample_every",
+        "_sink",
+        "samples",
+        "sink_errors",
+    )
+
+    def __init__(
+        self,
+        *,
+        sample_every: int = 0,
+        sink: Optional[Callable[[RaiseSample], object]] = None,
+        max_samples: int = 100,
+    ) -> None:
+        """Create a disabled instrument.
+
+        Args:
+            sample_every: Sample one in every `sample_every` statuses. Zero
+                disables sampling.
+            sink: Called with each sample. If None, samples are appended to
+                `samples`.
+            max_samples: The number of most recent samples kept in
+                `samples` when no sink is given.
+
+        Raises:
+            ValueError: If `sample_every` is negative or `max_samples` is
+                less than 1.
+        """
+        if sample_every < 0:
+            msg = "sample_every must not be negative"
+            raise ValueError(msg)
+        if max_samples < 1:
+            msg = "max_samples must be at least 1"
+            raise ValueError(msg)
+        self._counts: dict[type[HTTPStatus], int] = {}
+        self._sample_every = sample_every
+        self._countdown = sample_every
+        self.samples: deque[RaiseSample] = deque(maxlen=max_samples)
+        self._sink = self.samples.append if sink is None else sink
+        self.sink_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the instrument is counting statuses."""
+        return _core._raise_hook == self._record  # noqa: SLF001
+
+    def enable(self) -> None:
+        """Start counting statuses.
+
+        Raises:
+            RuntimeError: If another instrument is enabled.
+        """
+        with _HOOK_LOCK:
+            previous = _set_raise_hook(self._record)
+            if previous is not None and previous != self._record:
+                _set_raise_hook(previous)
+                msg = "another RaiseInstrument is already enabled"
+                raise RuntimeError(msg)
+
+    def disable(self) -> None:
+        """Stop counting statuses, keeping the counts and samples."""
+        with _HOOK_LOCK:
+            previous = _set_raise_hook(None)
+            if previous is not None and previous != self._record:
+                _set_raise_hook(previous)
+
+    def _record(self, status: HTTPStatus) -> None:
+        """Count a new status, sampling it if it is due."""
+        status_class = type(status)
+        counts = self._counts
+        counts[status_class] = counts.get(status_class, 0) + 1
+        if self._sample_every:
+            self._countdown -= 1
+            if self._countdown <= 0:
+                self._countdown = self._sample_every
+                self._sample(status)
+
+    def _sample(self, status: HTTPStatus) -> None:
+        """Pass a sample of the code creating `status` to the sink."""
+        # Skip this method, _record() and the __init__ methods of the status.
+        frame: Optional[FrameType] = sys._getframe(2)  # noqa: SLF001
+        while (
+            frame is not None
+            and frame.f_code.co_name == "__init__"
+            and frame.f_locals.get("self") is status
+        ):
+            frame = frame.f_back
+        if frame is None:
+            return
+        sample = RaiseSample(
+            type(status),
+            status.detail,
+            frame.f_code.co_filename,
+            frame.f_lineno,
+            frame.f_code.co_name,
+            threading.get_ident(),
+        )
+        del frame
+        try:
+            self._sink(sample)
+        except Exception:  # noqa: BLE001
+            # A failing sink must not replace the status being raised.
+            self.sink_errors += 1
+
+    def counts(self) -> list[tuple[type[HTTPStatus], int]]:
+        """Return each counted class and its count, most common first."""
+        return sorted(
+            self._counts.copy().items(), key=itemgetter(1), reverse=True
+        )
+
+    def total(self) -> int:
+        """Return the number of statuses counted."""
+        return sum(self._counts.copy().values())
+
+    def reset(self) -> None:
+        """Discard the counts and samples."""
+        self._counts = {}
+        self._countdown = self._sample_every
+        self.samples.clear()
+        self.sink_errors = 0
+
+    def __enter__(self) -> RaiseInstrument:  # noqa: PYI034
+        """Enable the instrument."""
+        self.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Disable the instrument."""
+        self.disable()
+
+    def __repr__(self) -> str:
+        """Return a representation showing the state and total count."""
+        state = "enabled" if self.enabled else "disabled"
+        return f"{type(self).__name__}({state}, total={self.total()})"
+
+
+__all__ = [
+    "RaiseInstrument",
+    "RaiseSample",
+]
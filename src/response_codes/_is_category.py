@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Union
+import sys
+from enum import IntEnum
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Optional, Union, cast
 
-from ._core import HTTPStatus
+from ._core import HTTPStatus, HTTPStatusMeta
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 StatusValue = Union[int, type[HTTPStatus], HTTPStatus]
 
@@ -14,6 +20,106 @@ _REDIRECTION_MIN, _REDIRECTION_MAX = 300, 399
 _CLIENT_ERROR_MIN, _CLIENT_ERROR_MAX = 400, 499
 _SERVER_ERROR_MIN, _SERVER_ERROR_MAX = 500, 599
 
+# Number of slots in the per-code category table (codes 0-999).
+_TABLE_SIZE = 1000
+
+
+class StatusCategory(IntEnum):
+    """Category of an HTTP status code.
+
+    Codes outside the five standard ranges are ``UNKNOWN``.
+    """
+
+    UNKNOWN = 0
+    INFORMATIONAL = 1
+    SUCCESS = 2
+    REDIRECTION = 3
+    CLIENT_ERROR = 4
+    SERVER_ERROR = 5
+
+
+_CATEGORY_BOUNDS = (
+    (StatusCategory.INFORMATIONAL, _INFORMATIONAL_MIN, _INFORMATIONAL_MAX),
+    (StatusCategory.SUCCESS, _SUCCESS_MIN, _SUCCESS_MAX),
+    (StatusCategory.REDIRECTION, _REDIRECTION_MIN, _REDIRECTION_MAX),
+    (StatusCategory.CLIENT_ERROR, _CLIENT_ERROR_MIN, _CLIENT_ERROR_MAX),
+    (StatusCategory.SERVER_ERROR, _SERVER_ERROR_MIN, _SERVER_ERROR_MAX),
+)
+
+
+def _build_category_table() -> bytes:
+    """Build the table mapping each code in 0-999 to its category value."""
+    table = bytearray(_TABLE_SIZE)
+    for category, low, high in _CATEGORY_BOUNDS:
+        table[low : high + 1] = bytes([category]) * (high - low + 1)
+    return bytes(table)
+
+
+_CATEGORY_TABLE = _build_category_table()
+
+_INFORMATIONAL = int(StatusCategory.INFORMATIONAL)
+_SUCCESS = int(StatusCategory.SUCCESS)
+_REDIRECTION = int(StatusCategory.REDIRECTION)
+_CLIENT_ERROR = int(StatusCategory.CLIENT_ERROR)
+_SERVER_ERROR = int(StatusCategory.SERVER_ERROR)
+_UNKNOWN = int(StatusCategory.UNKNOWN)
+
+# 16-bit codes are classified one byte plane at a time with bytes.translate().
+# For each possible high byte (codes 0-999 need 0-3), the low-byte table maps
+# the low byte to the category of the code with that high byte, and the mask
+# keeps only the items whose high byte matches.
+_HIGH_BYTES = range((_TABLE_SIZE + 0xFF) >> 8)
+_LOW_BYTE_TABLES = tuple(
+    (_CATEGORY_TABLE[high << 8 :] + bytes(0x100))[:0x100]
+    for high in _HIGH_BYTES
+)
+_HIGH_BYTE_MASKS = tuple(
+    bytes(high) + b"\xff" + bytes(0xFF - high) for high in _HIGH_BYTES
+)
+
+# memoryview formats holding raw bytes, reinterpreted as native uint16 codes.
+_RAW_BUFFER_FORMATS = frozenset({"B", "b", "c"})
+# memoryview formats holding integers of other widths.
+_INT_BUFFER_FORMATS = frozenset("hiIlLqQnN")
+
+# Enum members indexed by value, so a table entry maps to its member without
+# going through the (comparatively slow) enum constructor.
+_CATEGORY_MEMBERS = tuple(StatusCategory)
+
+_get_code_attr: Callable[[StatusValue], int] = attrgetter("status_code")
+_get_int_code = cast("Callable[[StatusValue], int]", int)
+
+# Cache of code extractors keyed by the exact type of the value passed in.
+# Each type is checked against HTTPStatus once; later calls are a dict probe.
+# Status classes all share their metaclass as their type.
+_CODE_GETTERS: dict[type, Callable[[StatusValue], int]] = {
+    int: _get_int_code,
+    HTTPStatusMeta: _get_code_attr,
+}
+
+
+def _resolve_code_getter(value: StatusValue) -> Callable[[StatusValue], int]:
+    """Find (and cache) the code extractor for the type of `value`.
+
+    Raises:
+        TypeError: If `value` is not an supported int/class/instance.
+    """
+    error_message = "value must be int or HTTPStatus"
+
+    # Note: `bool` is a subclass of `int`, but it's not a valid status code.
+    if isinstance(value, bool):
+        raise TypeError(error_message)
+
+    if isinstance(value, int):
+        getter = _get_int_code
+    elif isinstance(value, (HTTPStatus, HTTPStatusMeta)):
+        getter = _get_code_attr
+    else:
+        raise TypeError(error_message)
+
+    _CODE_GETTERS[type(value)] = getter
+    return getter
+
 
 def _get_status_code(value: StatusValue) -> int:
     """Extract numeric status code from an int/class/instance.
@@ -27,55 +133,198 @@ def _get_status_code(value: StatusValue) -> int:
     Raises:
         TypeError: If `value` is not an supported int/class/instance.
     """
-    error_message = "value must be int or HTTPStatus"
+    getter = _CODE_GETTERS.get(type(value))
+    if getter is None:
+        getter = _resolve_code_getter(value)
+    return getter(value)
 
-    # Note: `bool` is a subclass of `int`, but it's not a valid status code.
-    if isinstance(value, bool):
-        raise TypeError(error_message)
 
-    if isinstance(value, int):
-        return value
+def _category_value(value: StatusValue) -> int:
+    """Return the raw category table entry for `value`."""
+    if type(value) is int:
+        code = value
+    elif type(value) is HTTPStatusMeta or type(type(value)) is HTTPStatusMeta:
+        # A status class or instance: read the code without the getter cache,
+        # which costs more than the attribute lookup itself.
+        code = value.status_code  # type: ignore[union-attr]
+    else:
+        code = _get_status_code(value)
+    if 0 <= code < _TABLE_SIZE:
+        return _CATEGORY_TABLE[code]
+    return _UNKNOWN
 
-    if isinstance(value, HTTPStatus):
-        return value.status_code
 
-    if isinstance(value, type) and issubclass(value, HTTPStatus):
-        return value.status_code
+def _code_category(code: int) -> int:
+    """Return the raw category table entry for a plain integer code."""
+    if 0 <= code < _TABLE_SIZE:
+        return _CATEGORY_TABLE[code]
+    return _UNKNOWN
 
-    raise TypeError(error_message)
+
+def _status_table(
+    values: Iterable[Union[StatusValue, StatusCategory]],
+) -> bytes:
+    """Build a per-code table from a mix of statuses and categories.
+
+    Returns:
+        A table with one byte per code in 0-999, which is 1 for every code
+        given directly or through its category and 0 for the rest.
+
+    Raises:
+        TypeError: If an item is not a supported value.
+        ValueError: If a code is outside the range 0-999.
+    """
+    table = bytearray(_TABLE_SIZE)
+    categories: set[int] = set()
+    for value in values:
+        # StatusCategory is an IntEnum, so check for it before reading a code.
+        if isinstance(value, StatusCategory):
+            categories.add(value)
+            continue
+        code = _get_status_code(value)
+        if not 0 <= code < _TABLE_SIZE:
+            msg = f"status code {code!r} is outside the range 0-999"
+            raise ValueError(msg)
+        table[code] = 1
+    if categories:
+        for code, category in enumerate(_CATEGORY_TABLE):
+            if category in categories:
+                table[code] = 1
+    return bytes(table)
+
+
+def category_of(value: StatusValue) -> StatusCategory:
+    """Return the StatusCategory that `value` falls into."""
+    return _CATEGORY_MEMBERS[_category_value(value)]
 
 
 def is_informational(value: StatusValue) -> bool:
     """Return True if `value` is in the informational 1xx range."""
-    code = _get_status_code(value)
-    return _INFORMATIONAL_MIN <= code <= _INFORMATIONAL_MAX
+    return _category_value(value) == _INFORMATIONAL
 
 
 def is_success(value: StatusValue) -> bool:
     """Return True if `value` is in the success 2xx range."""
-    code = _get_status_code(value)
-    return _SUCCESS_MIN <= code <= _SUCCESS_MAX
+    return _category_value(value) == _SUCCESS
 
 
 def is_redirection(value: StatusValue) -> bool:
     """Return True if `value` is in the redirection 3xx range."""
-    code = _get_status_code(value)
-    return _REDIRECTION_MIN <= code <= _REDIRECTION_MAX
+    return _category_value(value) == _REDIRECTION
 
 
 def is_client_error(value: StatusValue) -> bool:
     """Return True if `value` is in the client error 4xx range."""
-    code = _get_status_code(value)
-    return _CLIENT_ERROR_MIN <= code <= _CLIENT_ERROR_MAX
+    return _category_value(value) == _CLIENT_ERROR
 
 
 def is_server_error(value: StatusValue) -> bool:
     """Return True if `value` is in the server error 5xx range."""
-    code = _get_status_code(value)
-    return _SERVER_ERROR_MIN <= code <= _SERVER_ERROR_MAX
+    return _category_value(value) == _SERVER_ERROR
+
+
+def _as_code_buffer(codes: object) -> Optional[memoryview]:
+    """Return a flat memoryview of integer codes if `codes` is a buffer.
+
+    Raw bytes-like buffers are reinterpreted as native-endian unsigned 16-bit
+    codes.
+
+    Returns:
+        The memoryview, or None if `codes` does not support the buffer
+        protocol.
+
+    Raises:
+        TypeError: If the buffer does not hold integers.
+        ValueError: If a raw byte buffer has an odd length.
+    """
+    try:
+        view = memoryview(codes)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+
+    if view.format in _RAW_BUFFER_FORMATS:
+        if view.nbytes % 2:
+            msg = "raw code buffers must hold 2 bytes per code"
+            raise ValueError(msg)
+        return view.cast("B").cast("H")
+    if view.format == "H" or view.format in _INT_BUFFER_FORMATS:
+        if view.ndim != 1:
+            view = view.cast("B").cast(view.format)  # type: ignore[call-overload]
+        return view
+    msg = "buffer must hold integer status codes"
+    raise TypeError(msg)
+
+
+def _classify_uint16(view: memoryview) -> bytes:
+    """Classify a buffer of native-endian unsigned 16-bit codes.
+
+    Works on whole byte planes with bytes.translate() and integer bitwise
+    operations, so no Python object is created per item.
+    """
+    raw = view.tobytes()
+    if sys.byteorder == "little":
+        low, high = raw[0::2], raw[1::2]
+    else:
+        low, high = raw[1::2], raw[0::2]
+    categories = 0
+    for table, mask in zip(_LOW_BYTE_TABLES, _HIGH_BYTE_MASKS):
+        categories |= int.from_bytes(low.translate(table), "big") & (
+            int.from_bytes(high.translate(mask), "big")
+        )
+    return categories.to_bytes(len(low), "big")
+
+
+def classify_many(codes: Iterable[StatusValue]) -> bytes:
+    """Classify many status values in a single pass.
+
+    `codes` may be any iterable of values accepted by the ``is_*`` helpers,
+    or any object supporting the buffer protocol. Buffers in ``'H'`` format
+    (such as ``array.array('H')``) are classified with ``bytes.translate()``
+    over whole byte planes, without creating a Python object per item. Raw
+    bytes-like buffers are read as native-endian unsigned 16-bit codes.
+
+    Args:
+        codes: The status values to classify.
+
+    Returns:
+        A bytes object with one StatusCategory value per input item, in input
+        order.
+
+    Raises:
+        TypeError: If an item is not a supported value, or a buffer does not
+            hold integers.
+        ValueError: If a raw byte buffer has an odd length.
+    """
+    view = _as_code_buffer(codes)
+    if view is None:
+        return bytes(map(_category_value, codes))
+    if view.format == "H":
+        return _classify_uint16(view)
+    return bytes(map(_code_category, view))
+
+
+def count_by_category(
+    codes: Iterable[StatusValue],
+) -> dict[StatusCategory, int]:
+    """Count status values per category in one classification pass.
+
+    Accepts the same inputs as classify_many().
+
+    Args:
+        codes: The status values to count.
+
+    Returns:
+        A mapping of every StatusCategory to the number of values in it.
+    """
+    categories = classify_many(codes)
+    return {category: categories.count(category) for category in StatusCategory}
 
 
 __all__ = [
+    "StatusCategory",
+    "category_of",
+    "classify_many",
+    "count_by_category",
     "is_client_error",
     "is_informational",
     "is_redirection",
@@ -0,0 +1,64 @@
+"""JSON error-body serialization for status classes and instances.
+
+This module backs HTTPStatus.to_json() and to_json_bytes(). The constant
+part of each document is encoded once per class and cached on the class, so
+only the per-instance detail is encoded on each call.
+"""
+
+from __future__ import annotations
+
+from json import dumps
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ._core import HTTPStatus
+
+
+class _JsonTemplate:
+    """The pre-encoded constant part of a class's JSON error body.
+
+    Attributes:
+        prefix: The document up to (but excluding) its closing brace.
+        document: The complete document, used when there is no detail.
+        prefix_bytes: `prefix` encoded as UTF-8.
+        document_bytes: `document` encoded as UTF-8.
+    """
+
+    __slots__ = ("document", "document_bytes", "prefix", "prefix_bytes")
+
+    def __init__(
+        self, status_class: type[HTTPStatus], *, description: bool
+    ) -> None:
+        """Encode the constant fields of `status_class`.
+
+        Args:
+            status_class: The status class to build the template for.
+            description: Whether to include the status description.
+        """
+        fields: dict[str, object] = {
+            "error_code": int(status_class.status_code),
+            "message": status_class.message,
+        }
+        if description:
+            fields["description"] = status_class.description
+        self.document = dumps(fields)
+        self.prefix = self.document[:-1]
+        self.document_bytes = self.document.encode()
+        self.prefix_bytes = self.prefix.encode()
+
+    def render(self, detail: Optional[str]) -> str:
+        """Return the document, with `detail` spliced in if given."""
+        if detail is None:
+            return self.document
+        return f'{self.prefix}, "detail": {encode_basestring_ascii(detail)}}}'
+
+    def render_bytes(self, detail: Optional[str]) -> bytes:
+        """Return the encoded document, with `detail` spliced in if given."""
+        if detail is None:
+            return self.document_bytes
+        # Non-ASCII characters are escaped, so the encoded detail is ASCII.
+        return b'%b, "detail": %b}' % (
+            self.prefix_bytes,
+            encode_basestring_ascii(detail).encode("ascii"),
+        )
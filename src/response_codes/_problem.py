@@ -0,0 +1,218 @@
+"""RFC 9457 Problem Details rendering for status classes and instances.
+
+This module contains ProblemRenderer, which serializes a status class or
+exception as an ``application/problem+json`` document. The invariant members
+(``type``, ``title`` and ``status``) are encoded once per class; only the
+occurrence-specific members are encoded per call.
+"""
+
+from __future__ import annotations
+
+from json import dumps
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Optional, Protocol, Union
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from ._core import HTTPStatus
+
+# Media type for Problem Details documents (RFC 9457, section 3).
+PROBLEM_JSON_MEDIA_TYPE = "application/problem+json"
+
+# Problem type used when no type URI base is configured (RFC 9457, 4.2.1).
+_ABOUT_BLANK = "about:blank"
+
+# Members defined by RFC 9457, which extension members may not replace.
+_STANDARD_MEMBERS = frozenset({"type", "title", "status", "detail", "instance"})
+
+
+class SupportsWrite(Protocol):
+    """A binary output stream, such as ``io.BytesIO`` or a socket writer."""
+
+    def write(self, data: bytes, /) -> object:
+        """Write `data` to the stream."""
+
+
+class _ProblemTemplate:
+    """The pre-encoded invariant members of a class's problem document.
+
+    Attributes:
+        prefix: The document up to (but excluding) its closing brace.
+        document: The complete document, used when there are no
+            occurrence-specific members.
+    """
+
+    __slots__ = ("document", "prefix")
+
+    def __init__(self, prefix: bytes) -> None:
+        """Create a template from the encoded invariant members."""
+        self.prefix = prefix
+        self.document = prefix + b"}"
+
+
+class ProblemRenderer:
+    """Render statuses as RFC 9457 Problem Details documents.
+
+    Each renderer caches one template per status class, holding the encoded
+    ``type``, ``title`` (the reason phrase) and ``status`` members. Rendering
+    a class or exception then only encodes ``detail``, ``instance`` and any
+    extension members, and a document without them is returned from the
+    cache as-is.
+
+    Examples:
+        >>> renderer = ProblemRenderer("https://errors.example.com/")
+        >>> renderer.render(HTTP_404_NOT_FOUND("no such user"))
+        b'{"type": "https://errors.example.com/404", "title": "Not Found", ...'
+    """
+
+    __slots__ = ("_templates", "type_base")
+
+    def __init__(self, type_base: Optional[str] = None) -> None:
+        """Create a renderer.
+
+        Args:
+            type_base: URI prefix for problem types. Each class's ``type`` is
+                this prefix followed by its status code. If None, every
+                problem has the type ``about:blank``.
+        """
+        self.type_base = type_base
+        self._templates: dict[type[HTTPStatus], _ProblemTemplate] = {}
+
+    def _template(self, status_class: type[HTTPStatus]) -> _ProblemTemplate:
+        """Return (building on first use) the template for a class."""
+        template = self._templates.get(status_class)
+        if template is None:
+            code = int(status_class.status_code)
+            problem_type = (
+                _ABOUT_BLANK
+                if self.type_base is None
+                else f"{self.type_base}{code}"
+            )
+            document = dumps(
+                {
+                    "type": problem_type,
+                    "title": status_class.message,
+                    "status": code,
+                }
+            )
+            template = _ProblemTemplate(document[:-1].encode())
+            self._templates[status_class] = template
+        return template
+
+    def _parts(
+        self,
+        status: Union[HTTPStatus, type[HTTPStatus]],
+        detail: Optional[str],
+        instance: Optional[str],
+        extensions: Optional[Mapping[str, object]],
+    ) -> tuple[_ProblemTemplate, list[bytes]]:
+        """Return the class template and the encoded per-call members.
+
+        Raises:
+            ValueError: If an extension member would replace a member
+                defined by RFC 9457.
+        """
+        if isinstance(status, type):
+            status_class = status
+        else:
+            status_class = type(status)
+            if detail is None:
+                detail = status.detail
+        members = []
+        if detail is not None:
+            members.append(b', "detail": ')
+            members.append(encode_basestring_ascii(detail).encode("ascii"))
+        if instance is not None:
+            members.append(b', "instance": ')
+            members.append(encode_basestring_ascii(instance).encode("ascii"))
+        if extensions:
+            reserved = _STANDARD_MEMBERS.intersection(extensions)
+            if reserved:
+                msg = f"extension members may not replace {sorted(reserved)}"
+                raise ValueError(msg)
+            members.append(b", ")
+            members.append(dumps(extensions)[1:-1].encode("ascii"))
+        return self._template(status_class), members
+
+    def render(
+        self,
+        status: Union[HTTPStatus, type[HTTPStatus]],
+        detail: Optional[str] = None,
+        *,
+        instance: Optional[str] = None,
+        extensions: Optional[Mapping[str, object]] = None,
+    ) -> bytes:
+        """Render a status class or exception as a problem document.
+
+        Args:
+            status: The status class or instance.
+            detail: Explanation specific to this occurrence. Defaults to the
+                instance's ``detail``, if any.
+            instance: URI reference identifying this occurrence.
+            extensions: Extra members to include, with JSON-serializable
+                values.
+
+        Returns:
+            The encoded ``application/problem+json`` document.
+
+        Raises:
+            ValueError: If an extension member would replace a member
+                defined by RFC 9457.
+        """
+        template, members = self._parts(status, detail, instance, extensions)
+        if not members:
+            return template.document
+        return b"".join((template.prefix, *members, b"}"))
+
+    def write(
+        self,
+        stream: SupportsWrite,
+        status: Union[HTTPStatus, type[HTTPStatus]],
+        detail: Optional[str] = None,
+        *,
+        instance: Optional[str] = None,
+        extensions: Optional[Mapping[str, object]] = None,
+    ) -> int:
+        """Write a problem document straight into an output stream.
+
+        The cached prefix and each encoded member are written in turn, so
+        the document is never assembled in memory. Takes the same arguments
+        as render().
+
+        Args:
+            stream: The binary stream to write to.
+            status: The status class or instance.
+            detail: Explanation specific to this occurrence.
+            instance: URI reference identifying this occurrence.
+            extensions: Extra members to include.
+
+        Returns:
+            The number of bytes written.
+
+        Raises:
+            ValueError: If an extension member would replace a member
+                defined by RFC 9457.
+        """
+        template, members = self._parts(status, detail, instance, extensions)
+        if not members:
+            stream.write(template.document)
+            return len(template.document)
+        size = len(template.prefix) + 1
+        stream.write(template.prefix)
+        for member in members:
+            stream.write(member)
+            size += len(member)
+        stream.write(b"}")
+        return size
+
+
+# Renderer used by HTTPStatus.to_problem_json().
+_DEFAULT_RENDERER = ProblemRenderer()
+
+
+__all__ = [
+    "PROBLEM_JSON_MEDIA_TYPE",
+    "ProblemRenderer",
+    "SupportsWrite",
+]
@@ -0,0 +1,235 @@
+"""Retry decisions for failed requests, driven by HTTP status codes.
+
+This module contains RetryPolicy, which decides whether a failed request
+should be retried and how long to wait first, and should_retry(), which
+applies the default policy.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from datetime import timezone
+from typing import TYPE_CHECKING, Optional, Union
+
+from ._core import _REGISTRY, _REGISTRY_SIZE, _load_registry
+from ._is_category import (
+    StatusCategory,
+    StatusValue,
+    _get_status_code,
+    _status_table,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Largest exponent used for backoff, so huge attempt numbers can't overflow.
+_MAX_EXPONENT = 64
+
+
+def _default_retryable_codes() -> list[int]:
+    """Return the codes of every built-in class marked ``retryable``."""
+    _load_registry()
+    return [
+        status_class.status_code
+        for status_class in _REGISTRY
+        if status_class is not None and status_class.retryable
+    ]
+
+
+def parse_retry_after(
+    value: str, now: Optional[float] = None
+) -> Optional[float]:
+    """Parse a ``Retry-After`` header value into a delay in seconds.
+
+    Both forms defined by RFC 9110 are accepted: a number of seconds
+    (``"120"``) or an HTTP-date (``"Wed, 21 Oct 2015 07:28:00 GMT"``).
+
+    Args:
+        value: The header value.
+        now: The current time as a POSIX timestamp, used for HTTP-dates.
+            Defaults to ``time.time()``.
+
+    Returns:
+        The delay in seconds (never negative), or None if `value` is not a
+        valid ``Retry-After`` value or is too large to represent.
+    """
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        seconds = float(value)
+        return seconds if math.isfinite(seconds) else None
+
+    from email.utils import parsedate_to_datetime  # noqa: PLC0415
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:  # Python < 3.10 returns None for invalid dates
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    current = time.time() if now is None else now
+    return max(0.0, when.timestamp() - current)
+
+
+class RetryPolicy:
+    """Decide whether and when to retry a request that failed with a status.
+
+    The retryable codes are compiled into a 1000-entry lookup table, so
+    should_retry() is one table read. Delays honour a server's
+    ``Retry-After`` header and otherwise use exponential backoff with
+    "full jitter" (a random delay between zero and the backoff).
+
+    Examples:
+        >>> policy = RetryPolicy(max_attempts=5, base_delay=0.5)
+        >>> policy.should_retry(HTTP_503_SERVICE_UNAVAILABLE, attempt=1)
+        True
+        >>> policy.should_retry(404)
+        False
+        >>> policy.delay(1, retry_after="3")
+        3.0
+    """
+
+    __slots__ = (
+        "_random",
+        "_table",
+        "base_delay",
+        "jitter",
+        "max_attempts",
+        "max_delay",
+        "multiplier",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        codes: Optional[Iterable[Union[StatusValue, StatusCategory]]] = None,
+        *,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Create a retry policy.
+
+        Args:
+            codes: The retryable statuses, as ints, classes, instances or
+                StatusCategory members. Defaults to every built-in class
+                with ``retryable = True`` (408, 429, 500, 503 and 504).
+            max_attempts: Total attempts allowed, including the first.
+            base_delay: Backoff before the first retry, in seconds.
+            max_delay: Upper bound for the backoff, in seconds.
+            multiplier: Factor the backoff grows by with each attempt.
+            jitter: Whether to randomise each backoff delay.
+            rng: Random number generator for jitter, e.g. a seeded
+                ``random.Random`` in tests.
+
+        Raises:
+            TypeError: If a code is not a supported type.
+            ValueError: If a code is outside the range 0-999.
+        """
+        if codes is None:
+            codes = _default_retryable_codes()
+        self._table = _status_table(codes)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._random = rng if rng is not None else random.Random()  # noqa: S311
+
+    @property
+    def retryable_codes(self) -> frozenset[int]:
+        """The status codes this policy retries."""
+        return frozenset(code for code, flag in enumerate(self._table) if flag)
+
+    def is_retryable(self, value: StatusValue) -> bool:
+        """Return True if `value` is one of the retryable statuses."""
+        code = value if type(value) is int else _get_status_code(value)
+        return 0 <= code < _REGISTRY_SIZE and self._table[code] == 1
+
+    def should_retry(self, value: StatusValue, attempt: int = 1) -> bool:
+        """Return True if a request that failed with `value` may be retried.
+
+        Args:
+            value: The failure status as an int, class or instance.
+            attempt: The number of attempts made so far.
+
+        Raises:
+            TypeError: If `value` is not a supported type.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        code = value if type(value) is int else _get_status_code(value)
+        return 0 <= code < _REGISTRY_SIZE and self._table[code] == 1
+
+    def backoff(self, attempt: int) -> float:
+        """Return the backoff delay before retrying after `attempt` attempts.
+
+        The delay is ``base_delay * multiplier ** (attempt - 1)``, capped at
+        `max_delay`. With jitter, a random delay between zero and that value
+        is returned instead.
+        """
+        exponent = min(max(attempt - 1, 0), _MAX_EXPONENT)
+        delay = min(self.max_delay, self.base_delay * self.multiplier**exponent)
+        if self.jitter:
+            return self._random.uniform(0.0, delay)
+        return delay
+
+    def delay(
+        self,
+        attempt: int,
+        retry_after: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> float:
+        """Return how long to wait before the next attempt, in seconds.
+
+        A valid `retry_after` value is honoured, up to `max_delay`, so an
+        untrusted header can't stall the caller; otherwise the jittered
+        backoff is used.
+
+        Args:
+            attempt: The number of attempts made so far.
+            retry_after: The response's ``Retry-After`` header, if any.
+            now: The current POSIX time, for HTTP-date values.
+        """
+        if retry_after is not None:
+            seconds = parse_retry_after(retry_after, now)
+            if seconds is not None:
+                return min(seconds, self.max_delay)
+        return self.backoff(attempt)
+
+    def __repr__(self) -> str:
+        """Return a representation listing the retryable codes."""
+        return (
+            f"{type(self).__name__}({sorted(self.retryable_codes)!r}, "
+            f"max_attempts={self.max_attempts!r})"
+        )
+
+
+# Policy used by should_retry(), built from the ``retryable`` class attributes.
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def should_retry(value: StatusValue, attempt: int = 1) -> bool:
+    """Return True if `value` is retryable under the default policy.
+
+    The default policy retries 408, 429, 500, 503 and 504 (the built-in
+    classes with ``retryable = True``), for up to 3 attempts in total.
+
+    Args:
+        value: The failure status as an int, class or instance.
+        attempt: The number of attempts made so far.
+    """
+    return DEFAULT_RETRY_POLICY.should_retry(value, attempt)
+
+
+__all__ = [
+    "DEFAULT_RETRY_POLICY",
+    "RetryPolicy",
+    "parse_retry_after",
+    "should_retry",
+]
@@ -0,0 +1,180 @@
+"""HTTP/1.x status-line parsing.
+
+This module contains helpers that work directly on raw response bytes, such
+as parse_status_line(), for use in proxies and custom HTTP clients.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from itertools import product
+from typing import NamedTuple, Optional, Union
+
+from ._core import (
+    _STATUS_LINE_VERSIONS,
+    HTTPStatus,
+    _render_status_line,
+    lookup,
+)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Longest status line accepted before giving up on finding its end.
+MAX_STATUS_LINE = 8192
+
+_HTTP_PREFIX = b"HTTP/"
+
+# A complete status line: the version digits and the three-digit code, then
+# an optional reason phrase, up to and including the terminating LF. re
+# reads bytes, bytearray and memoryview buffers in place, without a copy.
+_STATUS_LINE = re.compile(rb"HTTP/([0-9]\.[0-9]) ([0-9]{3})(?:[ \r][^\n]*)?\n")
+# The fixed-width fields of a status line, checked when no complete line
+# matches to tell a partial line from a malformed one.
+_FIXED_FIELDS = re.compile(rb"HTTP/[0-9]\.[0-9] [0-9]{3}[ \r\n]")
+
+# Offset of the end of the status code from the start of the status line.
+_CODE_END = 12
+
+# Largest code that fits the three-digit status code field.
+_MAX_CODE = 999
+
+# Matched field bytes mapped to their values, which is cheaper than int()
+# and shares one version tuple between all parsed lines.
+_VERSIONS = {
+    b"%d.%d" % (major, minor): (major, minor)
+    for major, minor in product(range(10), repeat=2)
+}
+_CODES = {b"%03d" % code: code for code in range(_MAX_CODE + 1)}
+
+
+class ParsedStatusLine(NamedTuple):
+    """The result of parsing an HTTP/1.x status line.
+
+    Attributes:
+        status_class: The registered status class, or the fallback class for
+            unregistered codes.
+        status_code: The numeric status code as sent.
+        version: The HTTP version as a ``(major, minor)`` tuple.
+        end: Offset just past the line's terminating LF.
+    """
+
+    status_class: type[HTTPStatus]
+    status_code: int
+    version: tuple[int, int]
+    end: int
+
+
+def _check_partial_line(buf: Buffer, offset: int, stop: int) -> None:
+    """Check that ``buf[offset:stop]`` can start a valid status line.
+
+    Called when no complete status line was found there.
+
+    Raises:
+        ValueError: If the line is malformed or longer than MAX_STATUS_LINE.
+    """
+    size = len(buf)
+    prefix_size = min(size - offset, len(_HTTP_PREFIX))
+    if buf[offset : offset + prefix_size] != _HTTP_PREFIX[:prefix_size]:
+        msg = "status line must start with 'HTTP/'"
+        raise ValueError(msg)
+    if size - offset <= _CODE_END:
+        return
+    if _FIXED_FIELDS.match(buf, offset) is None:
+        msg = "malformed HTTP version or status code in status line"
+        raise ValueError(msg)
+    if stop - offset >= MAX_STATUS_LINE:
+        msg = f"status line longer than {MAX_STATUS_LINE} bytes"
+        raise ValueError(msg)
+
+
+def parse_status_line(
+    buf: Buffer,
+    offset: int = 0,
+    fallback: Optional[type[HTTPStatus]] = HTTPStatus,
+) -> Optional[ParsedStatusLine]:
+    """Parse the status line at `offset` in a raw HTTP/1.x response.
+
+    The line is matched in place with one precompiled pattern, so the buffer
+    is never copied, and the code is resolved through the status registry.
+
+    Args:
+        buf: The response bytes, as ``bytes``, ``bytearray`` or
+            ``memoryview``.
+        offset: Where the status line starts in `buf`.
+        fallback: Class returned for codes with no registered class. If
+            None, unregistered codes raise ValueError.
+
+    Returns:
+        The parsed status line, or None if `buf` does not yet contain a
+        complete line.
+
+    Raises:
+        ValueError: If the line is malformed, longer than MAX_STATUS_LINE,
+            or (with no fallback) carries an unregistered code.
+    """
+    if isinstance(buf, memoryview) and buf.format != "B":
+        buf = buf.cast("B")
+    size = len(buf)
+    if not 0 <= offset <= size:
+        msg = f"offset {offset} is outside the buffer"
+        raise ValueError(msg)
+    stop = min(size, offset + MAX_STATUS_LINE)
+    match = _STATUS_LINE.match(buf, offset, stop)
+    if match is None:
+        _check_partial_line(buf, offset, stop)
+        return None
+
+    version, code_field = match.groups()
+    code = _CODES[code_field]
+    status_class = lookup(code)
+    if status_class is None:
+        if fallback is None:
+            msg = f"{code} is not a registered HTTP status code"
+            raise ValueError(msg)
+        status_class = fallback
+    return ParsedStatusLine(status_class, code, _VERSIONS[version], match.end())
+
+
+@lru_cache(maxsize=256)
+def _format_unregistered(code: int, version: bytes) -> bytes:
+    """Render (and memoise) the status line for an unregistered code."""
+    return _render_status_line(code, "", version)
+
+
+def format_status_line(code: int, version: bytes = b"1.1") -> bytes:
+    """Return the encoded status line for a numeric status code.
+
+    Registered codes return the bytes cached on their status class (see
+    ``HTTPStatusMeta.status_line()``). Unregistered codes are sent with an
+    empty reason phrase, and their lines are memoised after the first call.
+
+    Args:
+        code: The numeric HTTP status code, in the range 0-999.
+        version: The HTTP version, either ``b"1.0"`` or ``b"1.1"``.
+
+    Returns:
+        The status line, including its trailing CRLF.
+
+    Raises:
+        ValueError: If `code` is not a three-digit code or `version` is not a
+            supported HTTP/1.x version.
+    """
+    status_class = lookup(code)
+    if status_class is not None:
+        return status_class.status_line(version)
+    if not 0 <= code <= _MAX_CODE:
+        msg = f"status code {code!r} is not a three-digit code"
+        raise ValueError(msg)
+    if version not in _STATUS_LINE_VERSIONS:
+        msg = f"unsupported HTTP version {version!r}"
+        raise ValueError(msg)
+    return _format_unregistered(int(code), version)
+
+
+__all__ = [
+    "MAX_STATUS_LINE",
+    "ParsedStatusLine",
+    "format_status_line",
+    "parse_status_line",
+]
@@ -0,0 +1,86 @@
+"""Compact encoding of status results for inter-process transport.
+
+This module contains pack_statuses() and unpack_statuses(), which move batches
+of statuses between processes as two bytes per entry instead of one pickled
+object each.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from ._core import _REGISTRY, _REGISTRY_SIZE, HTTPStatus, _load_registry
+from ._is_category import StatusValue, _as_code_buffer, _get_status_code
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def _code_of(value: StatusValue) -> int:
+    """Return the numeric code of a status value."""
+    return value if type(value) is int else _get_status_code(value)
+
+
+def pack_statuses(statuses: Iterable[StatusValue]) -> bytes:
+    """Pack status values into a buffer of native unsigned 16-bit codes.
+
+    Only the code of each status is kept, so instance details are dropped.
+    The result can be unpacked with unpack_statuses(), or read directly as
+    ``array('H')`` or by any helper that accepts raw code buffers (such as
+    classify_many()).
+
+    Args:
+        statuses: Ints, status classes or status instances.
+
+    Returns:
+        The packed codes, two bytes per entry.
+
+    Raises:
+        TypeError: If an item is not a supported status value.
+        ValueError: If a code does not fit in an unsigned 16-bit integer.
+    """
+    try:
+        return array("H", map(_code_of, statuses)).tobytes()
+    except OverflowError as exc:
+        msg = "status codes must be in the range 0-65535"
+        raise ValueError(msg) from exc
+
+
+def unpack_statuses(
+    data: bytes, fallback: type[HTTPStatus] = HTTPStatus
+) -> list[type[HTTPStatus]]:
+    """Unpack a buffer produced by pack_statuses() into status classes.
+
+    Each code is resolved with a single index into the registry.
+
+    Args:
+        data: The packed codes, as any bytes-like object.
+        fallback: Class returned for codes with no registered class.
+
+    Returns:
+        One status class per packed code, in order.
+
+    Raises:
+        TypeError: If `data` is not a bytes-like object of integer codes.
+        ValueError: If a raw byte buffer has an odd length.
+    """
+    view = _as_code_buffer(data)
+    if view is None:
+        msg = "data must be a bytes-like object"
+        raise TypeError(msg)
+    _load_registry()
+    classes = [
+        fallback if status_class is None else status_class
+        for status_class in _REGISTRY
+    ]
+    return [
+        classes[code] if 0 <= code < _REGISTRY_SIZE else fallback
+        for code in view
+    ]
+
+
+__all__ = [
+    "pack_statuses",
+    "unpack_statuses",
+]
@@ -0,0 +1,229 @@
+"""Sliding-window error-rate tracking by status category.
+
+This module contains ErrorRateWindow, which counts responses per category over
+a trailing time window, for load shedding and alerting decisions.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from typing import Callable, Optional
+
+from ._core import _REGISTRY_SIZE
+from ._is_category import (
+    StatusCategory,
+    StatusValue,
+    _code_category,
+    _get_status_code,
+)
+
+# Zeroed counts for one bucket, one slot per StatusCategory value.
+_EMPTY_BUCKET = bytes(8 * len(StatusCategory))
+
+
+class ErrorRateWindow:
+    """Count responses per status category over a sliding time window.
+
+    The window is a ring of buckets, each covering `granularity` seconds and
+    holding one counter per category. Running totals are kept alongside the
+    buckets, so recording a response and querying a count are both O(1);
+    expiring a bucket subtracts its counts from the totals when the ring
+    moves past it.
+
+    With ``per_code=True``, counts are also kept per status code (0-999).
+
+    Examples:
+        >>> window = ErrorRateWindow(10.0)
+        >>> window.record(200)
+        >>> window.record(HTTP_503_SERVICE_UNAVAILABLE)
+        >>> window.rate(StatusCategory.SERVER_ERROR)
+        0.5
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_clock",
+        "_code_buckets",
+        "_code_totals",
+        "_granularity",
+        "_index",
+        "_size",
+        "_tick",
+        "_totals",
+    )
+
+    def __init__(
+        self,
+        window: float = 10.0,
+        granularity: float = 1.0,
+        *,
+        per_code: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty window.
+
+        Args:
+            window: Length of the window in seconds.
+            granularity: Length of each bucket in seconds. Counts expire one
+                whole bucket at a time.
+            per_code: Whether to also keep counts per status code.
+            clock: Function returning the current time in seconds. It must
+                never go backwards.
+
+        Raises:
+            ValueError: If `granularity` is not positive or is longer than
+                `window`.
+        """
+        if not 0 < granularity <= window:
+            msg = "granularity must be positive and no longer than window"
+            raise ValueError(msg)
+        self._granularity = granularity
+        self._clock = clock
+        # Round first so float error in e.g. 1.0 / 0.1 doesn't add a bucket.
+        self._size = math.ceil(round(window / granularity, 9))
+        self._buckets = [array("Q", _EMPTY_BUCKET) for _ in range(self._size)]
+        self._totals = array("Q", _EMPTY_BUCKET)
+        self._code_buckets: Optional[list[dict[int, int]]] = None
+        self._code_totals: Optional[array[int]] = None
+        if per_code:
+            self._code_buckets = [{} for _ in range(self._size)]
+            self._code_totals = array("Q", bytes(8 * _REGISTRY_SIZE))
+        self._tick = self._current_tick()
+        self._index = self._tick % self._size
+
+    def _current_tick(self) -> int:
+        """Return the number of the bucket the clock is currently in."""
+        return int(self._clock() // self._granularity)
+
+    def _advance(self, tick: int) -> None:
+        """Move the ring forward to `tick`, expiring buckets it passes."""
+        elapsed = tick - self._tick
+        if elapsed <= 0:
+            return
+        for step in range(1, min(elapsed, self._size) + 1):
+            self._expire((self._tick + step) % self._size)
+        self._tick = tick
+        self._index = tick % self._size
+
+    def _expire(self, index: int) -> None:
+        """Subtract a bucket from the running totals and empty it."""
+        bucket = self._buckets[index]
+        totals = self._totals
+        for category, count in enumerate(bucket):
+            if count:
+                totals[category] -= count
+        self._buckets[index] = array("Q", _EMPTY_BUCKET)
+        if self._code_buckets is not None and self._code_totals is not None:
+            code_totals = self._code_totals
+            code_bucket = self._code_buckets[index]
+            for code, count in code_bucket.items():
+                code_totals[code] -= count
+            code_bucket.clear()
+
+    def record(self, value: StatusValue, count: int = 1) -> None:
+        """Record `count` responses with a status code.
+
+        Args:
+            value: The status code as an int, class or instance.
+            count: The number of responses to record.
+
+        Raises:
+            TypeError: If `value` is not a supported type.
+            ValueError: If `count` is less than 1.
+        """
+        if count < 1:
+            msg = f"count must be at least 1, not {count!r}"
+            raise ValueError(msg)
+        tick = self._current_tick()
+        if tick != self._tick:
+            self._advance(tick)
+        code = value if type(value) is int else _get_status_code(value)
+        category = _code_category(code)
+        self._buckets[self._index][category] += count
+        self._totals[category] += count
+        if self._code_buckets is not None and 0 <= code < _REGISTRY_SIZE:
+            code_bucket = self._code_buckets[self._index]
+            code_bucket[code] = code_bucket.get(code, 0) + count
+            self._code_totals[code] += count  # type: ignore[index]
+
+    def _refresh(self) -> None:
+        """Expire any buckets that have left the window."""
+        tick = self._current_tick()
+        if tick != self._tick:
+            self._advance(tick)
+
+    def total(self) -> int:
+        """Return the number of responses recorded within the window."""
+        self._refresh()
+        return sum(self._totals)
+
+    def category_count(self, category: StatusCategory) -> int:
+        """Return the number of responses in `category` within the window."""
+        self._refresh()
+        return self._totals[category]
+
+    def category_counts(self) -> dict[StatusCategory, int]:
+        """Return the count for each status category within the window."""
+        self._refresh()
+        return dict(zip(StatusCategory, self._totals))
+
+    def code_count(self, value: StatusValue) -> int:
+        """Return the number of responses with a status code in the window.
+
+        Raises:
+            ValueError: If the window was created without ``per_code=True``.
+        """
+        if self._code_totals is None:
+            msg = "per-code counts require per_code=True"
+            raise ValueError(msg)
+        self._refresh()
+        code = value if type(value) is int else _get_status_code(value)
+        if 0 <= code < _REGISTRY_SIZE:
+            return self._code_totals[code]
+        return 0
+
+    def rate(
+        self, category: StatusCategory = StatusCategory.SERVER_ERROR
+    ) -> float:
+        """Return the fraction of responses in `category` within the window.
+
+        Args:
+            category: The category to measure. Defaults to server errors.
+
+        Returns:
+            A value between 0.0 and 1.0; 0.0 if nothing was recorded.
+        """
+        self._refresh()
+        total = sum(self._totals)
+        return self._totals[category] / total if total else 0.0
+
+    def error_rate(self) -> float:
+        """Return the fraction of 4xx and 5xx responses within the window."""
+        self._refresh()
+        totals = self._totals
+        total = sum(totals)
+        errors = (
+            totals[StatusCategory.CLIENT_ERROR]
+            + totals[StatusCategory.SERVER_ERROR]
+        )
+        return errors / total if total else 0.0
+
+    def reset(self) -> None:
+        """Discard every recorded response."""
+        for index in range(self._size):
+            self._expire(index)
+
+    def __repr__(self) -> str:
+        """Return a representation showing the window's shape."""
+        return (
+            f"{type(self).__name__}(window="
+            f"{self._size * self._granularity!r}, "
+            f"granularity={self._granularity!r})"
+        )
+
+
+__all__ = [
+    "ErrorRateWindow",
+]
@@ -0,0 +1,115 @@
+"""WSGI middleware turning raised status exceptions into responses.
+
+This module contains WSGIStatusMiddleware, which catches HTTPStatus
+exceptions raised by a WSGI application and returns them as JSON error
+responses, using status strings, headers and bodies cached per class.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from ._core import HTTPStatus
+from ._error_body import _render_error_body
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ._problem import ProblemRenderer
+
+    _StartResponse = Callable[..., Callable[[bytes], object]]
+    _WSGIApp = Callable[[dict[str, Any], _StartResponse], Iterable[bytes]]
+    _Headers = tuple[tuple[str, str], ...]
+
+
+class WSGIStatusMiddleware:
+    """Return HTTPStatus exceptions raised by a WSGI app as error responses.
+
+    An exception raised by the application is returned as a JSON error
+    body, such as ``{"error_code": 404, "message": "Not Found"}``, or as an
+    RFC 9457 Problem Details document when a ProblemRenderer is given. The
+    status string (the class's ``wsgi_status``), headers and body are cached
+    per class, so an error response without a ``detail`` costs one dict
+    lookup. Successful requests pass through untouched.
+
+    Only exceptions raised by the application call itself are caught, not
+    those raised while the server iterates a streamed response body.
+
+    Examples:
+        >>> def app(environ, start_response):
+        ...     raise HTTP_404_NOT_FOUND("no such user")
+        >>> app = WSGIStatusMiddleware(app)
+    """
+
+    __slots__ = ("_extra_headers", "_problem_renderer", "_responses", "app")
+
+    def __init__(
+        self,
+        app: _WSGIApp,
+        *,
+        problem_renderer: Optional[ProblemRenderer] = None,
+        headers: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """Wrap a WSGI application.
+
+        Args:
+            app: The WSGI application.
+            problem_renderer: Renderer for ``application/problem+json``
+                bodies. If None, bodies come from ``to_json_bytes()``.
+            headers: Extra headers sent with every error response.
+        """
+        self.app = app
+        self._problem_renderer = problem_renderer
+        self._extra_headers = tuple(headers)
+        self._responses: dict[
+            type[HTTPStatus], tuple[str, _Headers, bytes]
+        ] = {}
+
+    def _build(
+        self, status: type[HTTPStatus], detail: Optional[str]
+    ) -> tuple[str, _Headers, bytes]:
+        """Build the status string, headers and body for a response."""
+        status, media_type, body = _render_error_body(
+            status, detail, self._problem_renderer
+        )
+        if not media_type:
+            return status.wsgi_status, self._extra_headers, body
+        headers = (
+            ("Content-Type", media_type),
+            ("Content-Length", str(len(body))),
+            *self._extra_headers,
+        )
+        return status.wsgi_status, headers, body
+
+    def response(self, exc: HTTPStatus) -> tuple[str, _Headers, bytes]:
+        """Return the status string, headers and body sent for `exc`.
+
+        Responses for exceptions without a detail are cached per class.
+        """
+        status = type(exc)
+        if exc.detail is not None:
+            return self._build(status, exc.detail)
+        cached = self._responses.get(status)
+        if cached is None:
+            cached = self._responses[status] = self._build(status, None)
+        return cached
+
+    def __call__(
+        self, environ: dict[str, Any], start_response: _StartResponse
+    ) -> Iterable[bytes]:
+        """Run the application, returning raised statuses as responses."""
+        try:
+            return self.app(environ, start_response)
+        except HTTPStatus as exc:
+            status, headers, body = self.response(exc)
+            # Servers add headers to the list in place, so pass a copy. The
+            # exception info lets the error replace headers the application
+            # had already set but not yet sent.
+            start_response(status, list(headers), sys.exc_info())
+            return [body]
+
+
+__all__ = [
+    "WSGIStatusMiddleware",
+]
@@ -0,0 +1,237 @@
+"""Fast status-code scanning of web server access logs.
+
+This module reads access logs in the Common and Combined Log Formats used by
+nginx and Apache. Files are memory-mapped and searched with a single compiled
+byte pattern, so lines are never decoded or split into Python objects.
+
+The status is the three-digit field following the quoted request line, in
+which Apache and nginx escape quotes with a backslash::
+
+    127.0.0.1 - - [10/Oct/2000:13:55:36 -0700] "GET / HTTP/1.0" 200 2326
+
+Lines with no status field are skipped.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional, Union
+
+from ._core import _REGISTRY, _REGISTRY_SIZE, HTTPStatus, _load_registry
+from ._counter import StatusCounter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# The status field of a log line: the three-digit field after the quoted
+# request line, which ends the line or is followed by a space. The request
+# line is matched whole from the ``] "`` that follows the timestamp, and
+# backslash escapes inside it are skipped, so an escaped quote in a request
+# cannot pass for the end of the field. The rest of the line is consumed,
+# so each line yields at most one match. The pattern starts with a literal,
+# which lets the regex engine skip ahead with a fast substring search
+# instead of trying every position.
+_STATUS_PATTERN = re.compile(
+    rb'\] "[^"\\\n]*(?:\\.[^"\\\n]*)*" ([0-9]{3})(?![^ \r\n])[^\n]*'
+)
+
+# Bytes searched per call; each chunk is extended to the next line boundary.
+_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Default size of the byte ranges aggregate_logs() hands to each worker.
+_SHARD_SIZE = 64 * 1024 * 1024
+
+
+def _chunks(buf: mmap.mmap, start: int, stop: int) -> Iterator[tuple[int, int]]:
+    """Split ``buf[start:stop]`` into ranges that end on a line boundary.
+
+    `start` must be at the beginning of a line.
+    """
+    while start < stop:
+        end = start + _CHUNK_SIZE
+        if end >= stop:
+            end = stop
+        else:
+            newline = buf.find(b"\n", end, stop)
+            end = stop if newline < 0 else newline + 1
+        yield start, end
+        start = end
+
+
+def _count_range(
+    buf: mmap.mmap, start: int, stop: int, counter: StatusCounter
+) -> None:
+    """Add the status of every line in ``buf[start:stop]`` to `counter`."""
+    findall = _STATUS_PATTERN.findall
+    for chunk_start, chunk_end in _chunks(buf, start, stop):
+        tally = Counter(findall(buf, chunk_start, chunk_end))
+        for code, count in tally.items():
+            counter.add(int(code), count)
+
+
+def _map(path: PathLike) -> Optional[mmap.mmap]:
+    """Memory-map a file read-only, or return None if it is empty."""
+    with open(path, "rb") as file:  # noqa: PTH123
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def scan_log(
+    path: PathLike, counter: Optional[StatusCounter] = None
+) -> StatusCounter:
+    """Count the response statuses in an access log.
+
+    Per-code totals are read from the returned counter by indexing it, and
+    per-category totals with its ``category_counts()`` method.
+
+    Args:
+        path: Path to the log file.
+        counter: Counter to add to. A new counter is created if None.
+
+    Returns:
+        The counter holding the totals.
+
+    Examples:
+        >>> counts = scan_log("access.log")
+        >>> counts[404]
+        1312
+        >>> counts.category_counts()[StatusCategory.SERVER_ERROR]
+        27
+    """
+    if counter is None:
+        counter = StatusCounter()
+    buf = _map(path)
+    if buf is not None:
+        with buf:
+            _count_range(buf, 0, len(buf), counter)
+    return counter
+
+
+def iter_statuses(
+    path: PathLike, fallback: type[HTTPStatus] = HTTPStatus
+) -> Iterator[tuple[int, type[HTTPStatus]]]:
+    """Yield the offset and status class of every line in an access log.
+
+    The file stays mapped until the generator is exhausted or closed.
+
+    Args:
+        path: Path to the log file.
+        fallback: Class yielded for codes with no registered class.
+
+    Yields:
+        ``(offset, status_class)`` pairs, where `offset` is the byte offset
+        of the start of the line.
+    """
+    buf = _map(path)
+    if buf is None:
+        return
+    _load_registry()
+    classes = [
+        fallback if status_class is None else status_class
+        for status_class in _REGISTRY
+    ]
+    finditer = _STATUS_PATTERN.finditer
+    with buf:
+        for chunk_start, chunk_end in _chunks(buf, 0, len(buf)):
+            for match in finditer(buf, chunk_start, chunk_end):
+                code = int(match.group(1))
+                newline = buf.rfind(b"\n", chunk_start, match.start())
+                yield (
+                    chunk_start if newline < 0 else newline + 1,
+                    classes[code] if code < _REGISTRY_SIZE else fallback,
+                )
+
+
+def _line_start(buf: mmap.mmap, offset: int) -> int:
+    """Return the start of the first line beginning at or after `offset`."""
+    if offset == 0:
+        return 0
+    newline = buf.find(b"\n", offset - 1)
+    return len(buf) if newline < 0 else newline + 1
+
+
+def _scan_shard(path: PathLike, start: int, stop: int) -> StatusCounter:
+    """Count the lines that begin within ``[start, stop)`` of a file.
+
+    Both ends are moved forward to the next line boundary, so adjacent
+    shards split the file between them without overlap, however the byte
+    offsets fall.
+    """
+    counter = StatusCounter()
+    buf = _map(path)
+    if buf is not None:
+        with buf:
+            start = _line_start(buf, start)
+            stop = len(buf) if stop >= len(buf) else _line_start(buf, stop)
+            _count_range(buf, start, stop, counter)
+    return counter
+
+
+def _shards(
+    paths: Iterable[PathLike], shard_size: int
+) -> Iterator[tuple[PathLike, int, int]]:
+    """Split each non-empty file into byte ranges of about `shard_size`."""
+    for path in paths:
+        size = os.stat(path).st_size  # noqa: PTH116
+        for start in range(0, size, shard_size):
+            yield path, start, min(start + shard_size, size)
+
+
+def aggregate_logs(
+    paths: Iterable[PathLike],
+    workers: Optional[int] = None,
+    *,
+    shard_size: int = _SHARD_SIZE,
+) -> StatusCounter:
+    """Count the response statuses across many access logs in parallel.
+
+    Each file is split into line-aligned byte ranges of about `shard_size`
+    bytes, which are scanned across a pool of worker processes. Every worker
+    returns a StatusCounter for its range, which the calling process merges
+    into the result.
+
+    Args:
+        paths: Paths to the log files.
+        workers: Number of worker processes. Defaults to the number of CPUs.
+            With 1, the files are scanned in the calling process.
+        shard_size: Approximate number of bytes scanned per task.
+
+    Returns:
+        A counter holding the totals across every file.
+
+    Raises:
+        ValueError: If `workers` or `shard_size` is less than 1.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or shard_size < 1:
+        msg = "workers and shard_size must be at least 1"
+        raise ValueError(msg)
+
+    total = StatusCounter()
+    if workers == 1:
+        for path in paths:
+            scan_log(path, total)
+        return total
+
+    shards = list(_shards(paths, shard_size))
+    if not shards:
+        return total
+    with ProcessPoolExecutor(min(workers, len(shards))) as executor:
+        for counter in executor.map(_scan_shard, *zip(*shards)):
+            total.merge(counter)
+    return total
+
+
+__all__ = [
+    "aggregate_logs",
+    "iter_statuses",
+    "scan_log",
+]
@@ -0,0 +1,96 @@
+"""Vectorised HTTP status helpers for NumPy arrays.
+
+This module is optional and is never imported by the package itself. Import
+it explicitly as ``response_codes.numpy``; it requires NumPy to be installed.
+
+Every helper works by indexing a precomputed lookup table with the input
+array, so no Python code runs per element. Inputs may be any integer array
+(for example an int16 column); values outside 0-999 are treated as unknown
+codes.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    msg = "response_codes.numpy requires NumPy to be installed"
+    raise ImportError(msg) from exc
+
+from ._core import _REGISTRY, _REGISTRY_SIZE, _load_registry
+from ._is_category import _CATEGORY_TABLE, StatusCategory
+
+# Category value for every code in 0-999. Entries 0 and 999 are UNKNOWN, so
+# clipping out-of-range indices onto the table edges is always correct.
+_CATEGORIES = np.frombuffer(_CATEGORY_TABLE, dtype=np.uint8)
+_ERRORS = _CATEGORIES >= StatusCategory.CLIENT_ERROR
+
+
+def _as_code_array(codes: Any) -> np.ndarray[Any, Any]:  # noqa: ANN401
+    """Return `codes` as an integer ndarray without copying if possible.
+
+    Raises:
+        TypeError: If `codes` does not hold integers.
+    """
+    array = np.asarray(codes)
+    if array.dtype.kind not in "iu":
+        msg = "codes must be an array of integer status codes"
+        raise TypeError(msg)
+    return array
+
+
+def categorize(codes: Any) -> np.ndarray[Any, np.dtype[np.uint8]]:  # noqa: ANN401
+    """Return the StatusCategory value of every code in `codes`.
+
+    Args:
+        codes: An integer array (or array-like) of status codes.
+
+    Returns:
+        A uint8 array of the same shape holding StatusCategory values.
+    """
+    return np.take(_CATEGORIES, _as_code_array(codes), mode="clip")
+
+
+def is_error_mask(codes: Any) -> np.ndarray[Any, np.dtype[np.bool_]]:  # noqa: ANN401
+    """Return a mask that is True where a code is a 4xx or 5xx error.
+
+    Args:
+        codes: An integer array (or array-like) of status codes.
+
+    Returns:
+        A boolean array of the same shape.
+    """
+    return np.take(_ERRORS, _as_code_array(codes), mode="clip")
+
+
+def to_messages(codes: Any) -> np.ndarray[Any, np.dtype[np.object_]]:  # noqa: ANN401
+    """Return the reason phrase of every code in `codes`.
+
+    Unregistered codes map to an empty string. The table is built from the
+    registry on each call, so custom status classes are always included.
+
+    Args:
+        codes: An integer array (or array-like) of status codes.
+
+    Returns:
+        An object array of the same shape holding ``str`` messages.
+    """
+    _load_registry()
+    # One extra trailing slot catches every clipped out-of-range code; slot 0
+    # is never registered, so clipped negative codes map to "" as well.
+    messages = np.empty(_REGISTRY_SIZE + 1, dtype=object)
+    messages[:_REGISTRY_SIZE] = [
+        "" if status_class is None else status_class.message
+        for status_class in _REGISTRY
+    ]
+    messages[_REGISTRY_SIZE] = ""
+    return np.take(messages, _as_code_array(codes), mode="clip")
+
+
+__all__ = [
+    "categorize",
+    "is_error_mask",
+    "to_messages",
+]
@@ -0,0 +1,265 @@
+"""Tests for the asyncio retry executor."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from response_codes import (
+    HTTP_404_NOT_FOUND,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_502_BAD_GATEWAY,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    AsyncRetrier,
+    HTTPStatus,
+    RetryBudget,
+    RetryPolicy,
+    StatusCategory,
+)
+
+
+class RecordingSleep:
+    """Fake sleep that records delays without waiting."""
+
+    def __init__(self) -> None:
+        """Start with no recorded delays."""
+        self.delays: list[float] = []
+
+    async def __call__(self, delay: float) -> None:
+        """Record the delay and yield to the event loop."""
+        self.delays.append(delay)
+        await asyncio.sleep(0)
+
+
+class Flaky:
+    """Coroutine function that raises the given failures, then succeeds."""
+
+    def __init__(self, *failures: HTTPStatus) -> None:
+        """Queue the failures to raise."""
+        self.failures = list(failures)
+        self.calls = 0
+
+    async def __call__(self, value: str = "ok") -> str:
+        """Raise the next queued failure, or return `value`."""
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return value
+
+
+def policy(max_attempts: int = 3) -> RetryPolicy:
+    """Return a policy with predictable delays."""
+    return RetryPolicy(max_attempts=max_attempts, jitter=False)
+
+
+class TestAsyncRetrier:
+    """Test retrying coroutine functions."""
+
+    def test_retries_until_success(self) -> None:
+        """Retry retryable failures and return the eventual result."""
+        sleep = RecordingSleep()
+        retrier = AsyncRetrier(policy(), sleep=sleep)
+        func = Flaky(
+            HTTP_503_SERVICE_UNAVAILABLE(), HTTP_429_TOO_MANY_REQUESTS()
+        )
+        assert asyncio.run(retrier.call(func, "done")) == "done"
+        assert func.calls == 3
+        assert sleep.delays == [0.1, 0.2]
+        assert retrier.failures[503] == 1
+        assert retrier.failures[429] == 1
+        assert retrier.retries.total() == 2
+
+    def test_non_retryable_raises_immediately(self) -> None:
+        """Re-raise statuses outside the retry set without waiting."""
+        sleep = RecordingSleep()
+        retrier = AsyncRetrier(policy(), sleep=sleep)
+        func = Flaky(HTTP_404_NOT_FOUND())
+        with pytest.raises(HTTP_404_NOT_FOUND):
+            asyncio.run(retrier.call(func))
+        assert func.calls == 1
+        assert sleep.delays == []
+        assert retrier.failures[404] == 1
+        assert retrier.retries.total() == 0
+
+    def test_attempt_limit(self) -> None:
+        """Re-raise the last failure once the attempts are used up."""
+        retrier = AsyncRetrier(policy(2), sleep=RecordingSleep())
+        func = Flaky(*[HTTP_503_SERVICE_UNAVAILABLE() for _ in range(5)])
+        with pytest.raises(HTTP_503_SERVICE_UNAVAILABLE):
+            asyncio.run(retrier.call(func))
+        assert func.calls == 2
+        assert retrier.failures[503] == 2
+        assert retrier.retries[503] == 1
+
+    def test_retry_on_category(self) -> None:
+        """Retry every status in a category given to retry_on."""
+        retrier = AsyncRetrier(
+            policy(),
+            retry_on=[StatusCategory.SERVER_ERROR],
+            sleep=RecordingSleep(),
+        )
+        func = Flaky(HTTP_502_BAD_GATEWAY())
+        assert asyncio.run(retrier.call(func)) == "ok"
+        func = Flaky(HTTP_429_TOO_MANY_REQUESTS())
+        with pytest.raises(HTTP_429_TOO_MANY_REQUESTS):
+            asyncio.run(retrier.call(func))
+
+    def test_retry_on_codes(self) -> None:
+        """Retry only the codes given to retry_on."""
+        retrier = AsyncRetrier(
+            policy(),
+            retry_on=[404, HTTP_502_BAD_GATEWAY],
+            sleep=RecordingSleep(),
+        )
+        assert asyncio.run(retrier.call(Flaky(HTTP_404_NOT_FOUND()))) == "ok"
+        assert asyncio.run(retrier.call(Flaky(HTTP_502_BAD_GATEWAY()))) == "ok"
+        with pytest.raises(HTTP_503_SERVICE_UNAVAILABLE):
+            asyncio.run(retrier.call(Flaky(HTTP_503_SERVICE_UNAVAILABLE())))
+
+    def test_invalid_retry_on_raises(self) -> None:
+        """Reject codes outside the supported range."""
+        with pytest.raises(ValueError, match="0-999"):
+            AsyncRetrier(retry_on=[1000])
+
+    def test_retry_after_attribute(self) -> None:
+        """Wait for the exception's retry_after instead of the backoff."""
+        sleep = RecordingSleep()
+        retrier = AsyncRetrier(policy(), sleep=sleep)
+        header = HTTP_429_TOO_MANY_REQUESTS()
+        header.retry_after = "7"  # type: ignore[attr-defined]
+        seconds = HTTP_503_SERVICE_UNAVAILABLE()
+        seconds.retry_after = 1.5  # type: ignore[attr-defined]
+        asyncio.run(retrier.call(Flaky(header, seconds)))
+        assert sleep.delays == [7.0, 1.5]
+
+    def test_retry_after_attribute_bounded(self) -> None:
+        """Clamp retry_after to [0, max_delay], ignoring non-finite values."""
+        sleep = RecordingSleep()
+        retrier = AsyncRetrier(
+            RetryPolicy(max_attempts=5, max_delay=10.0, jitter=False),
+            sleep=sleep,
+        )
+        failures = []
+        for retry_after in (1e9, -5.0, float("inf"), "1" + "0" * 400):
+            exc = HTTP_503_SERVICE_UNAVAILABLE()
+            exc.retry_after = retry_after  # type: ignore[attr-defined]
+            failures.append(exc)
+        asyncio.run(retrier.call(Flaky(*failures)))
+        assert sleep.delays == [10.0, 0.0, 0.4, 0.8]
+
+    def test_other_exceptions_propagate(self) -> None:
+        """Leave exceptions that are not statuses alone."""
+
+        async def fail() -> None:
+            raise KeyError
+
+        retrier = AsyncRetrier(policy(), sleep=RecordingSleep())
+        with pytest.raises(KeyError):
+            asyncio.run(retrier.call(fail))
+
+    def test_decorator(self) -> None:
+        """Wrap a coroutine function, keeping its metadata."""
+        retrier = AsyncRetrier(policy(), sleep=RecordingSleep())
+        func = Flaky(HTTP_503_SERVICE_UNAVAILABLE())
+
+        @retrier
+        async def fetch(value: str) -> str:
+            """Fetch a value."""
+            return await func(value)
+
+        assert fetch.__name__ == "fetch"
+        assert fetch.__doc__ == "Fetch a value."
+        assert asyncio.run(fetch("body")) == "body"
+        assert func.calls == 2
+
+    def test_cancel_during_wait(self) -> None:
+        """Propagate cancellation while waiting between attempts."""
+        retrier = AsyncRetrier(RetryPolicy(base_delay=60.0, jitter=False))
+        func = Flaky(*[HTTP_503_SERVICE_UNAVAILABLE() for _ in range(3)])
+
+        async def main() -> None:
+            task = asyncio.ensure_future(retrier.call(func))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert func.calls == 1
+
+    def test_does_not_block_concurrent_tasks(self) -> None:
+        """Let other tasks run while a call waits to retry."""
+        retrier = AsyncRetrier(RetryPolicy(base_delay=0.05, jitter=False))
+        order: list[str] = []
+
+        async def slow() -> str:
+            await retrier.call(Flaky(HTTP_503_SERVICE_UNAVAILABLE()))
+            order.append("retried")
+            return "ok"
+
+        async def fast() -> None:
+            await asyncio.sleep(0)
+            order.append("fast")
+
+        async def main() -> None:
+            await asyncio.gather(slow(), fast())
+
+        asyncio.run(main())
+        assert order == ["fast", "retried"]
+
+
+class TestRetryBudget:
+    """Test the retry budget shared between tasks."""
+
+    def test_spend_and_deposit(self) -> None:
+        """Spend whole tokens and refill by the ratio per call."""
+        budget = RetryBudget(ratio=0.5, capacity=1)
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+        budget.deposit()
+        assert budget.try_spend() is False
+        budget.deposit()
+        assert budget.try_spend() is True
+
+    def test_capacity_caps_tokens(self) -> None:
+        """Never hold more tokens than the capacity."""
+        budget = RetryBudget(ratio=1.0, capacity=2)
+        for _ in range(5):
+            budget.deposit()
+        assert budget.tokens == 2
+
+    def test_invalid_arguments_raise(self) -> None:
+        """Reject a negative ratio or a capacity below one token."""
+        with pytest.raises(ValueError, match="ratio"):
+            RetryBudget(ratio=-0.1)
+        with pytest.raises(ValueError, match="capacity"):
+            RetryBudget(capacity=0.5)
+
+    def test_shared_budget_limits_retries(self) -> None:
+        """Stop retrying across tasks once the shared budget runs out."""
+        budget = RetryBudget(ratio=0.0, capacity=3)
+        retrier = AsyncRetrier(policy(5), budget=budget, sleep=RecordingSleep())
+        funcs = [
+            Flaky(*[HTTP_503_SERVICE_UNAVAILABLE() for _ in range(4)])
+            for _ in range(4)
+        ]
+
+        async def main() -> list[object]:
+            return await asyncio.gather(
+                *(retrier.call(func) for func in funcs), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert retrier.retries[503] == 3
+        assert sum(func.calls for func in funcs) == 7
+        assert all(
+            isinstance(result, HTTP_503_SERVICE_UNAVAILABLE)
+            for result in results
+        )
+
+    def test_repr(self) -> None:
+        """Show the remaining tokens."""
+        assert repr(RetryBudget(0.1, 10)) == (
+            "RetryBudget(ratio=0.1, capacity=10, tokens=10)"
+        )
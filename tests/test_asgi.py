@@ -0,0 +1,172 @@
+"""Tests for the ASGI status middleware."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import MutableMapping
+from typing import Any, Callable
+
+import pytest
+
+from response_codes import (
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    PROBLEM_JSON_MEDIA_TYPE,
+    ASGIStatusMiddleware,
+    HTTPStatus,
+    ProblemRenderer,
+)
+
+Message = MutableMapping[str, Any]
+
+OK_START: Message = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [(b"content-type", b"text/plain")],
+}
+OK_BODY: Message = {"type": "http.response.body", "body": b"ok"}
+
+
+def raising(exc: BaseException) -> Callable[..., Any]:
+    """Return an ASGI app that raises `exc`."""
+
+    async def app(scope: Message, receive: Any, send: Any) -> None:  # noqa: ANN401
+        raise exc
+
+    return app
+
+
+async def ok_app(scope: Message, receive: Any, send: Any) -> None:  # noqa: ANN401
+    """Send a plain 200 response."""
+    await send(OK_START)
+    await send(OK_BODY)
+
+
+def call(app: Callable[..., Any], scope_type: str = "http") -> list[Message]:
+    """Run an ASGI app in-process and return the messages it sent."""
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    asyncio.run(app({"type": scope_type}, receive, send))
+    return sent
+
+
+class TestASGIStatusMiddleware:
+    """Test translating raised statuses into ASGI responses."""
+
+    def test_success_passes_through(self) -> None:
+        """Forward the application's own messages untouched."""
+        sent = call(ASGIStatusMiddleware(ok_app))
+        assert sent[0] is OK_START
+        assert sent[1] is OK_BODY
+
+    def test_status_becomes_response(self) -> None:
+        """Send the raised status with a JSON body."""
+        sent = call(ASGIStatusMiddleware(raising(HTTP_404_NOT_FOUND())))
+        start, body = sent
+        assert start["type"] == "http.response.start"
+        assert start["status"] == 404
+        headers = dict(start["headers"])
+        assert headers[b"content-type"] == b"application/json"
+        assert headers[b"content-length"] == b"%d" % len(body["body"])
+        assert body["type"] == "http.response.body"
+        assert json.loads(body["body"]) == {
+            "error_code": 404,
+            "message": "Not Found",
+        }
+
+    def test_detail_in_body(self) -> None:
+        """Include the exception's detail in the body."""
+        app = ASGIStatusMiddleware(raising(HTTP_404_NOT_FOUND("no user")))
+        _, body = call(app)
+        assert json.loads(body["body"])["detail"] == "no user"
+
+    def test_responses_cached_per_class(self) -> None:
+        """Reuse the pre-built response for exceptions without detail."""
+        middleware = ASGIStatusMiddleware(ok_app)
+        first = middleware.response(HTTP_503_SERVICE_UNAVAILABLE())
+        assert middleware.response(HTTP_503_SERVICE_UNAVAILABLE()) is first
+        detailed = middleware.response(HTTP_503_SERVICE_UNAVAILABLE("busy"))
+        assert detailed is not first
+
+    def test_headers_are_fresh_lists(self) -> None:
+        """Send a new header list, so other middleware can change it."""
+        app = ASGIStatusMiddleware(raising(HTTP_404_NOT_FOUND()))
+        first, _ = call(app)
+        first["headers"].append((b"x-extra", b"1"))
+        second, _ = call(app)
+        assert (b"x-extra", b"1") not in second["headers"]
+
+    def test_problem_details(self) -> None:
+        """Render Problem Details bodies when a renderer is given."""
+        app = ASGIStatusMiddleware(
+            raising(HTTP_404_NOT_FOUND("gone")),
+            problem_renderer=ProblemRenderer("https://errors.example.com/"),
+        )
+        start, body = call(app)
+        headers = dict(start["headers"])
+        assert headers[b"content-type"] == PROBLEM_JSON_MEDIA_TYPE.encode()
+        document = json.loads(body["body"])
+        assert document["type"] == "https://errors.example.com/404"
+        assert document["detail"] == "gone"
+
+    def test_extra_headers(self) -> None:
+        """Add the configured headers to every error response."""
+        app = ASGIStatusMiddleware(
+            raising(HTTP_404_NOT_FOUND()),
+            headers=[(b"cache-control", b"no-store")],
+        )
+        start, _ = call(app)
+        assert (b"cache-control", b"no-store") in start["headers"]
+
+    def test_no_body_statuses(self) -> None:
+        """Send 304 Not Modified without a body."""
+        start, body = call(
+            ASGIStatusMiddleware(raising(HTTP_304_NOT_MODIFIED()))
+        )
+        assert start["status"] == 304
+        assert start["headers"] == []
+        assert body["body"] == b""
+
+    def test_invalid_code_is_server_error(self) -> None:
+        """Send 500 for exceptions without a valid status code."""
+        start, body = call(ASGIStatusMiddleware(raising(HTTPStatus())))
+        assert start["status"] == 500
+        assert json.loads(body["body"])["error_code"] == 500
+
+    def test_status_after_response_started(self) -> None:
+        """Re-raise statuses raised once the response has started."""
+        sent: list[Message] = []
+
+        async def app(scope: Message, receive: Any, send: Any) -> None:  # noqa: ANN401
+            await send(OK_START)
+            raise HTTP_503_SERVICE_UNAVAILABLE
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        middleware = ASGIStatusMiddleware(app)
+        with pytest.raises(HTTP_503_SERVICE_UNAVAILABLE):
+            asyncio.run(middleware({"type": "http"}, receive, send))
+        assert sent == [OK_START]
+
+    def test_other_exceptions_propagate(self) -> None:
+        """Leave exceptions that are not statuses to the server."""
+        with pytest.raises(KeyError):
+            call(ASGIStatusMiddleware(raising(KeyError())))
+
+    def test_non_http_scopes_pass_through(self) -> None:
+        """Leave websocket and lifespan scopes to the application."""
+        app = ASGIStatusMiddleware(raising(HTTP_404_NOT_FOUND()))
+        with pytest.raises(HTTP_404_NOT_FOUND):
+            call(app, "websocket")
@@ -0,0 +1,233 @@
+"""Tests for the status-driven circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from response_codes import (
+    HTTP_404_NOT_FOUND,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    StatusCategory,
+)
+
+
+class FakeClock:
+    """A manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        """Start the clock at `now`."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def state_of(breaker: CircuitBreaker) -> CircuitState:
+    """Return the breaker's state, without narrowing it for type checkers."""
+    return breaker.state
+
+
+def open_breaker(clock: FakeClock) -> CircuitBreaker:
+    """Return a breaker that has just tripped."""
+    breaker = CircuitBreaker(0.5, min_calls=4, reset_timeout=5.0, clock=clock)
+    for code in (200, 200, 503, 429):
+        breaker.record(code)
+    assert state_of(breaker) is CircuitState.OPEN
+    return breaker
+
+
+class TestCircuitBreaker:
+    """Test the closed, open and half-open states."""
+
+    def test_stays_closed_below_threshold(self) -> None:
+        """Keep the circuit closed while failures are below the threshold."""
+        breaker = CircuitBreaker(0.5, min_calls=4, clock=FakeClock())
+        for code in (200, 200, 200, 503, 404, 404):
+            breaker.record(code)
+        assert state_of(breaker) is CircuitState.CLOSED
+        assert breaker.failure_rate() == pytest.approx(1 / 6)
+        assert breaker.allow_request() is True
+
+    def test_min_calls(self) -> None:
+        """Wait for enough outcomes before opening."""
+        breaker = CircuitBreaker(0.5, min_calls=3, clock=FakeClock())
+        breaker.record(HTTP_503_SERVICE_UNAVAILABLE)
+        breaker.record(HTTP_500_INTERNAL_SERVER_ERROR())
+        assert state_of(breaker) is CircuitState.CLOSED
+        breaker.record(503)
+        assert state_of(breaker) is CircuitState.OPEN
+
+    def test_opens_on_5xx_and_429(self) -> None:
+        """Count server errors and 429 as failures by default."""
+        breaker = open_breaker(FakeClock())
+        assert breaker.allow_request() is False
+        assert breaker.is_failure(HTTP_429_TOO_MANY_REQUESTS)
+        assert not breaker.is_failure(HTTP_404_NOT_FOUND)
+
+    def test_category_counts(self) -> None:
+        """Keep rolling counts per outcome category."""
+        breaker = CircuitBreaker(clock=FakeClock())
+        for code in (200, 404, 429, 503):
+            breaker.record(code)
+        counts = breaker.category_counts()
+        assert counts[StatusCategory.SUCCESS] == 1
+        assert counts[StatusCategory.CLIENT_ERROR] == 2
+        assert counts[StatusCategory.SERVER_ERROR] == 1
+
+    def test_half_open_success_closes(self) -> None:
+        """Close the circuit when a trial call succeeds."""
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now += 5.0
+        assert state_of(breaker) is CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record(200)
+        assert state_of(breaker) is CircuitState.CLOSED
+        assert breaker.failure_rate() == 0.0
+
+    def test_half_open_failure_reopens(self) -> None:
+        """Open the circuit again when a trial call fails."""
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now += 5.0
+        assert breaker.allow_request() is True
+        breaker.record(HTTP_503_SERVICE_UNAVAILABLE())
+        assert state_of(breaker) is CircuitState.OPEN
+        clock.now += 4.0
+        assert breaker.allow_request() is False
+
+    def test_old_outcomes_expire(self) -> None:
+        """Forget outcomes that have left the window."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(0.5, min_calls=2, window=10.0, clock=clock)
+        breaker.record(503)
+        clock.now += 11.0
+        breaker.record(200)
+        breaker.record(503)
+        assert state_of(breaker) is CircuitState.OPEN
+        assert breaker.failure_rate() == 0.5
+
+    def test_custom_trip_on(self) -> None:
+        """Count only the configured statuses as failures."""
+        breaker = CircuitBreaker(
+            1.0,
+            trip_on=[404, StatusCategory.SERVER_ERROR, 503],
+            min_calls=2,
+            clock=FakeClock(),
+        )
+        assert not breaker.is_failure(429)
+        breaker.record(404)
+        breaker.record(HTTP_503_SERVICE_UNAVAILABLE)
+        assert state_of(breaker) is CircuitState.OPEN
+
+    def test_reset(self) -> None:
+        """Close the circuit and clear the counts."""
+        breaker = open_breaker(FakeClock())
+        breaker.reset()
+        assert state_of(breaker) is CircuitState.CLOSED
+        assert breaker.category_counts()[StatusCategory.SERVER_ERROR] == 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"threshold": 0.0}, "threshold"),
+            ({"threshold": 1.5}, "threshold"),
+            ({"min_calls": 0}, "min_calls"),
+            ({"half_open_calls": 0}, "half_open_calls"),
+            ({"reset_timeout": -1.0}, "reset_timeout"),
+            ({"trip_on": [1000]}, "0-999"),
+        ],
+    )
+    def test_invalid_arguments_raise(
+        self, kwargs: dict[str, object], match: str
+    ) -> None:
+        """Reject out-of-range arguments."""
+        with pytest.raises(ValueError, match=match):
+            CircuitBreaker(**kwargs)  # type: ignore[arg-type]
+
+    def test_repr(self) -> None:
+        """Show the state and threshold."""
+        breaker = CircuitBreaker(0.25, clock=FakeClock())
+        assert repr(breaker) == "<CircuitBreaker state='closed' threshold=0.25>"
+
+
+class TestCircuitBreakerContext:
+    """Test guarding calls with the context manager."""
+
+    def test_records_outcomes(self) -> None:
+        """Record normal exits as successes and statuses as raised."""
+        breaker = CircuitBreaker(clock=FakeClock())
+        with breaker:
+            pass
+        with pytest.raises(HTTP_503_SERVICE_UNAVAILABLE), breaker:
+            raise HTTP_503_SERVICE_UNAVAILABLE
+        with pytest.raises(KeyError), breaker:
+            raise KeyError
+        counts = breaker.category_counts()
+        assert counts[StatusCategory.SUCCESS] == 1
+        assert counts[StatusCategory.SERVER_ERROR] == 1
+        assert sum(counts.values()) == 2
+
+    def test_open_circuit_fails_fast(self) -> None:
+        """Raise CircuitOpenError, a 503, without running the block."""
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now += 2.0
+        ran = False
+        with pytest.raises(CircuitOpenError) as info, breaker:
+            ran = True
+        assert not ran
+        assert isinstance(info.value, HTTP_503_SERVICE_UNAVAILABLE)
+        assert info.value.status_code == 503
+        assert info.value.retry_after == 3.0
+
+    def test_other_exception_releases_trial_call(self) -> None:
+        """Let another trial call through when one ends without a status."""
+        clock = FakeClock()
+        breaker = open_breaker(clock)
+        clock.now += 5.0
+        with pytest.raises(KeyError), breaker:
+            raise KeyError
+        assert state_of(breaker) is CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+
+    def test_async_context(self) -> None:
+        """Guard calls made from coroutines."""
+        breaker = CircuitBreaker(1.0, min_calls=1, clock=FakeClock())
+
+        async def call() -> None:
+            async with breaker:
+                raise HTTP_500_INTERNAL_SERVER_ERROR
+
+        with pytest.raises(HTTP_500_INTERNAL_SERVER_ERROR):
+            asyncio.run(call())
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(call())
+
+    def test_shared_between_threads(self) -> None:
+        """Count every outcome recorded from many threads."""
+        breaker = CircuitBreaker(1.0, min_calls=10**6, clock=FakeClock())
+
+        def worker() -> None:
+            for _ in range(1000):
+                breaker.record(200)
+                breaker.record(503)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counts = breaker.category_counts()
+        assert counts[StatusCategory.SUCCESS] == 4000
+        assert counts[StatusCategory.SERVER_ERROR] == 4000
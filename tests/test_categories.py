@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,11 +11,23 @@ if TYPE_CHECKING:
 
 import pytest
 
+import response_codes
 from response_codes import (
     HTTP_103_EARLY_HINTS,
     HTTP_200_OK,
     HTTP_422_UNPROCESSABLE_ENTITY,
     HTTP_500_INTERNAL_SERVER_ERROR,
+    ClientErrorStatus,
+    HTTPStatus,
+    HTTPStatusMeta,
+    InformationalStatus,
+    RedirectionStatus,
+    ServerErrorStatus,
+    StatusCategory,
+    SuccessStatus,
+    category_of,
+    classify_many,
+    count_by_category,
     is_client_error,
     is_informational,
     is_redirection,
@@ -159,3 +173,227 @@ class TestStatusCategories:
         """Raise TypeError for unsupported input types."""
         with pytest.raises(TypeError):
             predicate(value)
+
+
+class TestCategoryOf:
+    """Tests for the table-driven category_of() helper."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (-1, StatusCategory.UNKNOWN),
+            (0, StatusCategory.UNKNOWN),
+            (99, StatusCategory.UNKNOWN),
+            (100, StatusCategory.INFORMATIONAL),
+            (HTTP_103_EARLY_HINTS, StatusCategory.INFORMATIONAL),
+            (200, StatusCategory.SUCCESS),
+            (HTTP_200_OK(), StatusCategory.SUCCESS),
+            (399, StatusCategory.REDIRECTION),
+            (HTTP_422_UNPROCESSABLE_ENTITY, StatusCategory.CLIENT_ERROR),
+            (500, StatusCategory.SERVER_ERROR),
+            (599, StatusCategory.SERVER_ERROR),
+            (600, StatusCategory.UNKNOWN),
+            (999, StatusCategory.UNKNOWN),
+            (10**6, StatusCategory.UNKNOWN),
+        ],
+    )
+    def test_category_of(self, value: object, expected: object) -> None:
+        """Map ints, classes and instances to their category."""
+        assert category_of(value) is expected  # type: ignore[arg-type]
+
+    def test_category_of_agrees_with_predicates(self) -> None:
+        """Agree with every is_* predicate across the whole table."""
+        predicates = {
+            StatusCategory.INFORMATIONAL: is_informational,
+            StatusCategory.SUCCESS: is_success,
+            StatusCategory.REDIRECTION: is_redirection,
+            StatusCategory.CLIENT_ERROR: is_client_error,
+            StatusCategory.SERVER_ERROR: is_server_error,
+        }
+        for code in range(-5, 1005):
+            category = category_of(code)
+            for expected, predicate in predicates.items():
+                assert predicate(code) is (category is expected)
+
+    def test_int_subclass_is_accepted(self) -> None:
+        """Accept int subclasses such as IntEnum members."""
+        assert category_of(StatusCategory.SERVER_ERROR) is (
+            StatusCategory.UNKNOWN
+        )
+
+    def test_custom_metaclass_status_is_accepted(self) -> None:
+        """Accept classes created directly by HTTPStatusMeta."""
+
+        # Reuse registered codes so these classes stay out of the registry.
+        class CustomStatus(HTTPStatus):
+            """Custom status subclass."""
+
+            status_code = 204
+
+        class MinimalStatus(Exception, metaclass=HTTPStatusMeta):
+            """Class created by the metaclass without HTTPStatus."""
+
+            status_code = 503
+
+        assert category_of(CustomStatus) is StatusCategory.SUCCESS
+        assert category_of(CustomStatus()) is StatusCategory.SUCCESS
+        assert category_of(MinimalStatus) is (  # type: ignore[arg-type]
+            StatusCategory.SERVER_ERROR
+        )
+
+    def test_bool_is_rejected_repeatedly(self) -> None:
+        """Reject bool on every call, not just the first."""
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                category_of(True)  # noqa: FBT003
+
+
+class TestBatchClassification:
+    """Tests for classify_many() and count_by_category()."""
+
+    CODES = (99, 100, 204, 301, 404, 429, 500, 599, 600, 999, 1000, 65535)
+
+    def expected(self) -> bytes:
+        """Return the categories produced by the scalar helper."""
+        return bytes(category_of(code) for code in self.CODES)
+
+    def test_iterable_of_ints(self) -> None:
+        """Classify a plain iterable of ints."""
+        assert classify_many(list(self.CODES)) == self.expected()
+        assert classify_many(iter(self.CODES)) == self.expected()
+
+    def test_iterable_of_classes_and_instances(self) -> None:
+        """Classify status classes and instances like the scalar helpers."""
+        values = [HTTP_200_OK, HTTP_422_UNPROCESSABLE_ENTITY(), -7, 10**9]
+        assert classify_many(values) == bytes(  # type: ignore[arg-type]
+            [
+                StatusCategory.SUCCESS,
+                StatusCategory.CLIENT_ERROR,
+                StatusCategory.UNKNOWN,
+                StatusCategory.UNKNOWN,
+            ]
+        )
+
+    def test_unsigned_short_array(self) -> None:
+        """Classify an array('H') through the lookup table."""
+        codes = array("H", self.CODES)
+        assert classify_many(codes) == self.expected()
+        assert classify_many(memoryview(codes)) == self.expected()
+
+    def test_unsigned_short_edge_cases(self) -> None:
+        """Classify empty and strided 16-bit buffers."""
+        assert classify_many(array("H")) == b""
+        assert classify_many(b"") == b""
+        codes = array("H", self.CODES)
+        assert classify_many(memoryview(codes)[::2]) == self.expected()[::2]
+
+    def test_raw_bytes_buffer(self) -> None:
+        """Read raw byte buffers as native-endian 16-bit codes."""
+        raw = array("H", self.CODES).tobytes()
+        assert classify_many(raw) == self.expected()
+        assert classify_many(bytearray(raw)) == self.expected()
+        assert classify_many(memoryview(raw)) == self.expected()
+
+    def test_raw_bytes_buffer_odd_length(self) -> None:
+        """Reject raw buffers that do not hold whole 16-bit codes."""
+        with pytest.raises(ValueError, match="2 bytes"):
+            classify_many(b"\x00\x01\x02")
+
+    def test_signed_and_wide_arrays(self) -> None:
+        """Classify other integer buffer formats with bounds checks."""
+        for typecode in ("h", "i", "l", "q"):
+            codes = array(typecode, [-1, 200, 404, 503, 1000])
+            assert classify_many(codes) == bytes([0, 2, 4, 5, 0])
+
+    def test_non_integer_buffer_raises(self) -> None:
+        """Reject buffers holding floats."""
+        with pytest.raises(TypeError):
+            classify_many(array("d", [200.0]))  # type: ignore[arg-type]
+
+    def test_invalid_item_raises(self) -> None:
+        """Reject unsupported items like the scalar helpers."""
+        with pytest.raises(TypeError):
+            classify_many([200, "404"])  # type: ignore[list-item]
+
+    def test_agrees_with_scalar_predicates(self) -> None:
+        """Agree with category_of() over the full 16-bit range."""
+        codes = array("H", range(0x10000))
+        expected = bytes(category_of(code) for code in codes)
+        assert classify_many(codes) == expected
+        assert classify_many(list(codes)) == expected
+
+    def test_count_by_category(self) -> None:
+        """Count values per category across all input kinds."""
+        expected = {
+            StatusCategory.UNKNOWN: 5,
+            StatusCategory.INFORMATIONAL: 1,
+            StatusCategory.SUCCESS: 1,
+            StatusCategory.REDIRECTION: 1,
+            StatusCategory.CLIENT_ERROR: 2,
+            StatusCategory.SERVER_ERROR: 2,
+        }
+        assert count_by_category(self.CODES) == expected
+        assert count_by_category(array("H", self.CODES)) == expected
+
+    def test_count_by_category_empty(self) -> None:
+        """Return zero counts for every category on empty input."""
+        counts = count_by_category([])
+        assert set(counts) == set(StatusCategory)
+        assert sum(counts.values()) == 0
+
+    @pytest.mark.skipif(sys.byteorder != "little", reason="little-endian")
+    def test_raw_bytes_are_native_endian(self) -> None:
+        """Decode raw buffers with the platform byte order."""
+        assert classify_many((404).to_bytes(2, "little")) == bytes(
+            [StatusCategory.CLIENT_ERROR]
+        )
+
+
+CATEGORY_BASES = {
+    StatusCategory.INFORMATIONAL: InformationalStatus,
+    StatusCategory.SUCCESS: SuccessStatus,
+    StatusCategory.REDIRECTION: RedirectionStatus,
+    StatusCategory.CLIENT_ERROR: ClientErrorStatus,
+    StatusCategory.SERVER_ERROR: ServerErrorStatus,
+}
+
+
+class TestCategoryBases:
+    """Tests for the per-category base classes."""
+
+    def test_every_status_derives_from_its_category_base(self) -> None:
+        """Give each built-in class exactly the base of its category."""
+        names = [name for name in response_codes.__all__ if name[:5] == "HTTP_"]
+        classes = [getattr(response_codes, name) for name in names]
+        status_classes = [
+            cls
+            for cls in classes
+            if isinstance(cls, type) and issubclass(cls, HTTPStatus)
+        ]
+        assert len(status_classes) == 62
+        for status_class in status_classes:
+            category = category_of(status_class)
+            assert status_class.__bases__ == (CATEGORY_BASES[category],)
+            for other, base in CATEGORY_BASES.items():
+                assert issubclass(status_class, base) is (other is category)
+
+    def test_except_catches_category(self) -> None:
+        """Catch any status of a category with a single except clause."""
+        with pytest.raises(ClientErrorStatus):
+            raise HTTP_422_UNPROCESSABLE_ENTITY
+        caught: list[type[HTTPStatus]] = []
+        try:
+            raise HTTP_500_INTERNAL_SERVER_ERROR
+        except ClientErrorStatus:  # pragma: no cover
+            caught.append(ClientErrorStatus)
+        except ServerErrorStatus:
+            caught.append(ServerErrorStatus)
+        assert caught == [ServerErrorStatus]
+
+    @pytest.mark.parametrize("base", list(CATEGORY_BASES.values()))
+    def test_bases_are_not_registered(self, base: type[HTTPStatus]) -> None:
+        """Leave the bases without a code, so lookups are unchanged."""
+        assert issubclass(base, HTTPStatus)
+        assert base.status_code == 0
+        assert category_of(base) is StatusCategory.UNKNOWN
+        assert response_codes.lookup(200) is HTTP_200_OK
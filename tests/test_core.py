@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+import json
+import operator
+import pickle
+import struct
+from array import array
+from typing import Optional, get_type_hints
+
 import pytest
 
 from response_codes import (
@@ -9,6 +16,8 @@ from response_codes import (
     HTTP_404_NOT_FOUND,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTPStatus,
+    StatusCategory,
+    StatusCode,
 )
 
 
@@ -23,6 +32,15 @@ class TestHTTPStatusBase:
         """Test converting status message to string."""
         assert HTTP_404_NOT_FOUND.message == "Not Found"
 
+    def test_type_hints_resolve(self) -> None:
+        """Resolve the annotations of the class and its methods at runtime."""
+        hints = get_type_hints(HTTPStatus)
+        assert hints["detail"] == Optional[str]
+        assert hints["code"] is StatusCode
+        assert get_type_hints(HTTPStatus.__init__)["detail"] == Optional[str]
+        assert get_type_hints(HTTPStatus.to_json)["return"] is str
+        assert "extensions" in get_type_hints(HTTPStatus.to_problem_json)
+
     def test_equality_with_int(self) -> None:
         """Test equality comparison with integer."""
         assert HTTP_404_NOT_FOUND.status_code == 404
@@ -146,6 +164,72 @@ class TestHTTPStatusExceptions:
         assert isinstance(status, HTTPStatus)
         assert isinstance(status, Exception)
 
+    def test_exception_detail(self) -> None:
+        """Test the optional per-instance detail."""
+        assert HTTP_404_NOT_FOUND.detail is None
+        assert HTTP_404_NOT_FOUND().detail is None
+        status = HTTP_404_NOT_FOUND("no such user")
+        assert status.detail == "no such user"
+        assert str(status) == "Not Found"
+
+
+class TestJsonSerialization:
+    """Test the cached JSON error bodies."""
+
+    def test_class_to_json(self) -> None:
+        """Serialize the class without instantiating it."""
+        assert HTTP_404_NOT_FOUND.to_json() == (
+            '{"error_code": 404, "message": "Not Found"}'
+        )
+        assert HTTP_404_NOT_FOUND.to_json_bytes() == (
+            b'{"error_code": 404, "message": "Not Found"}'
+        )
+
+    def test_instance_to_json(self) -> None:
+        """Serialize an instance, including its detail."""
+        assert HTTP_404_NOT_FOUND().to_json() == HTTP_404_NOT_FOUND.to_json()
+        status = HTTP_404_NOT_FOUND("no such user")
+        assert json.loads(status.to_json()) == {
+            "error_code": 404,
+            "message": "Not Found",
+            "detail": "no such user",
+        }
+        assert json.loads(status.to_json_bytes()) == json.loads(
+            status.to_json()
+        )
+
+    def test_detail_argument(self) -> None:
+        """Use an explicit detail in place of the instance's own."""
+        status = HTTP_500_INTERNAL_SERVER_ERROR("from instance")
+        assert json.loads(status.to_json("explicit"))["detail"] == "explicit"
+        document = json.loads(HTTP_200_OK.to_json_bytes("from class"))
+        assert document["detail"] == "from class"
+
+    def test_description(self) -> None:
+        """Include the description only when asked to."""
+        document = json.loads(HTTP_404_NOT_FOUND.to_json(description=True))
+        assert document == {
+            "error_code": 404,
+            "message": "Not Found",
+            "description": HTTP_404_NOT_FOUND.description,
+        }
+        assert "description" not in json.loads(HTTP_404_NOT_FOUND.to_json())
+
+    def test_detail_is_escaped(self) -> None:
+        """Escape quotes, control and non-ASCII characters in the detail."""
+        detail = 'say "hi"\n\u00e9\u2603'
+        status = HTTP_404_NOT_FOUND(detail)
+        assert json.loads(status.to_json())["detail"] == detail
+        body = status.to_json_bytes()
+        assert body.isascii()
+        assert json.loads(body)["detail"] == detail
+
+    def test_constant_body_is_cached(self) -> None:
+        """Return the same object while there is no detail."""
+        body = HTTP_404_NOT_FOUND.to_json_bytes()
+        assert HTTP_404_NOT_FOUND().to_json_bytes() is body
+        assert HTTP_404_NOT_FOUND.to_json() is HTTP_404_NOT_FOUND.to_json()
+
 
 class TestImplicitConversions:
     """Ensure that implicit conversions work as expected."""
@@ -189,3 +273,74 @@ class TestMetaclassDefaults:
         assert int(MinimalStatus) == 0
         assert str(MinimalStatus) == ""
         assert MinimalStatus == 0
+
+
+class TestStatusCode:
+    """Test the interned int-subclass status code values."""
+
+    def test_code_is_interned_int(self) -> None:
+        """Expose one interned StatusCode instance per code."""
+        code = HTTP_404_NOT_FOUND.code
+        assert isinstance(code, StatusCode)
+        assert isinstance(code, int)
+        assert code == 404
+        assert code is HTTP_404_NOT_FOUND().code
+        assert hash(code) == hash(404)
+
+    def test_code_attributes(self) -> None:
+        """Carry the status class, message and category."""
+        code = HTTP_404_NOT_FOUND.code
+        assert code.status_class is HTTP_404_NOT_FOUND
+        assert code.message == "Not Found"
+        assert code.category is StatusCategory.CLIENT_ERROR
+
+    def test_unregistered_code_attributes(self) -> None:
+        """Report no class and an empty message for unregistered codes."""
+        code = StatusCode(599)
+        assert code.status_class is None
+        assert code.message == ""
+        assert code.category is StatusCategory.SERVER_ERROR
+
+    def test_code_works_as_int(self) -> None:
+        """Work with struct, array and sorting like a plain int."""
+        codes = [HTTP_500_INTERNAL_SERVER_ERROR.code, HTTP_200_OK.code]
+        assert struct.unpack("<H", struct.pack("<H", codes[0])) == (500,)
+        assert array("H", codes).tolist() == [500, 200]
+        assert sorted(codes) == [200, 500]
+        assert HTTP_200_OK.code + 4 == 204
+
+    def test_code_repr_and_str(self) -> None:
+        """Show the code in repr and as a plain number in str."""
+        assert repr(HTTP_404_NOT_FOUND.code) == "StatusCode(404)"
+        assert str(HTTP_404_NOT_FOUND.code) == "404"
+        assert f"{HTTP_404_NOT_FOUND.code}" == "404"
+
+    def test_code_pickles_to_interned_instance(self) -> None:
+        """Unpickle to the same interned instance."""
+        code = HTTP_404_NOT_FOUND.code
+        assert pickle.loads(pickle.dumps(code)) is code  # noqa: S301
+
+    def test_class_defined_code_attribute_is_kept(self) -> None:
+        """Leave a class's own `code` attribute untouched."""
+
+        class CustomStatus(HTTPStatus):
+            """Custom status with its own `code` attribute."""
+
+            code = "E404"  # type: ignore[assignment]
+
+        assert CustomStatus.code == "E404"  # type: ignore[comparison-overlap]
+
+
+class TestIndex:
+    """Test using status classes wherever an integer index is expected."""
+
+    def test_operator_index(self) -> None:
+        """Support operator.index() on status classes."""
+        assert operator.index(HTTP_404_NOT_FOUND) == 404
+
+    def test_range_and_indexing(self) -> None:
+        """Use status classes in range() and to index sequences."""
+        assert len(range(HTTP_200_OK, HTTP_404_NOT_FOUND)) == 204
+        table = list(range(1000))
+        assert table[HTTP_500_INTERNAL_SERVER_ERROR] == 500
+        assert struct.pack("<H", HTTP_404_NOT_FOUND) == struct.pack("<H", 404)
@@ -0,0 +1,118 @@
+"""Tests for the array-backed StatusCounter."""
+
+from __future__ import annotations
+
+import pickle
+from array import array
+
+import pytest
+
+from response_codes import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    StatusCategory,
+    StatusCounter,
+    count_by_category,
+)
+
+
+class TestStatusCounter:
+    """Test counting status codes with StatusCounter."""
+
+    def test_add_accepts_ints_classes_and_instances(self) -> None:
+        """Count ints, status classes and instances in the same slot."""
+        counter = StatusCounter()
+        counter.add(404)
+        counter.add(HTTP_404_NOT_FOUND)
+        counter.add(HTTP_404_NOT_FOUND())
+        counter.add(404, 2)
+        assert counter[404] == 5
+        assert counter[HTTP_404_NOT_FOUND] == 5
+        assert counter[200] == 0
+        assert counter.total() == 5
+
+    @pytest.mark.parametrize("code", [-1, 1000])
+    def test_add_out_of_range_raises(self, code: int) -> None:
+        """Reject codes that do not fit in the table."""
+        with pytest.raises(ValueError, match="outside the range"):
+            StatusCounter().add(code)
+
+    @pytest.mark.parametrize("count", [0, -1])
+    def test_add_invalid_count_raises(self, count: int) -> None:
+        """Reject counts below one, leaving the counter unchanged."""
+        counter = StatusCounter([404])
+        with pytest.raises(ValueError, match="count must be at least 1"):
+            counter.add(404, count)
+        assert counter[404] == 1
+
+    def test_add_invalid_type_raises(self) -> None:
+        """Reject unsupported value types."""
+        with pytest.raises(TypeError):
+            StatusCounter().add("404")  # type: ignore[arg-type]
+
+    def test_getitem_out_of_range(self) -> None:
+        """Return zero for codes outside the table."""
+        assert StatusCounter()[5000] == 0
+
+    def test_add_many_iterable_and_buffers(self) -> None:
+        """Count iterables and buffers of codes."""
+        codes = [200, 404, 404, 503, 200, 200]
+        expected = StatusCounter(codes)
+        assert expected[200] == 3
+        assert StatusCounter(array("H", codes)) == expected
+        assert StatusCounter(memoryview(array("H", codes))) == expected
+        assert StatusCounter(array("H", codes).tobytes()) == expected
+        assert StatusCounter([HTTP_200_OK, HTTP_200_OK()]) == StatusCounter(
+            [200, 200]
+        )
+
+    def test_add_many_invalid_code_adds_nothing(self) -> None:
+        """Leave the counter unchanged when any item is rejected."""
+        counter = StatusCounter([404])
+        with pytest.raises(ValueError, match="outside the range"):
+            counter.add_many([200, 200, 5000])
+        with pytest.raises(TypeError):
+            counter.add_many([200, "503"])  # type: ignore[list-item]
+        assert counter == StatusCounter([404])
+
+    def test_category_counts_match_count_by_category(self) -> None:
+        """Roll up counts with the same boundaries as count_by_category."""
+        codes = [100, 204, 302, 404, 429, 500, 599, 600, 999, 0]
+        counter = StatusCounter(codes)
+        assert counter.category_counts() == count_by_category(codes)
+        assert counter.category_counts()[StatusCategory.UNKNOWN] == 3
+
+    def test_merge(self) -> None:
+        """Add counts from another counter in place."""
+        first = StatusCounter([200, 404])
+        second = StatusCounter([404, 503])
+        first.merge(second)
+        assert first == StatusCounter([200, 404, 404, 503])
+        assert second == StatusCounter([404, 503])
+
+    def test_most_common(self) -> None:
+        """Return status classes ordered by count."""
+        counter = StatusCounter([200, 404, 404, 503, 503, 503, 599])
+        assert counter.most_common(2) == [
+            (HTTP_503_SERVICE_UNAVAILABLE, 3),
+            (HTTP_404_NOT_FOUND, 2),
+        ]
+        assert counter.most_common()[-2:] == [(HTTP_200_OK, 1), (599, 1)]
+
+    def test_iter_clear_and_repr(self) -> None:
+        """Iterate non-zero counts, clear them and show them in repr."""
+        counter = StatusCounter([404, 200, 404])
+        assert list(counter) == [(200, 1), (404, 2)]
+        assert repr(counter) == "StatusCounter({200: 1, 404: 2})"
+        counter.clear()
+        assert list(counter) == []
+        assert counter.total() == 0
+
+    def test_equality_and_pickle(self) -> None:
+        """Compare counters by value and survive pickling."""
+        counter = StatusCounter([200, 404])
+        assert counter == pickle.loads(pickle.dumps(counter))  # noqa: S301
+        assert counter != [200, 404]
+        with pytest.raises(TypeError):
+            hash(counter)
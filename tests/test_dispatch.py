@@ -0,0 +1,207 @@
+"""Tests for the status exception dispatcher."""
+
+from __future__ import annotations
+
+from typing import Callable, Union
+
+import pytest
+
+from response_codes import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_410_GONE,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    ClientErrorStatus,
+    HTTPStatus,
+    StatusCategory,
+    StatusDispatcher,
+)
+
+Result = tuple[object, ...]
+Key = Union[type[HTTPStatus], StatusCategory, range, int]
+
+
+def named(name: str) -> Callable[..., Result]:
+    """Return a handler that returns `name` and its arguments."""
+
+    def handler(exc: HTTPStatus, *args: object) -> Result:
+        return (name, type(exc).status_code, *args)
+
+    return handler
+
+
+class TestResolution:
+    """Test which handler a status resolves to."""
+
+    def test_exact_class(self) -> None:
+        """Match the registered class itself."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(HTTP_404_NOT_FOUND, named("404"))
+        assert dispatcher.dispatch(HTTP_404_NOT_FOUND()) == ("404", 404)
+        assert dispatcher.resolve(HTTP_410_GONE) is None
+
+    def test_subclass_uses_most_specific_class(self) -> None:
+        """Use the closest registered class in the MRO."""
+
+        class NoSuchUser(HTTP_404_NOT_FOUND):
+            """Subclass of a registered class."""
+
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(ClientErrorStatus, named("4xx"))
+        dispatcher.register(HTTP_404_NOT_FOUND, named("404"))
+        assert dispatcher.dispatch(NoSuchUser()) == ("404", 404)
+        assert dispatcher.dispatch(HTTP_410_GONE()) == ("4xx", 410)
+
+    def test_category_base(self) -> None:
+        """Match every class deriving from a category base."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(ClientErrorStatus, named("4xx"))
+        assert dispatcher.resolve(HTTP_400_BAD_REQUEST) is not None
+        assert dispatcher.resolve(HTTP_500_INTERNAL_SERVER_ERROR) is None
+
+    def test_narrowest_range_wins(self) -> None:
+        """Prefer the smallest range containing the code."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(range(400, 500), named("wide"))
+        dispatcher.register(range(404, 411), named("narrow"))
+        dispatcher.register(410, named("single"))
+        assert dispatcher.dispatch(HTTP_400_BAD_REQUEST())[0] == "wide"
+        assert dispatcher.dispatch(HTTP_404_NOT_FOUND())[0] == "narrow"
+        assert dispatcher.dispatch(HTTP_410_GONE())[0] == "single"
+
+    def test_class_beats_range(self) -> None:
+        """Prefer class handlers over range handlers."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(404, named("range"))
+        dispatcher.register(HTTP_404_NOT_FOUND, named("class"))
+        assert dispatcher.dispatch(HTTP_404_NOT_FOUND())[0] == "class"
+
+    def test_category_and_default(self) -> None:
+        """Fall back to the category handler, then the catch-all."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(StatusCategory.SERVER_ERROR, named("5xx"))
+        dispatcher.register(HTTPStatus, named("any"))
+        assert dispatcher.dispatch(HTTP_503_SERVICE_UNAVAILABLE())[0] == "5xx"
+        assert dispatcher.dispatch(HTTP_200_OK())[0] == "any"
+        assert dispatcher.dispatch(HTTPStatus())[0] == "any"
+
+    def test_resolve_accepts_classes_and_instances(self) -> None:
+        """Resolve status classes and instances alike."""
+        handler = named("404")
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(HTTP_404_NOT_FOUND, handler)
+        assert dispatcher.resolve(HTTP_404_NOT_FOUND) is handler
+        assert dispatcher.resolve(HTTP_404_NOT_FOUND()) is handler
+
+    def test_custom_code_subclass(self) -> None:
+        """Resolve subclasses sharing a code with a built-in class."""
+
+        class Teapot(HTTP_404_NOT_FOUND):
+            """Subclass with its own code."""
+
+            status_code = 418
+
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(HTTP_404_NOT_FOUND, named("404"))
+        dispatcher.register(418, named("teapot"))
+        assert dispatcher.dispatch(Teapot())[0] == "404"
+        assert dispatcher.dispatch(Teapot())[0] == "404"
+
+
+class TestDispatch:
+    """Test calling handlers."""
+
+    def test_passes_extra_arguments(self) -> None:
+        """Pass the exception and extra arguments to the handler."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(HTTPStatus, named("any"))
+        assert dispatcher.dispatch(HTTP_404_NOT_FOUND(), "request") == (
+            "any",
+            404,
+            "request",
+        )
+
+    def test_reraises_unhandled(self) -> None:
+        """Re-raise exceptions without a handler."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        exc = HTTP_404_NOT_FOUND("gone")
+        with pytest.raises(HTTP_404_NOT_FOUND) as info:
+            dispatcher.dispatch(exc)
+        assert info.value is exc
+
+    def test_handles_decorator(self) -> None:
+        """Register the decorated function and return it unchanged."""
+        dispatcher: StatusDispatcher[str] = StatusDispatcher()
+
+        @dispatcher.handles(range(400, 500))
+        def client_error(exc: HTTPStatus) -> str:
+            return exc.message
+
+        assert dispatcher.resolve(HTTP_404_NOT_FOUND) is client_error
+        assert dispatcher.dispatch(HTTP_404_NOT_FOUND()) == "Not Found"
+
+
+class TestRegistration:
+    """Test registering and removing handlers."""
+
+    def test_register_invalidates_table(self) -> None:
+        """Recompile after a handler is added."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        assert dispatcher.resolve(HTTP_404_NOT_FOUND) is None
+        dispatcher.register(StatusCategory.CLIENT_ERROR, named("4xx"))
+        assert dispatcher.resolve(HTTP_404_NOT_FOUND) is not None
+
+    def test_unregister(self) -> None:
+        """Remove handlers of every kind of key."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        keys: list[Key] = [
+            HTTP_404_NOT_FOUND,
+            404,
+            range(400, 500),
+            StatusCategory.CLIENT_ERROR,
+            HTTPStatus,
+        ]
+        for key in keys:
+            dispatcher.register(key, named("handler"))
+        for key in keys:
+            assert dispatcher.resolve(HTTP_404_NOT_FOUND) is not None
+            dispatcher.unregister(key)
+        assert dispatcher.resolve(HTTP_404_NOT_FOUND) is None
+
+    def test_unregister_invalidates_cache(self) -> None:
+        """Re-resolve cached user subclasses after a handler is removed."""
+
+        class NoSuchUser(HTTP_404_NOT_FOUND):
+            """Unregistered subclass."""
+
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        dispatcher.register(HTTP_404_NOT_FOUND, named("404"))
+        assert dispatcher.resolve(NoSuchUser) is not None
+        dispatcher.unregister(HTTP_404_NOT_FOUND)
+        assert dispatcher.resolve(NoSuchUser) is None
+
+    @pytest.mark.parametrize(
+        "key",
+        [HTTP_404_NOT_FOUND, 404, StatusCategory.CLIENT_ERROR, HTTPStatus],
+    )
+    def test_unregister_missing(self, key: Key) -> None:
+        """Raise KeyError when nothing is registered for the key."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        with pytest.raises(KeyError):
+            dispatcher.unregister(key)
+
+    @pytest.mark.parametrize("key", [True, "404", 404.0, ValueError])
+    def test_invalid_key_type(self, key: Key) -> None:
+        """Reject keys that are not statuses, categories, codes or ranges."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        with pytest.raises(TypeError):
+            dispatcher.register(key, named("handler"))
+
+    @pytest.mark.parametrize("key", [range(500, 400), range(400, 500, 2)])
+    def test_invalid_range(self, key: range) -> None:
+        """Reject empty ranges and ranges with a step."""
+        dispatcher: StatusDispatcher[Result] = StatusDispatcher()
+        with pytest.raises(ValueError, match="non-empty"):
+            dispatcher.register(key, named("handler"))
@@ -0,0 +1,217 @@
+"""Tests for the raise instrumentation hook."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+from contextlib import suppress
+from typing import Callable
+
+import pytest
+
+from response_codes import (
+    HTTP_404_NOT_FOUND,
+    HTTP_418_IM_A_TEAPOT,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    CircuitOpenError,
+    HTTPStatus,
+    RaiseInstrument,
+    RaiseSample,
+)
+
+
+def raise_not_found(detail: str = "missing") -> None:
+    """Raise a 404 with a detail."""
+    raise HTTP_404_NOT_FOUND(detail)
+
+
+def raise_class() -> None:
+    """Raise a 503 class without instantiating it explicitly."""
+    raise HTTP_503_SERVICE_UNAVAILABLE
+
+
+def swallow(func: Callable[[], object], times: int = 1) -> None:
+    """Call `func` `times` times, ignoring the statuses it raises."""
+    for _ in range(times):
+        with suppress(HTTPStatus):
+            func()
+
+
+class TestCounting:
+    """Test counting statuses per class."""
+
+    def test_counts_per_class(self) -> None:
+        """Count instances and raised classes, most common first."""
+        with RaiseInstrument() as instrument:
+            swallow(raise_not_found, 3)
+            swallow(raise_class)
+        assert instrument.counts() == [
+            (HTTP_404_NOT_FOUND, 3),
+            (HTTP_503_SERVICE_UNAVAILABLE, 1),
+        ]
+        assert instrument.total() == 4
+
+    def test_classes_sharing_a_code(self) -> None:
+        """Count subclasses separately from classes with the same code."""
+
+        class Teapot(HTTP_404_NOT_FOUND):
+            """Subclass with its own code."""
+
+            status_code = 418
+
+        with RaiseInstrument() as instrument:
+            Teapot()
+            HTTP_418_IM_A_TEAPOT()
+        assert dict(instrument.counts()) == {
+            Teapot: 1,
+            HTTP_418_IM_A_TEAPOT: 1,
+        }
+
+    def test_unpickling_is_not_counted(self) -> None:
+        """Count nothing for statuses unpickled from another process."""
+        data = pickle.dumps(
+            [HTTP_404_NOT_FOUND("gone"), CircuitOpenError("open", 1.5)]
+        )
+        with RaiseInstrument(sample_every=1) as instrument:
+            not_found, circuit_open = pickle.loads(data)  # noqa: S301
+        assert instrument.total() == 0
+        assert not instrument.samples
+        assert not_found.detail == "gone"
+        assert circuit_open.detail == "open"
+        assert circuit_open.retry_after == 1.5
+
+    def test_disabled_counts_nothing(self) -> None:
+        """Stop counting once disabled, keeping earlier counts."""
+        instrument = RaiseInstrument()
+        HTTP_404_NOT_FOUND()
+        instrument.enable()
+        assert instrument.enabled
+        HTTP_404_NOT_FOUND()
+        instrument.disable()
+        assert not instrument.enabled
+        HTTP_404_NOT_FOUND()
+        assert instrument.total() == 1
+
+    def test_reset(self) -> None:
+        """Discard counts and samples."""
+        with RaiseInstrument(sample_every=1) as instrument:
+            HTTP_404_NOT_FOUND()
+            instrument.reset()
+            HTTP_503_SERVICE_UNAVAILABLE()
+        assert instrument.counts() == [(HTTP_503_SERVICE_UNAVAILABLE, 1)]
+        assert len(instrument.samples) == 1
+
+    def test_snapshot_from_another_thread(self) -> None:
+        """Read counts while another thread is raising statuses."""
+        raises = 2000
+        with RaiseInstrument() as instrument:
+            worker = threading.Thread(
+                target=swallow, args=(raise_class, raises)
+            )
+            worker.start()
+            while worker.is_alive():
+                assert instrument.total() <= raises
+                instrument.counts()
+            worker.join()
+        assert instrument.counts() == [(HTTP_503_SERVICE_UNAVAILABLE, raises)]
+
+    def test_repr(self) -> None:
+        """Show whether the instrument is enabled and its total."""
+        with RaiseInstrument() as instrument:
+            HTTP_404_NOT_FOUND()
+            assert repr(instrument) == "RaiseInstrument(enabled, total=1)"
+        assert repr(instrument) == "RaiseInstrument(disabled, total=1)"
+
+
+class TestSampling:
+    """Test sampling where statuses are created."""
+
+    def test_no_samples_by_default(self) -> None:
+        """Leave sampling off unless requested."""
+        with RaiseInstrument() as instrument:
+            swallow(raise_not_found, 5)
+        assert not instrument.samples
+
+    def test_samples_raising_frame(self) -> None:
+        """Record the function and line creating the status."""
+        with RaiseInstrument(sample_every=1) as instrument:
+            swallow(raise_not_found)
+        (sample,) = instrument.samples
+        assert sample.status_class is HTTP_404_NOT_FOUND
+        assert sample.detail == "missing"
+        assert sample.function == "raise_not_found"
+        assert sample.filename == __file__
+        assert sample.lineno == raise_not_found.__code__.co_firstlineno + 2
+        assert sample.thread_id == threading.get_ident()
+
+    def test_skips_subclass_init(self) -> None:
+        """Report the caller, not a subclass's own __init__."""
+        with RaiseInstrument(sample_every=1) as instrument:
+            CircuitOpenError("open", 1.0)
+        assert instrument.samples[0].function == "test_skips_subclass_init"
+
+    def test_sample_every(self) -> None:
+        """Sample one in every `sample_every` statuses."""
+        with RaiseInstrument(sample_every=3) as instrument:
+            swallow(raise_not_found, 10)
+        assert len(instrument.samples) == 3
+
+    def test_max_samples(self) -> None:
+        """Keep only the most recent samples."""
+        with RaiseInstrument(sample_every=1, max_samples=2) as instrument:
+            for detail in "abc":
+                HTTP_404_NOT_FOUND(detail)
+        assert [sample.detail for sample in instrument.samples] == ["b", "c"]
+
+    def test_custom_sink(self) -> None:
+        """Pass samples to the sink instead of keeping them."""
+        received: list[RaiseSample] = []
+        with RaiseInstrument(sample_every=1, sink=received.append) as inst:
+            HTTP_404_NOT_FOUND()
+        assert len(received) == 1
+        assert not inst.samples
+
+    def test_failing_sink(self) -> None:
+        """Count sink errors without replacing the raised status."""
+
+        def sink(sample: RaiseSample) -> None:
+            raise RuntimeError
+
+        instrument = RaiseInstrument(sample_every=1, sink=sink)
+        with instrument, pytest.raises(HTTP_404_NOT_FOUND):
+            raise_not_found()
+        assert instrument.sink_errors == 1
+
+
+class TestEnabling:
+    """Test installing and removing the hook."""
+
+    def test_one_instrument_at_a_time(self) -> None:
+        """Refuse to enable a second instrument."""
+        with RaiseInstrument() as first:
+            second = RaiseInstrument()
+            with pytest.raises(RuntimeError, match="already enabled"):
+                second.enable()
+            second.disable()
+            assert first.enabled
+            HTTP_404_NOT_FOUND()
+        assert first.total() == 1
+        assert second.total() == 0
+
+    def test_enable_twice(self) -> None:
+        """Allow enabling an enabled instrument again."""
+        instrument = RaiseInstrument()
+        instrument.enable()
+        instrument.enable()
+        instrument.disable()
+        assert not instrument.enabled
+
+    @pytest.mark.parametrize(
+        ("sample_every", "max_samples"), [(-1, 100), (0, 0)]
+    )
+    def test_invalid_arguments(
+        self, sample_every: int, max_samples: int
+    ) -> None:
+        """Reject negative sampling intervals and empty sample buffers."""
+        with pytest.raises(ValueError, match="sample"):
+            RaiseInstrument(sample_every=sample_every, max_samples=max_samples)
@@ -0,0 +1,126 @@
+"""Tests for lazy submodule loading in the package."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import response_codes
+
+
+def run_isolated(code: str) -> str:
+    """Run `code` in a fresh interpreter and return its stdout."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+LOADED_MODULES = """
+import sys
+
+def loaded():
+    return sorted(
+        name.rsplit(".", 1)[1]
+        for name in sys.modules
+        if name.startswith("response_codes.")
+    )
+"""
+
+
+class TestLazyImports:
+    """Test that submodules are only imported when needed."""
+
+    def test_import_loads_no_submodules(self) -> None:
+        """Import the package without importing any submodule."""
+        output = run_isolated(
+            LOADED_MODULES
+            + """
+import response_codes
+print(loaded(), "typing" in sys.modules)
+"""
+        )
+        assert output == "[] False"
+
+    def test_status_access_loads_only_its_range(self) -> None:
+        """Load only the range module of the accessed status class."""
+        output = run_isolated(
+            LOADED_MODULES
+            + """
+from response_codes import HTTP_404_NOT_FOUND
+print(loaded())
+"""
+        )
+        assert output == "['_4xx_client_errors', '_core']"
+
+    def test_registry_lookup_loads_all_ranges(self) -> None:
+        """Complete the registry before looking up a code."""
+        output = run_isolated(
+            """
+from response_codes import from_message, lookup
+print(lookup(200).__name__, from_message("bad gateway").__name__)
+"""
+        )
+        assert output == "HTTP_200_OK HTTP_502_BAD_GATEWAY"
+
+    def test_custom_class_does_not_shadow_lazy_builtin(self) -> None:
+        """Keep built-in classes registered ahead of user-defined ones."""
+        output = run_isolated(
+            """
+from response_codes import HTTPStatus, lookup
+
+class MyNotFound(HTTPStatus):
+    status_code = 404
+
+print(lookup(404).__name__)
+"""
+        )
+        assert output == "HTTP_404_NOT_FOUND"
+
+    def test_star_import_provides_all_names(self) -> None:
+        """Provide every name in __all__ through a star import."""
+        output = run_isolated(
+            """
+import response_codes
+namespace = {}
+exec("from response_codes import *", namespace)
+print(all(name in namespace for name in response_codes.__all__))
+"""
+        )
+        assert output == "True"
+
+    def test_star_import_skips_asyncio(self) -> None:
+        """Leave asyncio unimported until an async retry has to wait."""
+        output = run_isolated(
+            """
+import sys
+from response_codes import *
+print("asyncio" in sys.modules, AsyncRetrier().policy is not None)
+"""
+        )
+        assert output == "False True"
+
+    def test_dir_lists_public_names(self) -> None:
+        """List every public name in dir()."""
+        assert set(response_codes.__all__) <= set(dir(response_codes))
+
+    def test_every_public_name_resolves(self) -> None:
+        """Resolve every name in __all__ to the defining submodule object."""
+        for name in response_codes.__all__:
+            assert getattr(response_codes, name) is not None
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Raise AttributeError for names the package does not define."""
+        with pytest.raises(AttributeError, match="HTTP_999_NOPE"):
+            _ = response_codes.HTTP_999_NOPE
+        with pytest.raises(AttributeError, match="HTTP_4"):
+            _ = response_codes.HTTP_4
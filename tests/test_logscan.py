@@ -0,0 +1,210 @@
+"""Tests for the access-log status scanner."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from response_codes import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTPStatus,
+    StatusCategory,
+    StatusCounter,
+    logscan,
+)
+from response_codes.logscan import aggregate_logs, iter_statuses, scan_log
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+COMMON = (
+    b'127.0.0.1 - frank [10/Oct/2000:13:55:36 -0700] "GET /a HTTP/1.0" '
+    b"200 2326\n"
+)
+COMBINED = (
+    b'10.0.0.2 - - [10/Oct/2000:13:55:37 -0700] "POST /b HTTP/1.1" 404 0 '
+    b'"https://example.com/" "Mozilla/5.0 (X11) \\"quoted\\" 200 "\n'
+)
+ESCAPED = b'10.0.0.3 - - [10/Oct/2000:13:55:38 -0700] "GET /c\\x22d" 503 -\n'
+INJECTED = (
+    b'10.0.0.5 - - [10/Oct/2000:13:55:40 -0700] "GET /a\\" 404 b HTTP/1.0" '
+    b"200 2326\n"
+)
+MALFORMED = b"this line has no status field\n"
+UNREGISTERED = b'10.0.0.4 - - [10/Oct/2000:13:55:39 -0700] "GET /" 599 1\n'
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    """Write a small log mixing formats and malformed lines."""
+    path = tmp_path / "access.log"
+    path.write_bytes(
+        COMMON + COMBINED + MALFORMED + ESCAPED + COMMON + UNREGISTERED
+    )
+    return path
+
+
+class TestScanLog:
+    """Test counting statuses with scan_log()."""
+
+    def test_counts_per_code(self, log_file: Path) -> None:
+        """Count one status per line, skipping malformed lines."""
+        counts = scan_log(log_file)
+        assert counts.total() == 5
+        assert counts[200] == 2
+        assert counts[404] == 1
+        assert counts[503] == 1
+        assert counts[599] == 1
+
+    def test_counts_per_category(self, log_file: Path) -> None:
+        """Expose per-category totals through the counter."""
+        categories = scan_log(log_file).category_counts()
+        assert categories[StatusCategory.SUCCESS] == 2
+        assert categories[StatusCategory.CLIENT_ERROR] == 1
+        assert categories[StatusCategory.SERVER_ERROR] == 2
+
+    def test_adds_to_existing_counter(self, log_file: Path) -> None:
+        """Add to the counter that is passed in."""
+        counter = StatusCounter([200])
+        assert scan_log(str(log_file), counter) is counter
+        assert counter[200] == 3
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Return an empty counter for an empty file."""
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+        assert scan_log(path) == StatusCounter()
+
+    def test_last_line_without_newline(self, tmp_path: Path) -> None:
+        """Count a final line that has no trailing newline."""
+        path = tmp_path / "access.log"
+        path.write_bytes(COMMON + b'1.2.3.4 - - [x] "GET /" 404')
+        assert scan_log(path)[404] == 1
+
+    def test_escaped_quote_in_request(self, tmp_path: Path) -> None:
+        """Read the status after the request line, not an escaped quote."""
+        path = tmp_path / "access.log"
+        path.write_bytes(INJECTED + INJECTED.replace(b"200 2326", b"- 0"))
+        counts = scan_log(path)
+        assert counts.total() == 1
+        assert counts[200] == 1
+        assert [status for _, status in iter_statuses(path)] == [HTTP_200_OK]
+
+    def test_lines_spanning_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Split the file on line boundaries when it spans many chunks."""
+        monkeypatch.setattr(logscan, "_CHUNK_SIZE", 7)
+        path = tmp_path / "access.log"
+        path.write_bytes((COMMON + COMBINED + ESCAPED) * 50)
+        counts = scan_log(path)
+        assert counts.total() == 150
+        assert counts[404] == 50
+
+
+class TestIterStatuses:
+    """Test the generator mode of the scanner."""
+
+    def test_yields_offsets_and_classes(self, log_file: Path) -> None:
+        """Yield the line offset and status class of each line."""
+        data = log_file.read_bytes()
+        results = list(iter_statuses(log_file))
+        assert [status for _, status in results] == [
+            HTTP_200_OK,
+            HTTP_404_NOT_FOUND,
+            HTTP_503_SERVICE_UNAVAILABLE,
+            HTTP_200_OK,
+            HTTPStatus,
+        ]
+        offsets = [offset for offset, _ in results]
+        assert offsets[0] == 0
+        assert offsets[1] == len(COMMON)
+        for offset in offsets:
+            assert offset == 0 or data[offset - 1 : offset] == b"\n"
+
+    def test_fallback(self, log_file: Path) -> None:
+        """Yield the fallback class for unregistered codes."""
+
+        class Fallback(HTTPStatus):
+            """Custom fallback class."""
+
+        *_, (_, last) = iter_statuses(log_file, Fallback)
+        assert last is Fallback
+
+    def test_offsets_across_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Report correct line offsets when lines span chunks."""
+        monkeypatch.setattr(logscan, "_CHUNK_SIZE", 5)
+        path = tmp_path / "access.log"
+        path.write_bytes(COMMON * 3)
+        offsets = [offset for offset, _ in iter_statuses(path)]
+        assert offsets == [0, len(COMMON), 2 * len(COMMON)]
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Yield nothing for an empty file."""
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+        assert list(iter_statuses(path)) == []
+
+
+class TestAggregateLogs:
+    """Test parallel aggregation across files and byte ranges."""
+
+    @pytest.fixture
+    def log_files(self, tmp_path: Path) -> list[Path]:
+        """Write a few logs of different sizes, including an empty one."""
+        paths = []
+        for index, body in enumerate(
+            [
+                (COMMON + COMBINED) * 40,
+                b"",
+                (ESCAPED + MALFORMED + UNREGISTERED) * 25,
+                COMMON,
+            ]
+        ):
+            path = tmp_path / f"access.log.{index}"
+            path.write_bytes(body)
+            paths.append(path)
+        return paths
+
+    def expected(self, paths: list[Path]) -> StatusCounter:
+        """Count the files one at a time with scan_log()."""
+        counter = StatusCounter()
+        for path in paths:
+            scan_log(path, counter)
+        return counter
+
+    def test_in_process(self, log_files: list[Path]) -> None:
+        """Scan in the calling process with a single worker."""
+        assert aggregate_logs(log_files, workers=1) == self.expected(log_files)
+
+    def test_process_pool(self, log_files: list[Path]) -> None:
+        """Merge the counts returned by worker processes."""
+        result = aggregate_logs(log_files, workers=2, shard_size=300)
+        assert result == self.expected(log_files)
+        assert result.total() == 131
+
+    @pytest.mark.parametrize("shard_size", [1, 7, 64, 1000, 10**6])
+    def test_shards_split_on_line_boundaries(
+        self, log_files: list[Path], shard_size: int
+    ) -> None:
+        """Count every line exactly once whatever the shard size."""
+        counter = StatusCounter()
+        for path, start, stop in logscan._shards(log_files, shard_size):
+            counter.merge(logscan._scan_shard(path, start, stop))
+        assert counter == self.expected(log_files)
+
+    def test_no_files(self) -> None:
+        """Return an empty counter when there is nothing to scan."""
+        assert aggregate_logs([], workers=4) == StatusCounter()
+
+    def test_invalid_arguments_raise(self, log_files: list[Path]) -> None:
+        """Reject non-positive worker counts and shard sizes."""
+        with pytest.raises(ValueError, match="at least 1"):
+            aggregate_logs(log_files, workers=0)
+        with pytest.raises(ValueError, match="at least 1"):
+            aggregate_logs(log_files, workers=2, shard_size=0)
@@ -0,0 +1,76 @@
+"""Tests for the optional NumPy helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from response_codes import (  # noqa: E402
+    StatusCategory,
+    category_of,
+    is_client_error,
+    is_server_error,
+    lookup,
+)
+from response_codes.numpy import (  # noqa: E402
+    categorize,
+    is_error_mask,
+    to_messages,
+)
+
+
+class TestNumpyHelpers:
+    """Test the vectorised NumPy helpers."""
+
+    @pytest.mark.parametrize("dtype", ["int16", "uint16", "int32", "int64"])
+    def test_categorize_matches_scalar(self, dtype: str) -> None:
+        """Agree with category_of() for every representable code."""
+        info = np.iinfo(dtype)
+        codes = np.arange(max(info.min, -2000), min(info.max, 70000) + 1)
+        codes = codes.astype(dtype)
+        result = categorize(codes)
+        assert result.dtype == np.uint8
+        expected = [category_of(int(code)) for code in codes]
+        assert result.tolist() == expected
+
+    def test_categorize_keeps_shape(self) -> None:
+        """Return an array with the same shape as the input."""
+        codes = np.array([[200, 404], [503, 999]], dtype=np.int16)
+        assert categorize(codes).tolist() == [
+            [StatusCategory.SUCCESS, StatusCategory.CLIENT_ERROR],
+            [StatusCategory.SERVER_ERROR, StatusCategory.UNKNOWN],
+        ]
+
+    def test_is_error_mask(self) -> None:
+        """Flag 4xx and 5xx codes only."""
+        codes = np.array([-1, 200, 302, 404, 499, 500, 599, 600, 40000])
+        expected = [
+            is_client_error(int(c)) or is_server_error(int(c)) for c in codes
+        ]
+        assert is_error_mask(codes).tolist() == expected
+
+    def test_to_messages(self) -> None:
+        """Map registered codes to their reason phrase."""
+        codes = np.array([200, 404, 599, -5, 5000], dtype=np.int32)
+        assert to_messages(codes).tolist() == [
+            "OK",
+            "Not Found",
+            "",
+            "",
+            "",
+        ]
+
+    def test_to_messages_covers_registry(self) -> None:
+        """Return the message of every registered class."""
+        codes = np.arange(1000)
+        messages = to_messages(codes)
+        for code in range(1000):
+            status_class = lookup(code)
+            expected = "" if status_class is None else status_class.message
+            assert messages[code] == expected
+
+    def test_non_integer_arrays_raise(self) -> None:
+        """Reject arrays that do not hold integers."""
+        with pytest.raises(TypeError):
+            categorize(np.array([200.0]))
@@ -0,0 +1,129 @@
+"""Tests for RFC 9457 Problem Details rendering."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from response_codes import (
+    HTTP_404_NOT_FOUND,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    PROBLEM_JSON_MEDIA_TYPE,
+    ProblemRenderer,
+)
+
+
+class TestProblemRenderer:
+    """Test rendering problem documents with ProblemRenderer."""
+
+    def test_media_type(self) -> None:
+        """Expose the RFC 9457 media type."""
+        assert PROBLEM_JSON_MEDIA_TYPE == "application/problem+json"
+
+    def test_render_class(self) -> None:
+        """Render the invariant members for a class."""
+        document = json.loads(ProblemRenderer().render(HTTP_404_NOT_FOUND))
+        assert document == {
+            "type": "about:blank",
+            "title": "Not Found",
+            "status": 404,
+        }
+
+    def test_type_base(self) -> None:
+        """Build the problem type from the configured URI base."""
+        renderer = ProblemRenderer("https://errors.example.com/")
+        document = json.loads(renderer.render(HTTP_429_TOO_MANY_REQUESTS))
+        assert document["type"] == "https://errors.example.com/429"
+        assert document["title"] == "Too Many Requests"
+
+    def test_render_instance_detail(self) -> None:
+        """Use the exception's detail unless one is passed explicitly."""
+        renderer = ProblemRenderer()
+        status = HTTP_503_SERVICE_UNAVAILABLE("down for maintenance")
+        assert json.loads(renderer.render(status))["detail"] == (
+            "down for maintenance"
+        )
+        document = json.loads(renderer.render(status, "overridden"))
+        assert document["detail"] == "overridden"
+
+    def test_render_all_members(self) -> None:
+        """Merge detail, instance and extension members."""
+        document = json.loads(
+            ProblemRenderer().render(
+                HTTP_404_NOT_FOUND,
+                "no such user",
+                instance="/users/42",
+                extensions={"user_id": 42, "tags": ["a", "é"]},
+            )
+        )
+        assert document == {
+            "type": "about:blank",
+            "title": "Not Found",
+            "status": 404,
+            "detail": "no such user",
+            "instance": "/users/42",
+            "user_id": 42,
+            "tags": ["a", "é"],
+        }
+
+    def test_invariant_document_is_cached(self) -> None:
+        """Return the cached document when there is nothing to merge."""
+        renderer = ProblemRenderer()
+        document = renderer.render(HTTP_404_NOT_FOUND)
+        assert renderer.render(HTTP_404_NOT_FOUND()) is document
+        assert renderer.render(HTTP_404_NOT_FOUND, extensions={}) is document
+
+    def test_reserved_extension_raises(self) -> None:
+        """Reject extension members that replace standard members."""
+        with pytest.raises(ValueError, match="status"):
+            ProblemRenderer().render(
+                HTTP_404_NOT_FOUND, extensions={"status": 200}
+            )
+
+    def test_output_is_ascii(self) -> None:
+        """Escape non-ASCII text so the document is always ASCII."""
+        body = ProblemRenderer().render(HTTP_404_NOT_FOUND("☃"), instance="/é")
+        assert body.isascii()
+        document = json.loads(body)
+        assert document["detail"] == "☃"
+        assert document["instance"] == "/é"
+
+    @pytest.mark.parametrize(
+        ("detail", "instance"), [(None, None), ("gone", "/items/1")]
+    )
+    def test_write_matches_render(
+        self, detail: str | None, instance: str | None
+    ) -> None:
+        """Stream the same bytes that render() returns."""
+        renderer = ProblemRenderer("urn:problem:")
+        stream = io.BytesIO()
+        size = renderer.write(
+            stream, HTTP_404_NOT_FOUND, detail, instance=instance
+        )
+        expected = renderer.render(
+            HTTP_404_NOT_FOUND, detail, instance=instance
+        )
+        assert stream.getvalue() == expected
+        assert size == len(expected)
+
+
+class TestToProblemJson:
+    """Test HTTPStatus.to_problem_json()."""
+
+    def test_class_and_instance(self) -> None:
+        """Render from the class and from an instance."""
+        assert json.loads(HTTP_404_NOT_FOUND.to_problem_json()) == {
+            "type": "about:blank",
+            "title": "Not Found",
+            "status": 404,
+        }
+        document = json.loads(
+            HTTP_404_NOT_FOUND("no such user").to_problem_json(
+                instance="/users/42"
+            )
+        )
+        assert document["detail"] == "no such user"
+        assert document["instance"] == "/users/42"
@@ -0,0 +1,117 @@
+"""Tests for the status code registry lookups."""
+
+from __future__ import annotations
+
+import pytest
+
+import response_codes
+from response_codes import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_418_IM_A_TEAPOT,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTPStatus,
+    from_code,
+    from_message,
+    lookup,
+)
+
+
+class TestLookup:
+    """Test looking up status classes by numeric code."""
+
+    def test_lookup_registered_codes(self) -> None:
+        """Return the registered class for known codes."""
+        assert lookup(200) is HTTP_200_OK
+        assert lookup(404) is HTTP_404_NOT_FOUND
+        assert lookup(503) is HTTP_503_SERVICE_UNAVAILABLE
+
+    def test_every_exported_class_is_registered(self) -> None:
+        """Register every status class exported by the package.
+
+        Subclasses that inherit a code, like CircuitOpenError, are skipped.
+        """
+        for name in response_codes.__all__:
+            obj = getattr(response_codes, name)
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, HTTPStatus)
+                and obj.status_code
+                and "status_code" in vars(obj)
+            ):
+                assert lookup(obj.status_code) is obj
+
+    @pytest.mark.parametrize("code", [-1, 0, 299, 499, 999, 1000, 10**6])
+    def test_lookup_unknown_codes(self, code: int) -> None:
+        """Return None for unregistered or out-of-range codes."""
+        assert lookup(code) is None
+
+    def test_subclass_does_not_shadow_registered_class(self) -> None:
+        """Keep the first registered class for a code."""
+
+        class CustomNotFound(HTTP_404_NOT_FOUND):
+            """Subclass inheriting the 404 status code."""
+
+        class DuplicateNotFound(HTTPStatus):
+            """Redefinition of an already registered code."""
+
+            status_code = 404
+            message = "Not Found"
+
+        assert lookup(404) is HTTP_404_NOT_FOUND
+
+    def test_base_class_is_not_registered(self) -> None:
+        """Do not register classes without a real status code."""
+        assert lookup(HTTPStatus.status_code) is None
+
+
+class TestFromCode:
+    """Test from_code() with and without a fallback."""
+
+    def test_from_code_registered(self) -> None:
+        """Return the registered class for known codes."""
+        assert from_code(404) is HTTP_404_NOT_FOUND
+
+    def test_from_code_unknown_raises(self) -> None:
+        """Raise ValueError for unknown codes without a fallback."""
+        with pytest.raises(ValueError, match="599"):
+            from_code(599)
+
+    def test_from_code_unknown_uses_default(self) -> None:
+        """Return the fallback class for unknown codes."""
+        assert from_code(599, HTTPStatus) is HTTPStatus
+        assert from_code(404, HTTPStatus) is HTTP_404_NOT_FOUND
+
+
+class TestFromMessage:
+    """Test looking up status classes by reason phrase."""
+
+    def test_exact_phrase(self) -> None:
+        """Resolve exact reason phrases."""
+        assert from_message("Not Found") is HTTP_404_NOT_FOUND
+        assert from_message("OK") is HTTP_200_OK
+        assert from_message("I'm a teapot") is HTTP_418_IM_A_TEAPOT
+
+    @pytest.mark.parametrize(
+        "phrase",
+        ["not found", "NOT FOUND", "  Not   Found ", "not\tfound\r\n"],
+    )
+    def test_normalised_phrase(self, phrase: str) -> None:
+        """Resolve phrases regardless of case and whitespace."""
+        assert from_message(phrase) is HTTP_404_NOT_FOUND
+
+    def test_every_registered_message_round_trips(self) -> None:
+        """Resolve the message of every registered class back to it."""
+        for code in range(1000):
+            status_class = lookup(code)
+            if status_class is not None:
+                assert from_message(status_class.message) is status_class
+
+    def test_unknown_phrase_raises(self) -> None:
+        """Raise ValueError for unknown phrases without a fallback."""
+        with pytest.raises(ValueError, match="Nope"):
+            from_message("Nope")
+
+    def test_unknown_phrase_uses_default(self) -> None:
+        """Return the fallback class for unknown phrases."""
+        assert from_message("Nope", HTTPStatus) is HTTPStatus
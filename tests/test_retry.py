@@ -0,0 +1,182 @@
+"""Tests for the retry policy engine."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from response_codes import (
+    DEFAULT_RETRY_POLICY,
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_408_REQUEST_TIMEOUT,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_502_BAD_GATEWAY,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTP_504_GATEWAY_TIMEOUT,
+    HTTPStatus,
+    RetryPolicy,
+    StatusCategory,
+    parse_retry_after,
+    should_retry,
+)
+
+RETRYABLE = [
+    HTTP_408_REQUEST_TIMEOUT,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTP_504_GATEWAY_TIMEOUT,
+]
+
+
+class TestRetryableAttribute:
+    """Test the class-level ``retryable`` flag."""
+
+    @pytest.mark.parametrize("status_class", RETRYABLE)
+    def test_retryable_classes(self, status_class: type[HTTPStatus]) -> None:
+        """Flag the transient failure statuses as retryable."""
+        assert status_class.retryable is True
+        assert status_class().retryable is True
+
+    @pytest.mark.parametrize(
+        "status_class", [HTTPStatus, HTTP_200_OK, HTTP_404_NOT_FOUND]
+    )
+    def test_other_classes(self, status_class: type[HTTPStatus]) -> None:
+        """Leave every other status non-retryable."""
+        assert status_class.retryable is False
+
+
+class TestShouldRetry:
+    """Test retry decisions."""
+
+    @pytest.mark.parametrize("status_class", RETRYABLE)
+    def test_default_policy(self, status_class: type[HTTPStatus]) -> None:
+        """Retry the retryable statuses in any accepted form."""
+        assert should_retry(status_class)
+        assert should_retry(status_class())
+        assert should_retry(int(status_class))
+
+    @pytest.mark.parametrize("value", [200, 404, HTTP_502_BAD_GATEWAY, 5000])
+    def test_not_retryable(self, value: int) -> None:
+        """Don't retry other statuses."""
+        assert not should_retry(value)
+
+    def test_attempt_limit(self) -> None:
+        """Stop retrying once max_attempts have been made."""
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.should_retry(503, attempt=2)
+        assert not policy.should_retry(503, attempt=3)
+        assert policy.is_retryable(503)
+
+    def test_custom_codes(self) -> None:
+        """Retry only the configured statuses."""
+        policy = RetryPolicy([HTTP_502_BAD_GATEWAY, 409])
+        assert policy.retryable_codes == frozenset({409, 502})
+        assert policy.should_retry(HTTP_502_BAD_GATEWAY())
+        assert not policy.should_retry(503)
+
+    def test_category_codes(self) -> None:
+        """Retry every status in a category given with the codes."""
+        policy = RetryPolicy([StatusCategory.SERVER_ERROR, 429])
+        assert policy.retryable_codes == frozenset({429, *range(500, 600)})
+
+    def test_default_policy_codes(self) -> None:
+        """Build the default policy from the ``retryable`` attributes."""
+        assert DEFAULT_RETRY_POLICY.retryable_codes == frozenset(
+            {408, 429, 500, 503, 504}
+        )
+
+    def test_invalid_codes_raise(self) -> None:
+        """Reject out-of-range and unsupported codes."""
+        with pytest.raises(ValueError, match="0-999"):
+            RetryPolicy([1000])
+        with pytest.raises(TypeError):
+            RetryPolicy(["503"])  # type: ignore[list-item]
+        with pytest.raises(TypeError):
+            should_retry(None)  # type: ignore[arg-type]
+
+
+class TestDelays:
+    """Test backoff and Retry-After handling."""
+
+    def test_backoff_without_jitter(self) -> None:
+        """Grow the delay exponentially up to max_delay."""
+        policy = RetryPolicy(
+            base_delay=0.5, multiplier=2.0, max_delay=3.0, jitter=False
+        )
+        assert [policy.backoff(n) for n in range(1, 6)] == [
+            0.5,
+            1.0,
+            2.0,
+            3.0,
+            3.0,
+        ]
+        assert policy.backoff(10_000) == 3.0
+
+    def test_backoff_with_jitter(self) -> None:
+        """Pick a random delay between zero and the backoff."""
+        policy = RetryPolicy(base_delay=1.0, rng=random.Random(1))  # noqa: S311
+        delays = [policy.backoff(3) for _ in range(100)]
+        assert all(0.0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+        again = RetryPolicy(base_delay=1.0, rng=random.Random(1))  # noqa: S311
+        assert [again.backoff(3) for _ in range(100)] == delays
+
+    def test_retry_after_seconds(self) -> None:
+        """Honour a delta-seconds Retry-After."""
+        policy = RetryPolicy(max_delay=60.0)
+        assert policy.delay(1, retry_after="45") == 45.0
+
+    @pytest.mark.parametrize(
+        "retry_after", ["120", "Fri, 31 Dec 9999 23:59:59 GMT"]
+    )
+    def test_retry_after_capped(self, retry_after: str) -> None:
+        """Cap Retry-After delays at max_delay."""
+        policy = RetryPolicy(max_delay=1.0)
+        assert policy.delay(1, retry_after=retry_after) == 1.0
+
+    def test_overflowing_retry_after_falls_back(self) -> None:
+        """Use the backoff when Retry-After is too large for a float."""
+        policy = RetryPolicy(base_delay=0.25, jitter=False)
+        assert policy.delay(1, retry_after="1" + "0" * 400) == 0.25
+
+    def test_retry_after_date(self) -> None:
+        """Honour an HTTP-date Retry-After relative to now."""
+        now = 1445412470.0  # 07:27:50 GMT on the date below
+        policy = RetryPolicy()
+        delay = policy.delay(
+            1, retry_after="Wed, 21 Oct 2015 07:28:00 GMT", now=now
+        )
+        assert delay == 10.0
+
+    def test_invalid_retry_after_falls_back(self) -> None:
+        """Use the backoff when Retry-After can't be parsed."""
+        policy = RetryPolicy(base_delay=0.25, jitter=False)
+        assert policy.delay(1, retry_after="soon") == 0.25
+        assert policy.delay(1) == 0.25
+
+
+class TestParseRetryAfter:
+    """Test parsing Retry-After header values."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("0", 0.0),
+            (" 30 ", 30.0),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 10.0),
+            ("Wed, 21 Oct 2015 07:27:00 GMT", 0.0),
+            ("-5", None),
+            ("1.5", None),
+            ("1" + "0" * 400, None),
+            ("²", None),
+            ("", None),
+            ("tomorrow", None),
+        ],
+    )
+    def test_values(self, value: str, expected: float | None) -> None:
+        """Parse delta-seconds and HTTP-dates, rejecting anything else."""
+        assert parse_retry_after(value, now=1445412470.0) == expected
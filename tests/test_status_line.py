@@ -0,0 +1,195 @@
+"""Tests for raw HTTP status-line parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from response_codes import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTPStatus,
+    ParsedStatusLine,
+    format_status_line,
+    lookup,
+    parse_status_line,
+)
+from response_codes._status_line import MAX_STATUS_LINE
+
+
+class TestParseStatusLine:
+    """Test parse_status_line() on complete and partial buffers."""
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_parses_each_buffer_type(self, wrap: type) -> None:
+        """Parse bytes, bytearray and memoryview buffers alike."""
+        buf = wrap(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+        assert parse_status_line(buf) == ParsedStatusLine(
+            HTTP_404_NOT_FOUND, 404, (1, 1), 24
+        )
+
+    def test_parses_at_offset(self) -> None:
+        """Parse a status line that starts part way into the buffer."""
+        buf = b"junkHTTP/1.0 503 Service Unavailable\n"
+        result = parse_status_line(memoryview(buf), offset=4)
+        assert result is not None
+        assert result.status_class is HTTP_503_SERVICE_UNAVAILABLE
+        assert result.version == (1, 0)
+        assert result.end == len(buf)
+
+    def test_empty_reason_phrase(self) -> None:
+        """Accept lines with an empty or missing reason phrase."""
+        assert parse_status_line(b"HTTP/1.1 200 \r\n") == (
+            HTTP_200_OK,
+            200,
+            (1, 1),
+            15,
+        )
+        result = parse_status_line(b"HTTP/1.1 200\r\n")
+        assert result is not None
+        assert result.end == 14
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_long_reason_phrase(self, wrap: type) -> None:
+        """Find the end of lines with long reason phrases and bare LFs."""
+        line = b"HTTP/1.1 404 " + b"x" * 200 + b"\r\n"
+        result = parse_status_line(wrap(line + b"HTTP/1.0 204\n"))
+        assert result == (HTTP_404_NOT_FOUND, 404, (1, 1), len(line))
+        result = parse_status_line(wrap(line + b"HTTP/1.0 204\n"), len(line))
+        assert result is not None
+        assert result.version == (1, 0)
+        assert result.end == len(line) + 13
+
+    def test_unknown_code_uses_fallback(self) -> None:
+        """Return the fallback class for unregistered codes."""
+        result = parse_status_line(b"HTTP/1.1 599 Custom\r\n")
+        assert result is not None
+        assert result.status_class is HTTPStatus
+        assert result.status_code == 599
+
+        class Fallback(HTTPStatus):
+            """Custom fallback class."""
+
+        result = parse_status_line(b"HTTP/1.1 599 X\r\n", fallback=Fallback)
+        assert result is not None
+        assert result.status_class is Fallback
+
+    def test_unknown_code_without_fallback_raises(self) -> None:
+        """Raise ValueError for unregistered codes when there's no fallback."""
+        with pytest.raises(ValueError, match="599"):
+            parse_status_line(b"HTTP/1.1 599 X\r\n", fallback=None)
+
+    @pytest.mark.parametrize(
+        "buf",
+        [b"", b"HT", b"HTTP/1.1 2", b"HTTP/1.1 200", b"HTTP/1.1 200 OK\r"],
+    )
+    def test_incomplete_line_returns_none(self, buf: bytes) -> None:
+        """Return None until the whole line has arrived."""
+        assert parse_status_line(buf) is None
+        assert parse_status_line(memoryview(buf)) is None
+
+    @pytest.mark.parametrize(
+        "buf",
+        [
+            b"HTTX/1.1 200 OK\r\n",
+            b"GET / HTTP/1.1\r\n",
+            b"HTTP/1-1 200 OK\r\n",
+            b"HTTP/1.1200 OK\r\n",
+            b"HTTP/x.1 200 OK\r\n",
+            b"HTTP/1.1 2x0 OK\r\n",
+            b"HTTP/1.1 2000 OK\r\n",
+        ],
+    )
+    def test_malformed_line_raises(self, buf: bytes) -> None:
+        """Reject malformed status lines."""
+        with pytest.raises(ValueError, match=r"status|version|digit"):
+            parse_status_line(buf)
+
+    def test_overlong_line_raises(self) -> None:
+        """Reject lines with no end within MAX_STATUS_LINE bytes."""
+        buf = b"HTTP/1.1 200 " + b"x" * MAX_STATUS_LINE
+        with pytest.raises(ValueError, match="longer than"):
+            parse_status_line(buf)
+        with pytest.raises(ValueError, match="longer than"):
+            parse_status_line(memoryview(buf))
+
+    def test_offset_outside_buffer_raises(self) -> None:
+        """Reject offsets past the end of the buffer."""
+        with pytest.raises(ValueError, match="offset"):
+            parse_status_line(b"HTTP/1.1 200 OK\r\n", offset=100)
+
+
+class TestStatusLineBytes:
+    """Test the cached status lines used by response writers."""
+
+    @pytest.mark.parametrize("version", [b"1.0", b"1.1"])
+    def test_status_line(self, version: bytes) -> None:
+        """Render the code and reason phrase for each HTTP/1.x version."""
+        assert HTTP_404_NOT_FOUND.status_line(version) == (
+            b"HTTP/" + version + b" 404 Not Found\r\n"
+        )
+
+    def test_status_line_defaults_to_http_1_1(self) -> None:
+        """Default to HTTP/1.1."""
+        assert HTTP_200_OK.status_line() == b"HTTP/1.1 200 OK\r\n"
+
+    def test_status_line_is_cached(self) -> None:
+        """Return the same bytes object on every call."""
+        line = HTTP_503_SERVICE_UNAVAILABLE.status_line()
+        assert isinstance(line, bytes)
+        assert HTTP_503_SERVICE_UNAVAILABLE.status_line() is line
+
+    def test_status_line_round_trips(self) -> None:
+        """Parse back to the same class for every registered code."""
+        for code in range(1000):
+            status_class = lookup(code)
+            if status_class is not None:
+                result = parse_status_line(status_class.status_line())
+                assert result is not None
+                assert result.status_class is status_class
+
+    @pytest.mark.parametrize(
+        ("reason", "encoded"),
+        [
+            ("Upstream failure — retry later", b"Upstream failure ? retry"),
+            ("服务不可用", b"?????"),
+        ],
+    )
+    def test_non_latin_1_message(self, reason: str, encoded: bytes) -> None:
+        """Define classes with any message, sending unencodable chars as ?."""
+
+        class Custom(HTTPStatus):
+            """Status whose message latin-1 cannot encode."""
+
+            status_code = 503
+            message = reason
+
+        line = Custom.status_line()
+        assert line.startswith(b"HTTP/1.1 503 " + encoded)
+        assert line.endswith(b"\r\n")
+
+    def test_unsupported_version_raises(self) -> None:
+        """Reject versions other than HTTP/1.0 and HTTP/1.1."""
+        with pytest.raises(ValueError, match="version"):
+            HTTP_200_OK.status_line(b"2")
+
+    def test_format_registered_code(self) -> None:
+        """Return the class's cached line for registered codes."""
+        assert format_status_line(404) is HTTP_404_NOT_FOUND.status_line()
+        assert format_status_line(404, b"1.0") == (
+            b"HTTP/1.0 404 Not Found\r\n"
+        )
+
+    def test_format_unregistered_code(self) -> None:
+        """Render unregistered codes with an empty reason phrase, once."""
+        line = format_status_line(599)
+        assert line == b"HTTP/1.1 599 \r\n"
+        assert format_status_line(599) is line
+
+    @pytest.mark.parametrize(
+        ("code", "version"), [(-1, b"1.1"), (1000, b"1.1"), (599, b"0.9")]
+    )
+    def test_format_invalid_raises(self, code: int, version: bytes) -> None:
+        """Reject codes that aren't three digits and unknown versions."""
+        with pytest.raises(ValueError, match=r"code|version"):
+            format_status_line(code, version)
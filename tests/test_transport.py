@@ -0,0 +1,112 @@
+"""Tests for compact pickling and packing of status results."""
+
+from __future__ import annotations
+
+import pickle
+from array import array
+
+import pytest
+
+from response_codes import (
+    HTTP_200_OK,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    HTTPStatus,
+    classify_many,
+    pack_statuses,
+    unpack_statuses,
+)
+
+
+class TestPickling:
+    """Test pickling status exceptions."""
+
+    def test_round_trip(self) -> None:
+        """Unpickle to an instance of the same registered class."""
+        status = pickle.loads(pickle.dumps(HTTP_503_SERVICE_UNAVAILABLE()))  # noqa: S301
+        assert type(status) is HTTP_503_SERVICE_UNAVAILABLE
+        assert status.detail is None
+        assert status.args == ("Service Unavailable",)
+
+    def test_round_trip_with_detail(self) -> None:
+        """Keep the detail of the pickled instance."""
+        status = pickle.loads(pickle.dumps(HTTP_404_NOT_FOUND("gone")))  # noqa: S301
+        assert type(status) is HTTP_404_NOT_FOUND
+        assert status.detail == "gone"
+
+    def test_pickle_omits_class_path(self) -> None:
+        """Encode registered statuses by code, not by class path."""
+        data = pickle.dumps(HTTP_503_SERVICE_UNAVAILABLE("down"))
+        assert b"HTTP_503_SERVICE_UNAVAILABLE" not in data
+        assert b"_5xx_server_errors" not in data
+
+    def test_extra_attributes_are_kept(self) -> None:
+        """Restore instance attributes other than the detail."""
+        status = HTTP_404_NOT_FOUND()
+        status.resource = "/users/42"  # type: ignore[attr-defined]
+        restored = pickle.loads(pickle.dumps(status))  # noqa: S301
+        assert restored.resource == "/users/42"
+
+    def test_unregistered_subclass(self) -> None:
+        """Pickle subclasses that don't own their code by class path."""
+        restored = pickle.loads(pickle.dumps(_NotFoundSubclass("x")))  # noqa: S301
+        assert type(restored) is _NotFoundSubclass
+        assert restored.detail == "x"
+
+
+class _NotFoundSubclass(HTTP_404_NOT_FOUND):
+    """A subclass that is not itself registered for its code."""
+
+
+class TestPackStatuses:
+    """Test packing status results into code buffers."""
+
+    def test_pack_mixed_values(self) -> None:
+        """Pack ints, classes and instances as two bytes each."""
+        data = pack_statuses(
+            [200, HTTP_404_NOT_FOUND, HTTP_503_SERVICE_UNAVAILABLE()]
+        )
+        assert len(data) == 6
+        assert array("H", data).tolist() == [200, 404, 503]
+
+    def test_packed_buffer_is_classifiable(self) -> None:
+        """Read packed buffers with the bulk category helpers."""
+        assert classify_many(pack_statuses([200, 404])) == bytes([2, 4])
+
+    def test_round_trip(self) -> None:
+        """Unpack to the registered class of each code."""
+        data = pack_statuses([HTTP_200_OK, 404, HTTP_503_SERVICE_UNAVAILABLE])
+        assert unpack_statuses(data) == [
+            HTTP_200_OK,
+            HTTP_404_NOT_FOUND,
+            HTTP_503_SERVICE_UNAVAILABLE,
+        ]
+
+    def test_unpack_unregistered_codes(self) -> None:
+        """Return the fallback class for unregistered codes."""
+        data = pack_statuses([599, 1000, 200])
+        assert unpack_statuses(data) == [HTTPStatus, HTTPStatus, HTTP_200_OK]
+
+        class Fallback(HTTPStatus):
+            """Custom fallback class."""
+
+        assert unpack_statuses(data, Fallback)[:2] == [Fallback, Fallback]
+
+    def test_pack_out_of_range_raises(self) -> None:
+        """Reject codes that don't fit in 16 bits."""
+        with pytest.raises(ValueError, match="65535"):
+            pack_statuses([70000])
+        with pytest.raises(ValueError, match="65535"):
+            pack_statuses([-1])
+
+    def test_pack_invalid_type_raises(self) -> None:
+        """Reject values that aren't status values."""
+        with pytest.raises(TypeError):
+            pack_statuses(["404"])  # type: ignore[list-item]
+
+    def test_unpack_invalid_data_raises(self) -> None:
+        """Reject odd-length and non-buffer inputs."""
+        with pytest.raises(ValueError, match="2 bytes"):
+            unpack_statuses(b"\x00")
+        with pytest.raises(TypeError):
+            unpack_statuses([200])  # type: ignore[arg-type]
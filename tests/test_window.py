@@ -0,0 +1,142 @@
+"""Tests for the sliding-window error-rate tracker."""
+
+from __future__ import annotations
+
+import pytest
+
+from response_codes import (
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    ErrorRateWindow,
+    StatusCategory,
+)
+
+
+class FakeClock:
+    """A manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        """Start the clock at `now`."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+class TestErrorRateWindow:
+    """Test counting and expiry in ErrorRateWindow."""
+
+    def test_counts_by_category(self) -> None:
+        """Count ints, classes and instances by category."""
+        window = ErrorRateWindow(clock=FakeClock())
+        window.record(200, 3)
+        window.record(HTTP_404_NOT_FOUND)
+        window.record(HTTP_503_SERVICE_UNAVAILABLE())
+        window.record(999)
+        assert window.total() == 6
+        assert window.category_count(StatusCategory.SUCCESS) == 3
+        assert window.category_counts() == {
+            StatusCategory.UNKNOWN: 1,
+            StatusCategory.INFORMATIONAL: 0,
+            StatusCategory.SUCCESS: 3,
+            StatusCategory.REDIRECTION: 0,
+            StatusCategory.CLIENT_ERROR: 1,
+            StatusCategory.SERVER_ERROR: 1,
+        }
+
+    def test_rates(self) -> None:
+        """Report server-error and overall error rates."""
+        window = ErrorRateWindow(clock=FakeClock())
+        assert window.rate() == 0.0
+        assert window.error_rate() == 0.0
+        window.record(200, 2)
+        window.record(404)
+        window.record(503)
+        assert window.rate() == 0.25
+        assert window.rate(StatusCategory.SUCCESS) == 0.5
+        assert window.error_rate() == 0.5
+
+    def test_counts_expire(self) -> None:
+        """Drop counts once their bucket leaves the window."""
+        clock = FakeClock()
+        window = ErrorRateWindow(10.0, clock=clock)
+        window.record(503)
+        clock.now += 5
+        window.record(200)
+        clock.now += 5
+        assert window.total() == 1
+        assert window.rate() == 0.0
+        clock.now += 5
+        assert window.total() == 0
+
+    def test_long_idle_period(self) -> None:
+        """Expire everything after a gap longer than the window."""
+        clock = FakeClock()
+        window = ErrorRateWindow(10.0, clock=clock)
+        window.record(500, 10)
+        clock.now += 10_000
+        assert window.total() == 0
+        window.record(200)
+        assert window.category_counts()[StatusCategory.SUCCESS] == 1
+
+    def test_granularity(self) -> None:
+        """Expire at the configured bucket resolution."""
+        clock = FakeClock(0.0)
+        window = ErrorRateWindow(1.0, 0.1, clock=clock)
+        window.record(503)
+        clock.now = 0.95
+        window.record(503)
+        assert window.total() == 2
+        clock.now = 1.05
+        assert window.total() == 1
+
+    def test_per_code(self) -> None:
+        """Keep and expire per-code counts when enabled."""
+        clock = FakeClock()
+        window = ErrorRateWindow(2.0, per_code=True, clock=clock)
+        window.record(HTTP_404_NOT_FOUND, 2)
+        clock.now += 1
+        window.record(404)
+        window.record(5000)
+        assert window.code_count(404) == 3
+        assert window.code_count(HTTP_404_NOT_FOUND) == 3
+        assert window.code_count(5000) == 0
+        clock.now += 1
+        assert window.code_count(404) == 1
+
+    def test_per_code_disabled_raises(self) -> None:
+        """Reject per-code queries unless per_code=True."""
+        with pytest.raises(ValueError, match="per_code"):
+            ErrorRateWindow().code_count(404)
+
+    def test_reset(self) -> None:
+        """Discard every count."""
+        window = ErrorRateWindow(per_code=True, clock=FakeClock())
+        window.record(503, 4)
+        window.reset()
+        assert window.total() == 0
+        assert window.code_count(503) == 0
+
+    @pytest.mark.parametrize(("window", "granularity"), [(1, 0), (1, 2)])
+    def test_invalid_shape_raises(
+        self, window: float, granularity: float
+    ) -> None:
+        """Reject non-positive or over-long bucket sizes."""
+        with pytest.raises(ValueError, match="granularity"):
+            ErrorRateWindow(window, granularity)
+
+    def test_invalid_value_raises(self) -> None:
+        """Reject unsupported status values."""
+        with pytest.raises(TypeError):
+            ErrorRateWindow().record("503")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("count", [0, -3])
+    def test_invalid_count_raises(self, count: int) -> None:
+        """Reject counts below one, leaving the window unchanged."""
+        window = ErrorRateWindow(per_code=True, clock=FakeClock())
+        window.record(503, 5)
+        with pytest.raises(ValueError, match="count must be at least 1"):
+            window.record(503, count)
+        assert window.total() == 5
+        assert window.code_count(503) == 5
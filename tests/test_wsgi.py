@@ -0,0 +1,190 @@
+"""Tests for the WSGI status middleware and ``wsgi_status`` attribute."""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+from wsgiref.handlers import SimpleHandler
+from wsgiref.util import setup_testing_defaults
+from wsgiref.validate import validator
+
+import pytest
+
+from response_codes import (
+    HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
+    PROBLEM_JSON_MEDIA_TYPE,
+    HTTPStatus,
+    ProblemRenderer,
+    WSGIStatusMiddleware,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+App = Callable[[dict[str, Any], Callable[..., Any]], "Iterable[bytes]"]
+
+
+def raising(exc: BaseException) -> App:
+    """Return a WSGI app that raises `exc`."""
+
+    def app(
+        environ: dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        raise exc
+
+    return app
+
+
+def ok_app(
+    environ: dict[str, Any], start_response: Callable[..., Any]
+) -> Iterable[bytes]:
+    """Return a plain 200 response."""
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [b"ok"]
+
+
+def serve(app: App) -> tuple[str, dict[str, str], bytes]:
+    """Run a request through wsgiref and parse the raw response."""
+    environ: dict[str, Any] = {"QUERY_STRING": ""}
+    setup_testing_defaults(environ)
+    output = io.BytesIO()
+    handler = SimpleHandler(
+        io.BytesIO(), output, io.StringIO(), environ, multithread=False
+    )
+    handler.run(validator(app))
+    head, _, body = output.getvalue().partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.split(": ", 1) for line in header_lines)
+    return status_line.split(" ", 1)[1], headers, body
+
+
+class TestWsgiStatus:
+    """Test the ``wsgi_status`` class attribute."""
+
+    @pytest.mark.parametrize(
+        ("status_class", "expected"),
+        [
+            (HTTP_200_OK, "200 OK"),
+            (HTTP_404_NOT_FOUND, "404 Not Found"),
+            (HTTP_503_SERVICE_UNAVAILABLE, "503 Service Unavailable"),
+        ],
+    )
+    def test_status_string(
+        self, status_class: type[HTTPStatus], expected: str
+    ) -> None:
+        """Format the code and reason phrase as WSGI expects."""
+        assert status_class.wsgi_status == expected
+        assert status_class().wsgi_status == expected
+
+    def test_interned(self) -> None:
+        """Intern the string when the class is created."""
+        code = 404
+        assert HTTP_404_NOT_FOUND.wsgi_status is sys.intern(f"{code} Not Found")
+
+    def test_custom_class(self) -> None:
+        """Build the string for user-defined subclasses too."""
+
+        class Teapot(HTTP_404_NOT_FOUND):
+            """Subclass with its own code and message."""
+
+            status_code = 418
+            message = "I'm a teapot"
+
+        assert Teapot.wsgi_status == "418 I'm a teapot"
+
+
+class TestWSGIStatusMiddleware:
+    """Test translating raised statuses into WSGI responses."""
+
+    def test_success_passes_through(self) -> None:
+        """Return the application's own response untouched."""
+        status, headers, body = serve(WSGIStatusMiddleware(ok_app))
+        assert status == "200 OK"
+        assert headers["Content-Type"] == "text/plain"
+        assert body == b"ok"
+
+    def test_status_becomes_response(self) -> None:
+        """Return the raised status with a JSON body."""
+        app = WSGIStatusMiddleware(raising(HTTP_404_NOT_FOUND()))
+        status, headers, body = serve(app)
+        assert status == "404 Not Found"
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Content-Length"] == str(len(body))
+        assert json.loads(body) == {"error_code": 404, "message": "Not Found"}
+
+    def test_detail_in_body(self) -> None:
+        """Include the exception's detail in the body."""
+        app = WSGIStatusMiddleware(raising(HTTP_404_NOT_FOUND("no user")))
+        _, _, body = serve(app)
+        assert json.loads(body)["detail"] == "no user"
+
+    def test_responses_cached_per_class(self) -> None:
+        """Reuse the cached response for exceptions without detail."""
+        middleware = WSGIStatusMiddleware(ok_app)
+        first = middleware.response(HTTP_503_SERVICE_UNAVAILABLE())
+        assert middleware.response(HTTP_503_SERVICE_UNAVAILABLE()) is first
+        assert first[0] is HTTP_503_SERVICE_UNAVAILABLE.wsgi_status
+        detailed = middleware.response(HTTP_503_SERVICE_UNAVAILABLE("busy"))
+        assert detailed is not first
+
+    def test_repeated_requests(self) -> None:
+        """Serve the cached response more than once unchanged."""
+        app = WSGIStatusMiddleware(raising(HTTP_404_NOT_FOUND()))
+        assert serve(app) == serve(app)
+
+    def test_replaces_headers_set_before_raising(self) -> None:
+        """Replace headers the application set before raising."""
+
+        def app(
+            environ: dict[str, Any], start_response: Callable[..., Any]
+        ) -> Iterable[bytes]:
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            raise HTTP_503_SERVICE_UNAVAILABLE
+
+        status, headers, _ = serve(WSGIStatusMiddleware(app))
+        assert status == "503 Service Unavailable"
+        assert headers["Content-Type"] == "application/json"
+
+    def test_problem_details(self) -> None:
+        """Render Problem Details bodies when a renderer is given."""
+        app = WSGIStatusMiddleware(
+            raising(HTTP_404_NOT_FOUND("gone")),
+            problem_renderer=ProblemRenderer(),
+        )
+        _, headers, body = serve(app)
+        assert headers["Content-Type"] == PROBLEM_JSON_MEDIA_TYPE
+        assert json.loads(body)["detail"] == "gone"
+
+    def test_extra_headers(self) -> None:
+        """Add the configured headers to every error response."""
+        app = WSGIStatusMiddleware(
+            raising(HTTP_404_NOT_FOUND()),
+            headers=[("Cache-Control", "no-store")],
+        )
+        _, headers, _ = serve(app)
+        assert headers["Cache-Control"] == "no-store"
+
+    def test_no_body_statuses(self) -> None:
+        """Return 304 Not Modified without a body."""
+        app = WSGIStatusMiddleware(raising(HTTP_304_NOT_MODIFIED()))
+        status, headers, body = serve(app)
+        assert status == "304 Not Modified"
+        assert "Content-Type" not in headers
+        assert body == b""
+
+    def test_invalid_code_is_server_error(self) -> None:
+        """Return 500 for exceptions without a valid status code."""
+        status, _, body = serve(WSGIStatusMiddleware(raising(HTTPStatus())))
+        assert status == "500 Internal Server Error"
+        assert json.loads(body)["error_code"] == 500
+
+    def test_other_exceptions_propagate(self) -> None:
+        """Leave exceptions that are not statuses to the server."""
+        app = WSGIStatusMiddleware(raising(KeyError()))
+        with pytest.raises(KeyError):
+            app({}, lambda *_: io.BytesIO().write)